@@ -0,0 +1,107 @@
+"""Задержка commit служебной транзакции outbox: `FULL` против `RELAXED`.
+
+Для каждого режима скрипт создаёт `--commits` outbox-событий, затем
+последовательно помечает их обработанными — по одной транзакции
+`set_durability` → `mark_processed` → `commit`, как это делает
+`CreateOrderUseCase` после публикации, — и печатает среднюю задержку и
+перцентили одной транзакции. Созданные события удаляются в конце.
+
+Разница определяется временем fsync WAL на машине с БД: на дисках с
+дорогим fsync она больше, при `fsync = off` её нет. Подключение берётся из
+настроек приложения (`POSTGRES_*`).
+
+Запуск: `PYTHONPATH=src python benchmarks/commit_durability.py [--commits N]`.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from loguru import logger
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from application.interfaces.uow import Durability
+from config import Settings
+from domain.entities.outbox_event import OutboxEvent
+from infra.db.models import OutboxEventModel
+from infra.db.repositories import (
+    OrderRepositorySQLAlchemy,
+    OutboxRepositorySQLAlchemy,
+    UserRepositorySQLAlchemy,
+)
+from infra.db.session import create_engine, get_session_factory
+from infra.db.uow import UnitOfWorkSQLAlchemy
+
+
+async def _commit_latencies(
+    factory: async_sessionmaker[AsyncSession],
+    durability: Durability,
+    commits: int,
+) -> list[float]:
+    """Возвращает задержки (мс) транзакций с отметкой о публикации."""
+    events = [
+        OutboxEvent(event_type="bench_durability", payload={})
+        for _ in range(commits)
+    ]
+    async with factory() as session, session.begin():
+        await OutboxRepositorySQLAlchemy(session=session).add_many(events)
+
+    latencies: list[float] = []
+    async with factory() as session:
+        uow = UnitOfWorkSQLAlchemy(
+            session=session,
+            user_repo=UserRepositorySQLAlchemy(session=session),
+            order_repo=OrderRepositorySQLAlchemy(session=session),
+            outbox_repo=OutboxRepositorySQLAlchemy(session=session),
+        )
+        for event in events:
+            started = time.perf_counter()
+            async with uow:
+                await uow.set_durability(durability)
+                await uow.outbox_repo.mark_processed(event.id)
+                await uow.commit()
+            latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+async def _run(commits: int) -> None:
+    """Выполняет замеры для обоих режимов и удаляет созданные события."""
+    engine = create_engine(str(Settings().database.database_url))
+    factory = get_session_factory(engine)
+    try:
+        print(
+            f"{'режим':<10} {'среднее, мс':>12} {'p50, мс':>10} "
+            f"{'p99, мс':>10} {'commit/с':>10}"
+        )
+        for durability in (Durability.FULL, Durability.RELAXED):
+            latencies = await _commit_latencies(factory, durability, commits)
+            percentiles = statistics.quantiles(latencies, n=100)
+            mean = statistics.fmean(latencies)
+            print(
+                f"{durability.value:<10} {mean:>12.3f} {percentiles[49]:>10.3f} "
+                f"{percentiles[98]:>10.3f} {1000 / mean:>10,.0f}"
+            )
+        print(f"\nтранзакций на режим={commits}")
+    finally:
+        async with factory() as session, session.begin():
+            await session.execute(
+                delete(OutboxEventModel).where(
+                    OutboxEventModel.event_type == "bench_durability"
+                )
+            )
+        await engine.dispose()
+
+
+def main() -> None:
+    """Разбирает аргументы и запускает замеры."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--commits", type=int, default=2_000)
+    args = parser.parse_args()
+    logger.remove()
+    asyncio.run(_run(args.commits))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Сравнение стоимости проверки JWT на один запрос.
+
+Сравниваются:
+- `python-jose` (`jwt.decode`, прежняя реализация `TokenService`), если
+  пакет установлен (в зависимости проекта он больше не входит);
+- `TokenService` без кеша (подготовленные ключи, проверка подписи каждый раз);
+- `TokenService` с LRU-кешем (повторная проверка того же токена).
+
+Запуск: `PYTHONPATH=src python benchmarks/jwt_verify.py [--number N]`.
+"""
+
+import argparse
+import importlib
+import timeit
+from collections.abc import Callable
+from datetime import timedelta
+from functools import partial
+from types import ModuleType
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+
+from application.services import JWTKeyring, TokenService
+from application.services.jwt_keys import EdDSAKey, ES256Key, HMACKey, JWTKey
+
+_SECRET = "benchmark-secret"
+_TTL = timedelta(minutes=5)
+
+
+def _measure(number: int, func: Callable[[], object]) -> float:
+    """Возвращает среднее время одного вызова в микросекундах."""
+    func()
+    return timeit.timeit(func, number=number) / number * 1_000_000
+
+
+def _jose_jwt() -> ModuleType | None:
+    """Возвращает модуль `jose.jwt` или `None`, если пакет не установлен."""
+    try:
+        return importlib.import_module("jose.jwt")
+    except ImportError:
+        return None
+
+
+def _service(key: JWTKey, *, cache_size: int) -> TokenService:
+    """Создаёт `TokenService` с единственным ключом."""
+    keyring = JWTKeyring(keys={key.kid: key}, active_kid=key.kid)
+    return TokenService(
+        keyring=keyring, expires_delta=_TTL, cache_size=cache_size
+    )
+
+
+def main() -> None:
+    """Запускает замеры и печатает таблицу результатов."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=20_000)
+    number = parser.parse_args().number
+    jose_jwt = _jose_jwt()
+
+    ec_private = ec.generate_private_key(ec.SECP256R1())
+    ed_private = ed25519.Ed25519PrivateKey.generate()
+    keys: dict[str, JWTKey] = {
+        "HS256": HMACKey(kid="hs", algorithm="HS256", secret=_SECRET.encode()),
+        "ES256": ES256Key(
+            kid="ec", public_key=ec_private.public_key(), private_key=ec_private
+        ),
+        "EdDSA": EdDSAKey(
+            kid="ed", public_key=ed_private.public_key(), private_key=ed_private
+        ),
+    }
+    jose_keys: dict[str, str] = {
+        "HS256": _SECRET,
+        "ES256": ec_private.public_key()
+        .public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        .decode(),
+    }
+
+    print(f"{'алгоритм':<8} {'реализация':<28} {'мкс/проверка':>14}")
+    for algorithm, key in keys.items():
+        cold = _service(key, cache_size=0)
+        warm = _service(key, cache_size=10_000)
+        token = cold.create_access_token(user_id=1, email="bench@example.com")
+        access_token = token.access_token
+
+        rows: list[tuple[str, float]] = []
+        jose_key = jose_keys.get(algorithm)
+        if jose_jwt is not None and jose_key is not None:
+            rows.append(
+                (
+                    "python-jose",
+                    _measure(
+                        number,
+                        partial(
+                            jose_jwt.decode,
+                            access_token,
+                            jose_key,
+                            algorithms=[algorithm],
+                        ),
+                    ),
+                )
+            )
+        rows.append(
+            (
+                "TokenService (без кеша)",
+                _measure(number, partial(cold.decode_token, access_token)),
+            )
+        )
+        rows.append(
+            (
+                "TokenService (LRU-кеш)",
+                _measure(number, partial(warm.decode_token, access_token)),
+            )
+        )
+        for name, micros in rows:
+            print(f"{algorithm:<8} {name:<28} {micros:>14.2f}")
+
+    if jose_jwt is None:
+        print("\npython-jose не установлен: pip install python-jose")
+    print(f"\nN={number}")
+
+
+if __name__ == "__main__":
+    main()
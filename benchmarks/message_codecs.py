@@ -0,0 +1,102 @@
+"""Пропускная способность кодеков сообщений брокера на одно ядро.
+
+Для события `new_order` (схема версии 2 со снимком заказа) замеряются:
+- кодирование payload в тело сообщения;
+- декодирование тела;
+- декодирование с проверкой схемой `NEW_ORDER_EVENT_SCHEMA` (путь консьюмера).
+
+Сравниваются прежний путь (`json.dumps`, разбор JSON в словарь и его
+проверка), кодек JSON (проверка сразу из байтов) и MessagePack. Замер
+однопоточный, поэтому результат — сообщений в секунду на ядро.
+
+Запуск: `PYTHONPATH=src python benchmarks/message_codecs.py [--number N]`.
+"""
+
+import argparse
+import json
+import timeit
+from collections.abc import Callable
+from decimal import Decimal
+from functools import partial
+from typing import Any
+
+from application.events import new_order_event
+from domain.entities.order import Order
+from infra.broker.codecs import JSON_CODEC, MSGPACK_CODEC, MessageCodec
+from infra.broker.schemas import NEW_ORDER_EVENT_SCHEMA
+
+
+def _rate(number: int, func: Callable[[], object]) -> float:
+    """Возвращает число вызовов в секунду."""
+    func()
+    return number / timeit.timeit(func, number=number)
+
+
+def _legacy_codec() -> MessageCodec:
+    """Кодек прежней реализации: `json.dumps` и разбор в словарь."""
+    return MessageCodec(
+        content_type="application/json (dict)",
+        encode=lambda payload: json.dumps(payload).encode("utf-8"),
+        decode=json.loads,
+    )
+
+
+def _legacy_validate(body: bytes) -> object:
+    """Проверяет сообщение прежним путём: разбор в словарь, затем схема."""
+    return NEW_ORDER_EVENT_SCHEMA.validate_python(json.loads(body))
+
+
+def _payload() -> dict[str, Any]:
+    """Возвращает payload события `new_order` для заказа из трёх товаров."""
+    order = Order(
+        user_id=42,
+        items=[
+            {"name": "Ноутбук", "price": 89_990.0, "quantity": 1},
+            {"name": "Мышь беспроводная", "price": 1_490.0, "quantity": 2},
+            {"name": "Чехол", "price": 2_300.0, "quantity": 1},
+        ],
+        total_price=Decimal("95270.00"),
+    )
+    return new_order_event(order).payload
+
+
+def main() -> None:
+    """Запускает замеры и печатает таблицу результатов."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=200_000)
+    number = parser.parse_args().number
+
+    payload = _payload()
+    codecs: list[tuple[str, MessageCodec, Callable[[bytes], object]]] = [
+        ("json (прежний путь)", _legacy_codec(), _legacy_validate),
+        (
+            "json",
+            JSON_CODEC,
+            partial(JSON_CODEC.validate, NEW_ORDER_EVENT_SCHEMA),
+        ),
+        (
+            "msgpack",
+            MSGPACK_CODEC,
+            partial(MSGPACK_CODEC.validate, NEW_ORDER_EVENT_SCHEMA),
+        ),
+    ]
+
+    print(
+        f"{'кодек':<20} {'байт':>6} {'кодирование/с':>15} "
+        f"{'декодирование/с':>17} {'+ проверка/с':>14}"
+    )
+    for name, codec, validate in codecs:
+        body = codec.encode(payload)
+        encode_rate = _rate(number, partial(codec.encode, payload))
+        decode_rate = _rate(number, partial(codec.decode, body))
+        validate_rate = _rate(number, partial(validate, body))
+        print(
+            f"{name:<20} {len(body):>6} {encode_rate:>15,.0f} "
+            f"{decode_rate:>17,.0f} {validate_rate:>14,.0f}"
+        )
+
+    print(f"\nN={number}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Пропускная способность списка заказов: ORM-сущности против Core-кортежей.
+
+Сравниваются:
+- прежний путь: `select(OrderModel)` → ORM-объекты в identity map → `Order(...)`
+  с проверкой инвариантов;
+- `OrderRepositorySQLAlchemy.list_by_user`: `select(*columns)` → `.tuples()` →
+  `Order.restore` без повторных проверок.
+
+Скрипт создаёт временного пользователя с `--orders` заказами внутри транзакции
+и откатывает её в конце, поэтому БД остаётся без изменений. Подключение берётся
+из настроек приложения (`POSTGRES_*`).
+
+Запуск: `PYTHONPATH=src python benchmarks/order_list_query.py [--orders 10000]`.
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from decimal import Decimal
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import Settings
+from domain.entities.order import Order
+from domain.value_objects.order_status import OrderStatus
+from infra.db.models import OrderModel, UserModel
+from infra.db.repositories import OrderRepositorySQLAlchemy
+from infra.db.session import create_engine, get_session_factory
+
+
+async def _orm_list(session: AsyncSession, user_id: int) -> list[Order]:
+    """Прежняя реализация списка: ORM-модели и конструктор `Order`."""
+    result = await session.execute(
+        select(OrderModel)
+        .where(OrderModel.user_id == user_id)
+        .order_by(OrderModel.created_at.desc(), OrderModel.id.desc())
+    )
+    orders = [
+        Order(
+            id=model.id,
+            user_id=model.user_id,
+            items=model.items if isinstance(model.items, list) else [],
+            total_price=Decimal(str(model.total_price)),
+            status=OrderStatus(model.status),
+            created_at=model.created_at,
+            updated_at=model.updated_at,
+            version=model.version,
+        )
+        for model in result.scalars().all()
+    ]
+    session.expunge_all()
+    return orders
+
+
+async def _rows_per_second(
+    func: Callable[[], Awaitable[list[Order]]], repeat: int
+) -> float:
+    """Возвращает лучшую пропускную способность (строк/с) из `repeat` прогонов."""
+    await func()
+    best = 0.0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        rows = len(await func())
+        best = max(best, rows / (time.perf_counter() - started))
+    return best
+
+
+async def _run(orders_count: int, repeat: int) -> None:
+    """Заполняет временные данные, выполняет замеры и откатывает транзакцию."""
+    engine = create_engine(str(Settings().database.database_url))
+    try:
+        async with get_session_factory(engine)() as session:
+            user_id = await session.scalar(
+                insert(UserModel)
+                .values(
+                    email=f"bench-{uuid.uuid4().hex}@example.com",
+                    hashed_password="-",
+                )
+                .returning(UserModel.id)
+            )
+            assert user_id is not None
+            now = datetime.now(UTC)
+            await session.execute(
+                insert(OrderModel),
+                [
+                    {
+                        "id": uuid.uuid4(),
+                        "user_id": user_id,
+                        "items": [{"name": f"item-{i}", "price": 1.5}],
+                        "total_price": Decimal("10.50"),
+                        "status": OrderStatus.PENDING,
+                        "created_at": now,
+                        "updated_at": now,
+                        "version": 1,
+                    }
+                    for i in range(orders_count)
+                ],
+            )
+            repo = OrderRepositorySQLAlchemy(session=session)
+
+            print(f"{'реализация':<36} {'строк/с':>12}")
+            orm = await _rows_per_second(
+                lambda: _orm_list(session, user_id), repeat
+            )
+            print(f"{'ORM (select(OrderModel) + Order)':<36} {orm:>12,.0f}")
+            core = await _rows_per_second(
+                lambda: repo.list_by_user(user_id), repeat
+            )
+            print(f"{'Core (.tuples() + Order.restore)':<36} {core:>12,.0f}")
+            print(f"\nзаказов={orders_count}, прогонов={repeat}")
+            await session.rollback()
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    """Разбирает аргументы и запускает замеры."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(_run(args.orders, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
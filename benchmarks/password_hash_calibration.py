@@ -0,0 +1,102 @@
+"""Калибровка стоимости хеширования паролей на текущей машине.
+
+Для каждой доступной схемы (`pbkdf2_sha256`, `argon2` при установленном
+`argon2-cffi`) измеряется время хеширования на базовой стоимости, затем
+стоимость линейно пересчитывается под целевую задержку входа и замеряется
+повторно. В конце печатаются значения переменных окружения для `.env`.
+
+Запуск:
+`PYTHONPATH=src python benchmarks/password_hash_calibration.py [--target-ms 250]`.
+"""
+
+import argparse
+import math
+import statistics
+import time
+from dataclasses import replace
+
+from passlib.hash import argon2
+
+from application.services import PasswordHasher, PasswordHashProfile
+
+_PASSWORD = "calibration-password"
+
+
+def _hash_ms(profile: PasswordHashProfile, repeat: int) -> float:
+    """Возвращает медианное время хеширования пароля в миллисекундах."""
+    hasher = PasswordHasher(profile)
+    hasher.hash(_PASSWORD)
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        hasher.hash(_PASSWORD)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def _calibrate_pbkdf2(target_ms: float, repeat: int) -> PasswordHashProfile:
+    """Подбирает число итераций PBKDF2-SHA256 под целевую задержку."""
+    base = PasswordHashProfile(scheme="pbkdf2_sha256")
+    base_ms = _hash_ms(base, repeat)
+    rounds = max(1_000, math.ceil(base.pbkdf2_rounds * target_ms / base_ms))
+    _print_row(base, f"rounds={base.pbkdf2_rounds}", base_ms)
+    return replace(base, pbkdf2_rounds=rounds)
+
+
+def _calibrate_argon2(target_ms: float, repeat: int) -> PasswordHashProfile:
+    """Подбирает число проходов Argon2 под целевую задержку (память фиксирована)."""
+    base = PasswordHashProfile(scheme="argon2")
+    base_ms = _hash_ms(base, repeat)
+    time_cost = max(1, round(base.argon2_time_cost * target_ms / base_ms))
+    _print_row(base, _argon2_cost(base), base_ms)
+    return replace(base, argon2_time_cost=time_cost)
+
+
+def _argon2_cost(profile: PasswordHashProfile) -> str:
+    """Форматирует параметры Argon2 для таблицы."""
+    return (
+        f"t={profile.argon2_time_cost} m={profile.argon2_memory_cost} "
+        f"p={profile.argon2_parallelism}"
+    )
+
+
+def _print_row(profile: PasswordHashProfile, cost: str, millis: float) -> None:
+    """Печатает строку таблицы результатов."""
+    print(f"{profile.scheme:<14} {cost:<28} {millis:>10.1f}")
+
+
+def main() -> None:
+    """Запускает калибровку и печатает рекомендуемые настройки."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--target-ms", type=float, default=250.0)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'схема':<14} {'стоимость':<28} {'мс/хеш':>10}")
+    recommended: list[tuple[PasswordHashProfile, dict[str, int]]] = []
+
+    pbkdf2 = _calibrate_pbkdf2(args.target_ms, args.repeat)
+    _print_row(
+        pbkdf2, f"rounds={pbkdf2.pbkdf2_rounds}", _hash_ms(pbkdf2, args.repeat)
+    )
+    recommended.append((pbkdf2, {"PASSWORD_PBKDF2_ROUNDS": pbkdf2.pbkdf2_rounds}))
+
+    if argon2.has_backend():
+        tuned = _calibrate_argon2(args.target_ms, args.repeat)
+        _print_row(tuned, _argon2_cost(tuned), _hash_ms(tuned, args.repeat))
+        recommended.append(
+            (tuned, {"PASSWORD_ARGON2_TIME_COST": tuned.argon2_time_cost})
+        )
+    else:
+        print("argon2         пропущено: не установлен argon2-cffi")
+
+    print(f"\nЦелевая задержка: {args.target_ms:.0f} мс. Настройки для .env:")
+    for profile, env in recommended:
+        print(f"\n# {profile.scheme}")
+        print(f"PASSWORD_HASH_SCHEME={profile.scheme}")
+        for name, value in env.items():
+            print(f"{name}={value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Запросов в секунду на один воркер для запросов репозитория.
+
+Сравниваются:
+- запрос, собираемый на каждый вызов (`select(...).where(col == value)`,
+  как было до выноса запросов на уровень модуля);
+- `OrderRepositorySQLAlchemy.get_by_id` (выражение уровня модуля с `bindparam`)
+  без кеша подготовленных выражений asyncpg (`prepared_statement_cache_size=0`);
+- то же с кешем подготовленных выражений (значение по умолчанию).
+
+Запросы выполняются последовательно в одном event loop по несуществующим
+идентификаторам, поэтому скрипт ничего не пишет в БД. Подключение берётся из
+настроек приложения (`POSTGRES_*`).
+
+Запуск: `PYTHONPATH=src python benchmarks/repository_queries.py [--queries N]`.
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import Settings
+from infra.db.models import OrderModel
+from infra.db.repositories import OrderRepositorySQLAlchemy
+from infra.db.session import create_engine, get_session_factory
+
+
+async def _inline_get_by_id(session: AsyncSession, order_id: uuid.UUID) -> object:
+    """Выполняет запрос заказа, собирая выражение на каждый вызов."""
+    result = await session.execute(
+        select(
+            OrderModel.id,
+            OrderModel.user_id,
+            OrderModel.items,
+            OrderModel.total_price,
+            OrderModel.status,
+            OrderModel.created_at,
+            OrderModel.updated_at,
+            OrderModel.version,
+        ).where(OrderModel.id == order_id)
+    )
+    return result.tuples().one_or_none()
+
+
+async def _queries_per_second(
+    query: Callable[[AsyncSession, uuid.UUID], Awaitable[object]],
+    *,
+    cache_size: int,
+    queries: int,
+) -> float:
+    """Возвращает число запросов в секунду для заданного способа выполнения."""
+    settings = Settings()
+    engine = create_engine(
+        settings.database_url, prepared_statement_cache_size=cache_size
+    )
+    ids = [uuid.uuid4() for _ in range(queries)]
+    try:
+        async with get_session_factory(engine)() as session:
+            for order_id in ids[:100]:
+                await query(session, order_id)
+            started = time.perf_counter()
+            for order_id in ids:
+                await query(session, order_id)
+            return queries / (time.perf_counter() - started)
+    finally:
+        await engine.dispose()
+
+
+async def _repository_get_by_id(
+    session: AsyncSession, order_id: uuid.UUID
+) -> object:
+    """Выполняет запрос заказа через репозиторий."""
+    return await OrderRepositorySQLAlchemy(session=session).get_by_id(order_id)
+
+
+async def _run(queries: int) -> None:
+    """Выполняет замеры и печатает таблицу результатов."""
+    cases: list[
+        tuple[str, Callable[[AsyncSession, uuid.UUID], Awaitable[object]], int]
+    ] = [
+        ("запрос на вызов, кеш asyncpg", _inline_get_by_id, 100),
+        ("уровень модуля, без кеша asyncpg", _repository_get_by_id, 0),
+        ("уровень модуля, кеш asyncpg", _repository_get_by_id, 100),
+    ]
+    print(f"{'реализация':<36} {'запросов/с':>12}")
+    for name, query, cache_size in cases:
+        qps = await _queries_per_second(
+            query, cache_size=cache_size, queries=queries
+        )
+        print(f"{name:<36} {qps:>12,.0f}")
+    print(f"\nзапросов={queries}")
+
+
+def main() -> None:
+    """Разбирает аргументы и запускает замеры."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--queries", type=int, default=5_000)
+    args = parser.parse_args()
+    asyncio.run(_run(args.queries))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Пропускная способность HTTP-сервера в разных режимах запуска.
+
+Сравниваются конфигурации `python -m server`:
+- gunicorn + UvicornWorker, 1 воркер (прежний запуск из Dockerfile);
+- gunicorn + UvicornWorker, `--workers` воркеров (по умолчанию — число CPU);
+- granian (ASGI), `--workers` воркеров.
+
+Для каждой конфигурации сервер запускается отдельным процессом, после чего
+`--concurrency` клиентов в течение `--duration` секунд отправляют GET-запросы
+к `--path`. Нужны запущенные БД и Redis (их использует lifespan приложения);
+генератор нагрузки работает на той же машине и делит с сервером CPU, поэтому
+результаты сравнимы только между собой.
+
+Запуск: `PYTHONPATH=src python benchmarks/serving_throughput.py [--path /docs]`.
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+import httpx
+
+from config.server import available_cpus
+
+
+async def _wait_ready(url: str) -> None:
+    """Ожидает (до 30 с), пока сервер начнёт отвечать."""
+    async with asyncio.timeout(30), httpx.AsyncClient() as client:
+        while True:
+            try:
+                await client.get(url)
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.2)
+
+
+async def _load(
+    url: str, *, concurrency: int, duration: float
+) -> tuple[int, int]:
+    """Создаёт нагрузку и возвращает число успешных и неуспешных запросов."""
+    deadline = time.monotonic() + duration
+    done = 0
+    failed = 0
+
+    async def client_loop(client: httpx.AsyncClient) -> None:
+        nonlocal done, failed
+        while time.monotonic() < deadline:
+            try:
+                await client.get(url)
+                done += 1
+            except httpx.TransportError:
+                failed += 1
+
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits) as client:
+        await asyncio.gather(*(client_loop(client) for _ in range(concurrency)))
+    return done, failed
+
+
+def _run_case(name: str, env: dict[str, str], args: argparse.Namespace) -> None:
+    """Запускает сервер с заданным окружением и печатает результат замера."""
+    url = f"http://127.0.0.1:{args.port}{args.path}"
+    process = subprocess.Popen(
+        [sys.executable, "-m", "server"],
+        env={
+            **os.environ,
+            "SERVER_HOST": "127.0.0.1",
+            "SERVER_PORT": str(args.port),
+            "SERVER_ACCESS_LOG": "false",
+            **env,
+        },
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        asyncio.run(_wait_ready(url))
+        done, failed = asyncio.run(
+            _load(url, concurrency=args.concurrency, duration=args.duration)
+        )
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+    print(f"{name:<34} {done / args.duration:>12,.0f} {failed:>8}")
+
+
+def main() -> None:
+    """Разбирает аргументы и выполняет замеры для всех конфигураций."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--path", default="/docs")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--workers", type=int, default=available_cpus())
+    args = parser.parse_args()
+
+    workers = str(args.workers)
+    cases = [
+        ("gunicorn+uvicorn, 1 воркер", {"WEB_CONCURRENCY": "1"}),
+        (
+            f"gunicorn+uvicorn, {workers} воркер(ов)",
+            {"WEB_CONCURRENCY": workers},
+        ),
+        (
+            f"granian, {workers} воркер(ов)",
+            {"SERVER_RUNTIME": "granian", "WEB_CONCURRENCY": workers},
+        ),
+    ]
+    print(f"{'конфигурация':<34} {'запросов/с':>12} {'ошибок':>8}")
+    for name, env in cases:
+        _run_case(name, env, args)
+    print(
+        f"\nпуть={args.path}, клиентов={args.concurrency}, "
+        f"длительность={args.duration:.0f} с"
+    )
+
+
+if __name__ == "__main__":
+    main()
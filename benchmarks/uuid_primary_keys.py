@@ -0,0 +1,122 @@
+"""Вставка по первичному ключу UUID: случайный UUIDv4 против UUIDv7.
+
+Для каждого генератора скрипт создаёт таблицу `bench_ids_<генератор>`
+(`id uuid PRIMARY KEY` и полезная нагрузка, как у `outbox_events`), вставляет
+`--rows` строк пачками по `--batch` через COPY и печатает:
+- скорость вставки (учитывается только время COPY, генерация идентификаторов
+  в замер не входит);
+- объём WAL, записанный во время вставки;
+- размер индекса первичного ключа и таблицы.
+
+Таблицы удаляются в конце (если не передан `--keep`). Подключение берётся из
+настроек приложения (`POSTGRES_*`). Для 10 млн строк нужно несколько ГБ
+свободного места и десятки минут.
+
+Запуск: `PYTHONPATH=src python benchmarks/uuid_primary_keys.py [--rows N]`.
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from config import Settings
+from domain.identifiers import uuid7
+from infra.db.session import create_engine
+
+
+async def _driver_connection(connection: AsyncConnection) -> Any:
+    """Возвращает подключение asyncpg, лежащее под подключением SQLAlchemy."""
+    raw = await connection.get_raw_connection()
+    return raw.driver_connection
+
+
+def _size(value: int) -> str:
+    """Форматирует размер в мегабайтах."""
+    return f"{value / 1024 / 1024:,.1f} МБ"
+
+
+async def _measure(
+    driver: Any,
+    name: str,
+    generator: Callable[[], uuid.UUID],
+    *,
+    rows: int,
+    batch: int,
+    keep: bool,
+) -> None:
+    """Заполняет таблицу идентификаторами генератора и печатает результат."""
+    table = f"bench_ids_{name}"
+    await driver.execute(f"DROP TABLE IF EXISTS {table}")
+    await driver.execute(
+        f"CREATE TABLE {table} ("
+        "id uuid PRIMARY KEY, "
+        "event_type varchar(100) NOT NULL, "
+        "created_at timestamptz NOT NULL DEFAULT now())"
+    )
+    try:
+        wal_start = await driver.fetchval("SELECT pg_current_wal_lsn()")
+        elapsed = 0.0
+        inserted = 0
+        while inserted < rows:
+            size = min(batch, rows - inserted)
+            records = [(generator(), "new_order") for _ in range(size)]
+            started = time.perf_counter()
+            await driver.copy_records_to_table(
+                table, records=records, columns=("id", "event_type")
+            )
+            elapsed += time.perf_counter() - started
+            inserted += size
+        wal_bytes = await driver.fetchval(
+            "SELECT pg_wal_lsn_diff(pg_current_wal_lsn(), $1)", wal_start
+        )
+        index_bytes = await driver.fetchval(
+            "SELECT pg_relation_size($1::regclass)", f"{table}_pkey"
+        )
+        table_bytes = await driver.fetchval(
+            "SELECT pg_relation_size($1::regclass)", table
+        )
+        print(
+            f"{name:<8} {rows / elapsed:>12,.0f} {_size(int(wal_bytes)):>14} "
+            f"{_size(index_bytes):>14} {_size(table_bytes):>14}"
+        )
+    finally:
+        if not keep:
+            await driver.execute(f"DROP TABLE IF EXISTS {table}")
+
+
+async def _run(rows: int, batch: int, keep: bool) -> None:
+    """Выполняет замеры для обоих генераторов."""
+    engine = create_engine(str(Settings().database.database_url))
+    try:
+        async with engine.connect() as connection:
+            driver = await _driver_connection(connection)
+            print(
+                f"{'ключ':<8} {'строк/с':>12} {'WAL':>14} "
+                f"{'индекс PK':>14} {'таблица':>14}"
+            )
+            for name, generator in (("uuid4", uuid.uuid4), ("uuid7", uuid7)):
+                await _measure(
+                    driver, name, generator, rows=rows, batch=batch, keep=keep
+                )
+            print(f"\nстрок={rows:,}, пачка={batch:,}")
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    """Разбирает аргументы и запускает замеры."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--batch", type=int, default=10_000)
+    parser.add_argument("--keep", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(_run(args.rows, args.batch, args.keep))
+
+
+if __name__ == "__main__":
+    main()
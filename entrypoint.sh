@@ -1,7 +1,7 @@
 #!/bin/bash
 set -e
 
-if [ "$1" = "python3" ] && [[ "$*" == *"gunicorn"* ]]; then
+if [ "$1" = "python3" ] && [[ "$*" == *"gunicorn"* || "$*" == *"-m server"* ]]; then
     echo "Running database migrations..."
     cd /app
     . .venv/bin/activate
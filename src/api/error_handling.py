@@ -11,6 +11,9 @@ from application.exceptions import (
     ApplicationError,
     InvalidCredentialsError,
     OrderNotFoundError,
+    OrderVersionConflictError,
+    SessionStoreUnavailableError,
+    TooManyLoginAttemptsError,
     UnauthorizedError,
     UserAlreadyExistsError,
 )
@@ -60,6 +63,43 @@ def setup_exception_handlers(app: FastAPI) -> None:
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    @app.exception_handler(TooManyLoginAttemptsError)
+    async def too_many_login_attempts_handler(
+        _: Request, exc: TooManyLoginAttemptsError
+    ) -> JSONResponse:
+        """Обработчик временной блокировки входа.
+
+        Args:
+            _: HTTP-запрос (не используется).
+            exc: Исключение домена/приложения.
+
+        Returns:
+            JSONResponse: Ответ с HTTP 429 и заголовком `Retry-After`.
+        """
+        return JSONResponse(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            content={"detail": str(exc)},
+            headers={"Retry-After": str(exc.retry_after)},
+        )
+
+    @app.exception_handler(SessionStoreUnavailableError)
+    async def session_store_unavailable_handler(
+        _: Request, exc: SessionStoreUnavailableError
+    ) -> JSONResponse:
+        """Обработчик недоступности хранилища сессий.
+
+        Args:
+            _: HTTP-запрос (не используется).
+            exc: Исключение домена/приложения.
+
+        Returns:
+            JSONResponse: Ответ с HTTP 503 и текстом ошибки.
+        """
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"detail": str(exc)},
+        )
+
     @app.exception_handler(OrderNotFoundError)
     async def order_not_found_handler(
         _: Request, exc: OrderNotFoundError
@@ -77,6 +117,27 @@ def setup_exception_handlers(app: FastAPI) -> None:
             status_code=status.HTTP_404_NOT_FOUND, content={"detail": str(exc)}
         )
 
+    @app.exception_handler(OrderVersionConflictError)
+    async def order_version_conflict_handler(
+        _: Request, exc: OrderVersionConflictError
+    ) -> JSONResponse:
+        """Обработчик конфликта версий при параллельном изменении заказа.
+
+        Ожидаемая версия приходит только из `If-Match`, поэтому конфликт версий
+        означает невыполненное условие запроса (RFC 9110, 13.1.1), а не `409`.
+
+        Args:
+            _: HTTP-запрос (не используется).
+            exc: Исключение домена/приложения.
+
+        Returns:
+            JSONResponse: Ответ с HTTP 412 и текстом ошибки.
+        """
+        return JSONResponse(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            content={"detail": str(exc)},
+        )
+
     @app.exception_handler(UnauthorizedError)
     async def unauthorized_handler(
         _: Request, exc: UnauthorizedError
@@ -0,0 +1,99 @@
+"""Поддержка условных HTTP-запросов (`ETag` / `Last-Modified`).
+
+Модуль содержит разбор заголовков `If-None-Match` и `If-Modified-Since` по
+RFC 9110 (слабое сравнение тегов, точность дат до секунды) и формирование
+ответа `304 Not Modified`.
+"""
+
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import status
+from fastapi.responses import Response
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Проверяет, совпадает ли ETag с одним из тегов в `If-None-Match`.
+
+    Args:
+        if_none_match: Значение заголовка `If-None-Match` (может отсутствовать).
+        etag: Текущий ETag ресурса.
+
+    Returns:
+        bool: `True`, если клиент уже имеет актуальное представление ресурса.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    current = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == current
+        for candidate in if_none_match.split(",")
+    )
+
+
+def is_not_modified(
+    *,
+    etag: str,
+    last_modified: datetime | None,
+    if_none_match: str | None,
+    if_modified_since: str | None,
+) -> bool:
+    """Проверяет, можно ли ответить клиенту `304 Not Modified`.
+
+    `If-None-Match` имеет приоритет: `If-Modified-Since` учитывается только
+    при его отсутствии.
+
+    Args:
+        etag: Текущий ETag ресурса.
+        last_modified: Время последнего изменения ресурса (если известно).
+        if_none_match: Значение заголовка `If-None-Match`.
+        if_modified_since: Значение заголовка `If-Modified-Since`.
+
+    Returns:
+        bool: `True`, если представление клиента актуально.
+    """
+    if if_none_match:
+        return etag_matches(if_none_match, etag)
+    if not if_modified_since or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=UTC)
+    return last_modified.replace(microsecond=0) <= since
+
+
+def validators(
+    etag: str, last_modified: datetime | None = None
+) -> dict[str, str]:
+    """Формирует заголовки-валидаторы ответа.
+
+    Args:
+        etag: ETag ресурса.
+        last_modified: Время последнего изменения ресурса (если известно).
+
+    Returns:
+        dict[str, str]: Заголовки `ETag` и (при наличии) `Last-Modified`.
+    """
+    headers = {"ETag": etag}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(
+            last_modified.astimezone(UTC), usegmt=True
+        )
+    return headers
+
+
+def not_modified(headers: dict[str, str]) -> Response:
+    """Формирует ответ `304 Not Modified` без тела.
+
+    Args:
+        headers: Заголовки-валидаторы ресурса (см. `validators`).
+
+    Returns:
+        Response: Ответ с кодом 304.
+    """
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
@@ -0,0 +1,88 @@
+"""Общие зависимости HTTP-обработчиков API v1 (аутентификация)."""
+
+from dishka.integrations.fastapi import FromDishka, inject
+from fastapi import Depends, HTTPException, status
+from fastapi.security import OAuth2PasswordBearer
+
+from application.exceptions import InvalidCredentialsError
+from application.interfaces.repositories import UserRepositoryProtocol
+from application.services.security import TokenService
+from domain.entities.user import User
+
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/token/")
+
+
+@inject
+async def get_current_user(
+    token_service: FromDishka[TokenService],
+    users_repo: FromDishka[UserRepositoryProtocol],
+    token: str = Depends(oauth2_scheme),
+) -> User:
+    """Возвращает текущего пользователя по JWT-токену.
+
+    Достаёт токен из заголовка `Authorization: Bearer ...`, декодирует его и
+    загружает пользователя из репозитория.
+
+    Args:
+        token_service: Сервис для работы с JWT-токенами.
+        users_repo: Репозиторий пользователей.
+        token: JWT-токен доступа.
+
+    Returns:
+        User: Доменная сущность пользователя.
+
+    Raises:
+        HTTPException: Если токен невалиден, пользователь не найден или запись
+            пользователя некорректна.
+    """
+    try:
+        data = token_service.decode_token(token)
+    except InvalidCredentialsError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=str(exc),
+            headers={"WWW-Authenticate": "Bearer"},
+        ) from exc
+
+    if data.user_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Некорректные учётные данные",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    user = await users_repo.get_by_id(data.user_id)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Пользователь не найден",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    if user.id is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Некорректная запись пользователя",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user
+
+
+def require_user_id(user: User) -> int:
+    """Извлекает идентификатор пользователя или выбрасывает HTTP 401.
+
+    Args:
+        user: Доменная сущность пользователя.
+
+    Returns:
+        int: Идентификатор пользователя.
+
+    Raises:
+        HTTPException: Если `user.id` отсутствует (некорректная запись).
+    """
+    user_id = user.id
+    if user_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Некорректная запись пользователя",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user_id
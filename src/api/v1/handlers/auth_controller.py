@@ -2,16 +2,28 @@
 
 Содержит эндпоинты:
 - `POST /register/` — регистрация пользователя;
-- `POST /token/` — получение JWT-токена по OAuth2 Password Flow.
+- `POST /token/` — получение JWT-токена и токена обновления по OAuth2
+  Password Flow;
+- `POST /token/refresh/` — ротация токена обновления без проверки пароля;
+- `POST /logout/` и `POST /logout/all/` — отзыв одной или всех сессий.
 """
 
 from dishka.integrations.fastapi import FromDishka, inject
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, Response, status
 from fastapi.security import OAuth2PasswordRequestForm
 
+from application.dtos.auth import TokenDTO
 from application.dtos.user import UserCreateDTO
-from application.use_cases import LoginUserUseCase, RegisterUserUseCase
+from application.use_cases import (
+    LoginUserUseCase,
+    LogoutUserUseCase,
+    RefreshTokenUseCase,
+    RegisterUserUseCase,
+)
+from domain.entities.user import User
+from api.v1.dependencies import get_current_user, require_user_id
 from api.v1.schemas import (
+    RefreshTokenSchema,
     RegisterSchema,
     TokenSchema,
     UserResponseSchema,
@@ -52,21 +64,99 @@ async def register_user(
 @router.post("/token/", response_model=TokenSchema)
 @inject
 async def login_for_access_token(
+    request: Request,
     use_case: FromDishka[LoginUserUseCase],
     form_data: OAuth2PasswordRequestForm = Depends(),
 ) -> TokenSchema:
-    """Выдаёт JWT-токен доступа по логину и паролю.
+    """Выдаёт JWT-токен доступа и токен обновления по логину и паролю.
 
     Args:
+        request: Входящий запрос (IP-адрес клиента для защиты от перебора).
         use_case: Сценарий входа пользователя.
         form_data: OAuth2-форма (username/password).
 
     Returns:
-        TokenSchema: Токен доступа и его тип.
+        TokenSchema: Токен доступа, его тип и токен обновления.
     """
     token_dto = await use_case(
-        email=form_data.username, password=form_data.password
+        email=form_data.username,
+        password=form_data.password,
+        client_ip=request.client.host if request.client else None,
     )
+    return _token_response(token_dto)
+
+
+@router.post("/token/refresh/", response_model=TokenSchema)
+@inject
+async def refresh_access_token(
+    payload: RefreshTokenSchema,
+    use_case: FromDishka[RefreshTokenUseCase],
+) -> TokenSchema:
+    """Выдаёт новую пару токенов по токену обновления.
+
+    Переданный токен обновления становится недействительным (ротация).
+
+    Args:
+        payload: Токен обновления.
+        use_case: Сценарий ротации токена обновления.
+
+    Returns:
+        TokenSchema: Новый токен доступа и новый токен обновления.
+    """
+    return _token_response(await use_case(payload.refresh_token))
+
+
+@router.post("/logout/", status_code=status.HTTP_204_NO_CONTENT)
+@inject
+async def logout(
+    payload: RefreshTokenSchema,
+    use_case: FromDishka[LogoutUserUseCase],
+) -> Response:
+    """Отзывает сессию, привязанную к токену обновления.
+
+    Args:
+        payload: Токен обновления.
+        use_case: Сценарий отзыва сессий.
+
+    Returns:
+        Response: Пустой ответ `204 No Content`.
+    """
+    await use_case(payload.refresh_token)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.post("/logout/all/", status_code=status.HTTP_204_NO_CONTENT)
+@inject
+async def logout_all(
+    use_case: FromDishka[LogoutUserUseCase],
+    current_user: User = Depends(get_current_user),
+) -> Response:
+    """Отзывает все сессии текущего пользователя.
+
+    Уже выданные токены доступа остаются действительными до истечения срока.
+
+    Args:
+        use_case: Сценарий отзыва сессий.
+        current_user: Авторизованный пользователь.
+
+    Returns:
+        Response: Пустой ответ `204 No Content`.
+    """
+    await use_case.revoke_all(require_user_id(current_user))
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+def _token_response(token_dto: TokenDTO) -> TokenSchema:
+    """Преобразует DTO токенов в схему ответа.
+
+    Args:
+        token_dto: DTO токенов.
+
+    Returns:
+        TokenSchema: Схема ответа.
+    """
     return TokenSchema(
-        access_token=token_dto.access_token, token_type=token_dto.token_type
+        access_token=token_dto.access_token,
+        token_type=token_dto.token_type,
+        refresh_token=token_dto.refresh_token,
     )
@@ -4,27 +4,53 @@
 - создания заказа (только авторизованный пользователь);
 - получения заказа по ID (с кешированием на уровне use-case);
 - обновления статуса заказа;
-- получения списка заказов пользователя.
+- получения списка заказов пользователя;
+- потоковой выдачи изменений заказов текущего пользователя (SSE).
+
+Эндпоинты чтения поддерживают условные запросы: ответ содержит `ETag` (версия
+заказа) и `Last-Modified`, а при совпадении `If-None-Match` или
+`If-Modified-Since` возвращается `304 Not Modified` без тела. Обновление
+статуса принимает `If-Match` и, если условие не выполнено (версия не совпала
+или значение не является ETag заказа), отвечает `412 Precondition Failed`.
+
+`GET /orders/stream` держит соединение открытым и отправляет событие `order`
+с телом заказа при каждом изменении его статуса; раз в
+`_STREAM_HEARTBEAT_SECONDS` отправляется комментарий, чтобы прокси не
+закрывали простаивающее соединение.
 """
 
+import asyncio
+from collections.abc import AsyncIterator
 from uuid import UUID
 
 from dishka.integrations.fastapi import FromDishka, inject
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordBearer
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
+from fastapi.responses import Response, StreamingResponse
 
 from application.dtos.order import CreateOrderDTO, UpdateOrderStatusDTO
-from application.interfaces.repositories import UserRepositoryProtocol
-from application.services.security import TokenService
+from application.interfaces.uow import UnitOfWorkProtocol
 from application.use_cases import (
     CreateOrderUseCase,
     GetOrderUseCase,
     ListUserOrdersUseCase,
     UpdateOrderStatusUseCase,
 )
-from application.exceptions import InvalidCredentialsError
+from application.order_cache import (
+    order_etag,
+    order_list_etag,
+    parse_etag_version,
+)
 from domain.entities.user import User
+from infra.cache import OrderUpdatesHub
+from api.v1.conditional import (
+    etag_matches,
+    is_not_modified,
+    not_modified,
+    validators,
+)
+from api.v1.dependencies import get_current_user, require_user_id
 from api.v1.mappers import OrderPresentationMapper
+from api.v1.responses import RawJSONResponse
 from api.v1.schemas import (
     OrderCreateSchema,
     OrderResponseSchema,
@@ -32,83 +58,33 @@ from api.v1.schemas import (
 )
 
 router = APIRouter(tags=["Заказы"])
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/token/")
-
-
-@inject
-async def get_current_user(
-    token_service: FromDishka[TokenService],
-    users_repo: FromDishka[UserRepositoryProtocol],
-    token: str = Depends(oauth2_scheme),
-) -> User:
-    """Возвращает текущего пользователя по JWT-токену.
-
-    Достаёт токен из заголовка `Authorization: Bearer ...`, декодирует его и
-    загружает пользователя из репозитория.
-
-    Args:
-        token_service: Сервис для работы с JWT-токенами.
-        users_repo: Репозиторий пользователей.
-        token: JWT-токен доступа.
-
-    Returns:
-        User: Доменная сущность пользователя.
-
-    Raises:
-        HTTPException: Если токен невалиден, пользователь не найден или запись
-            пользователя некорректна.
-    """
-    try:
-        data = token_service.decode_token(token)
-    except InvalidCredentialsError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=str(exc),
-            headers={"WWW-Authenticate": "Bearer"},
-        ) from exc
 
-    if data.user_id is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Некорректные учётные данные",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    user = await users_repo.get_by_id(data.user_id)
-    if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Пользователь не найден",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    if user.id is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Некорректная запись пользователя",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    return user
+_STREAM_HEARTBEAT_SECONDS = 15.0
 
 
-def _require_user_id(user: User) -> int:
-    """Извлекает идентификатор пользователя или выбрасывает HTTP 401.
+def _expected_version(if_match: str | None) -> int | None:
+    """Извлекает ожидаемую версию заказа из заголовка `If-Match`.
 
     Args:
-        user: Доменная сущность пользователя.
+        if_match: Значение заголовка `If-Match` (может отсутствовать).
 
     Returns:
-        int: Идентификатор пользователя.
+        int | None: Ожидаемая версия или `None`, если условие не задано.
 
     Raises:
-        HTTPException: Если `user.id` отсутствует (некорректная запись).
+        HTTPException: Если значение не является ETag заказа: такому условию
+            не соответствует ни одна версия, поэтому оно заведомо не
+            выполнено (HTTP 412).
     """
-    user_id = user.id
-    if user_id is None:
+    if if_match is None or if_match.strip() == "*":
+        return None
+    version = parse_etag_version(if_match)
+    if version is None:
         raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Некорректная запись пользователя",
-            headers={"WWW-Authenticate": "Bearer"},
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail="Заголовок If-Match не соответствует версии заказа",
         )
-    return user_id
+    return version
 
 
 @router.post(
@@ -122,19 +98,19 @@ async def create_order(
     mapper: FromDishka[OrderPresentationMapper],
     use_case: FromDishka[CreateOrderUseCase],
     current_user: User = Depends(get_current_user),
-) -> OrderResponseSchema:
+) -> RawJSONResponse:
     """Создаёт заказ от имени текущего пользователя.
 
     Args:
         payload: Тело запроса на создание заказа.
-        mapper: Маппер для преобразования DTO в схему ответа.
+        mapper: Маппер для сериализации DTO в тело ответа.
         use_case: Сценарий создания заказа.
         current_user: Авторизованный пользователь.
 
     Returns:
-        OrderResponseSchema: Созданный заказ.
+        RawJSONResponse: Созданный заказ (`OrderResponseSchema`).
     """
-    user_id = _require_user_id(current_user)
+    user_id = require_user_id(current_user)
     dto = await use_case(
         CreateOrderDTO(
             user_id=user_id,
@@ -142,7 +118,73 @@ async def create_order(
             total_price=payload.total_price,
         )
     )
-    return mapper.to_response(dto)
+    return RawJSONResponse(
+        mapper.to_json(dto),
+        status_code=status.HTTP_201_CREATED,
+        headers=validators(order_etag(dto), dto.updated_at),
+    )
+
+
+async def _order_events(hub: OrderUpdatesHub, user_id: int) -> AsyncIterator[str]:
+    """Формирует поток SSE с изменениями заказов пользователя.
+
+    Args:
+        hub: Подписка воркера на изменения заказов.
+        user_id: Идентификатор пользователя.
+
+    Yields:
+        str: Очередной фрагмент потока `text/event-stream`.
+    """
+    async with hub.subscribe(user_id) as queue:
+        yield ": connected\n\n"
+        while True:
+            try:
+                body = await asyncio.wait_for(
+                    queue.get(), timeout=_STREAM_HEARTBEAT_SECONDS
+                )
+            except TimeoutError:
+                yield ": ping\n\n"
+                continue
+            if body is None:
+                return
+            yield f"event: order\ndata: {body}\n\n"
+
+
+@router.get(
+    "/orders/stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+@inject
+async def stream_orders(
+    request: Request,
+    uow: FromDishka[UnitOfWorkProtocol],
+    current_user: User = Depends(get_current_user),
+) -> StreamingResponse:
+    """Отправляет изменения заказов текущего пользователя (Server-Sent Events).
+
+    Каждое событие `order` содержит заказ в формате `OrderResponseSchema`.
+    Доставка «по возможности»: после переподключения клиенту следует
+    перечитать заказы через `GET /orders/user/{user_id}/`.
+
+    Args:
+        request: Текущий HTTP-запрос.
+        uow: Unit of Work запроса (сессия, в которой загружен пользователь).
+        current_user: Авторизованный пользователь.
+
+    Returns:
+        StreamingResponse: Поток `text/event-stream`.
+    """
+    user_id = require_user_id(current_user)
+    # Сессия запроса живёт до конца потока: завершаем транзакцию чтения
+    # пользователя, чтобы соединение вернулось в пул.
+    await uow.rollback()
+    hub: OrderUpdatesHub = request.app.state.order_updates
+    return StreamingResponse(
+        _order_events(hub, user_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get("/orders/{order_id}/", response_model=OrderResponseSchema)
@@ -152,21 +194,42 @@ async def get_order(
     mapper: FromDishka[OrderPresentationMapper],
     use_case: FromDishka[GetOrderUseCase],
     current_user: User = Depends(get_current_user),
-) -> OrderResponseSchema:
+    if_none_match: str | None = Header(default=None),
+    if_modified_since: str | None = Header(default=None),
+) -> Response:
     """Возвращает заказ по идентификатору.
 
+    Если клиент прислал `If-None-Match`, сначала сверяется ETag из кеша: при
+    совпадении ответ `304` формируется без разбора записи и без запроса к БД.
+
     Args:
         order_id: Идентификатор заказа.
-        mapper: Маппер для преобразования DTO в схему ответа.
+        mapper: Маппер для сериализации DTO в тело ответа.
         use_case: Сценарий получения заказа (с кешированием на его уровне).
         current_user: Авторизованный пользователь.
+        if_none_match: Значение заголовка `If-None-Match`.
+        if_modified_since: Значение заголовка `If-Modified-Since`.
 
     Returns:
-        OrderResponseSchema: Найденный заказ.
+        Response: Найденный заказ (`OrderResponseSchema`) или `304 Not Modified`.
     """
-    user_id = _require_user_id(current_user)
+    user_id = require_user_id(current_user)
+    if if_none_match:
+        cached_etag = await use_case.get_cached_etag(order_id, user_id=user_id)
+        if cached_etag is not None and etag_matches(if_none_match, cached_etag):
+            return not_modified({"ETag": cached_etag})
+
     dto = await use_case(order_id, user_id=user_id)
-    return mapper.to_response(dto)
+    etag = order_etag(dto)
+    headers = validators(etag, dto.updated_at)
+    if is_not_modified(
+        etag=etag,
+        last_modified=dto.updated_at,
+        if_none_match=if_none_match,
+        if_modified_since=if_modified_since,
+    ):
+        return not_modified(headers)
+    return RawJSONResponse(mapper.to_json(dto), headers=headers)
 
 
 @router.patch("/orders/{order_id}/", response_model=OrderResponseSchema)
@@ -177,26 +240,36 @@ async def update_order_status(
     mapper: FromDishka[OrderPresentationMapper],
     use_case: FromDishka[UpdateOrderStatusUseCase],
     current_user: User = Depends(get_current_user),
-) -> OrderResponseSchema:
+    if_match: str | None = Header(default=None),
+) -> RawJSONResponse:
     """Обновляет статус заказа.
 
+    Если передан `If-Match` с ETag заказа, обновление выполняется только при
+    совпадении версии (иначе — HTTP 412).
+
     Args:
         order_id: Идентификатор заказа.
         payload: Тело запроса на обновление статуса.
-        mapper: Маппер для преобразования DTO в схему ответа.
+        mapper: Маппер для сериализации DTO в тело ответа.
         use_case: Сценарий обновления статуса заказа.
         current_user: Авторизованный пользователь.
+        if_match: Значение заголовка `If-Match`.
 
     Returns:
-        OrderResponseSchema: Заказ с обновлённым статусом.
+        RawJSONResponse: Заказ с обновлённым статусом (`OrderResponseSchema`).
     """
-    user_id = _require_user_id(current_user)
+    user_id = require_user_id(current_user)
     dto = await use_case(
         UpdateOrderStatusDTO(
-            order_id=order_id, status=payload.status, user_id=user_id
+            order_id=order_id,
+            status=payload.status,
+            user_id=user_id,
+            expected_version=_expected_version(if_match),
         )
     )
-    return mapper.to_response(dto)
+    return RawJSONResponse(
+        mapper.to_json(dto), headers=validators(order_etag(dto), dto.updated_at)
+    )
 
 
 @router.get("/orders/user/{user_id}/", response_model=list[OrderResponseSchema])
@@ -206,28 +279,43 @@ async def list_user_orders(
     mapper: FromDishka[OrderPresentationMapper],
     use_case: FromDishka[ListUserOrdersUseCase],
     current_user: User = Depends(get_current_user),
-) -> list[OrderResponseSchema]:
+    if_none_match: str | None = Header(default=None),
+    if_modified_since: str | None = Header(default=None),
+) -> Response:
     """Возвращает список заказов конкретного пользователя.
 
     Доступ разрешён только владельцу (текущему пользователю).
 
     Args:
         user_id: Идентификатор пользователя, заказы которого запрашиваются.
-        mapper: Маппер для преобразования DTO в схемы ответа.
+        mapper: Маппер для сериализации DTO в тело ответа.
         use_case: Сценарий получения списка заказов пользователя.
         current_user: Авторизованный пользователь.
+        if_none_match: Значение заголовка `If-None-Match`.
+        if_modified_since: Значение заголовка `If-Modified-Since`.
 
     Returns:
-        list[OrderResponseSchema]: Список заказов пользователя.
+        Response: Список заказов пользователя (`list[OrderResponseSchema]`)
+            или `304 Not Modified`.
 
     Raises:
         HTTPException: Если запрошен список заказов другого пользователя.
     """
-    current_user_id = _require_user_id(current_user)
+    current_user_id = require_user_id(current_user)
     if current_user_id != user_id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Запрещено запрашивать заказы другого пользователя",
         )
     dtos = await use_case(user_id)
-    return mapper.to_list(dtos)
+    etag = order_list_etag(dtos)
+    last_modified = max((dto.updated_at for dto in dtos), default=None)
+    headers = validators(etag, last_modified)
+    if is_not_modified(
+        etag=etag,
+        last_modified=last_modified,
+        if_none_match=if_none_match,
+        if_modified_since=if_modified_since,
+    ):
+        return not_modified(headers)
+    return RawJSONResponse(mapper.to_json_list(dtos), headers=headers)
@@ -1,40 +1,40 @@
 """Маппер заказа для выдачи через API.
 
-Преобразует `OrderDTO` из слоя application в Pydantic-схемы ответов.
+Преобразует `OrderDTO` из слоя application в JSON-тело ответа. Сериализаторы
+собираются один раз при импорте модуля: `OrderDTO` повторяет форму
+`OrderResponseSchema`, поэтому DTO сериализуется напрямую, без промежуточной
+Pydantic-модели и повторной валидации.
 """
 
+from pydantic import TypeAdapter
+
 from application.dtos.order import OrderDTO
-from api.v1.schemas import OrderResponseSchema
+
+_ORDER_SERIALIZER: TypeAdapter[OrderDTO] = TypeAdapter(OrderDTO)
+_ORDER_LIST_SERIALIZER: TypeAdapter[list[OrderDTO]] = TypeAdapter(list[OrderDTO])
 
 
 class OrderPresentationMapper:
-    """Преобразователь DTO заказа в схемы ответа API."""
+    """Преобразователь DTO заказа в тело ответа API."""
 
-    def to_response(self, dto: OrderDTO) -> OrderResponseSchema:
-        """Преобразует один DTO заказа в схему ответа.
+    def to_json(self, dto: OrderDTO) -> bytes:
+        """Сериализует один DTO заказа в JSON.
 
         Args:
             dto: DTO заказа.
 
         Returns:
-            OrderResponseSchema: Pydantic-схема ответа.
+            bytes: JSON-представление заказа в формате `OrderResponseSchema`.
         """
-        return OrderResponseSchema(
-            id=dto.id,
-            user_id=dto.user_id,
-            items=dto.items,
-            total_price=dto.total_price,
-            status=dto.status,
-            created_at=dto.created_at,
-        )
-
-    def to_list(self, dtos: list[OrderDTO]) -> list[OrderResponseSchema]:
-        """Преобразует список DTO заказов в список схем ответа.
+        return _ORDER_SERIALIZER.dump_json(dto)
+
+    def to_json_list(self, dtos: list[OrderDTO]) -> bytes:
+        """Сериализует список DTO заказов в JSON-массив.
 
         Args:
             dtos: Список DTO заказов.
 
         Returns:
-            list[OrderResponseSchema]: Список Pydantic-схем для ответа.
+            bytes: JSON-массив в формате `list[OrderResponseSchema]`.
         """
-        return [self.to_response(dto) for dto in dtos]
+        return _ORDER_LIST_SERIALIZER.dump_json(dtos)
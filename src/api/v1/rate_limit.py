@@ -0,0 +1,74 @@
+"""Зависимость FastAPI для ограничения частоты запросов.
+
+Бюджет считается на пару «маршрут + клиент». Клиент определяется по
+проверенному JWT (`sub`), а для анонимных запросов и невалидных токенов — по
+IP-адресу. Сам лимитер (`HybridRateLimiter`) создаётся в `main.lifespan` и
+хранится в `app.state.rate_limiter`.
+"""
+
+from dishka.integrations.fastapi import FromDishka, inject
+from fastapi import HTTPException, Request, status
+from fastapi.routing import APIRoute
+
+from application.exceptions import InvalidCredentialsError
+from application.services.security import TokenService
+from infra.ratelimit import HybridRateLimiter
+
+
+def _route_key(request: Request) -> str:
+    """Формирует ключ маршрута `"METHOD /path/template"`.
+
+    Args:
+        request: Входящий запрос.
+
+    Returns:
+        str: Ключ маршрута (шаблон пути, а не конкретный URL).
+    """
+    route = request.scope.get("route")
+    path = route.path if isinstance(route, APIRoute) else request.url.path
+    return f"{request.method} {path}"
+
+
+def _client_identity(request: Request, token_service: TokenService) -> str:
+    """Определяет клиента запроса для учёта лимита.
+
+    Args:
+        request: Входящий запрос.
+        token_service: Сервис проверки JWT-токенов.
+
+    Returns:
+        str: `user:<id>` для валидного токена, иначе `ip:<адрес>`.
+    """
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and token:
+        try:
+            return f"user:{token_service.decode_token(token).user_id}"
+        except InvalidCredentialsError:
+            pass
+    host = request.client.host if request.client else "unknown"
+    return f"ip:{host}"
+
+
+@inject
+async def rate_limit(
+    request: Request, token_service: FromDishka[TokenService]
+) -> None:
+    """Проверяет лимит запросов для текущего маршрута и клиента.
+
+    Args:
+        request: Входящий запрос.
+        token_service: Сервис проверки JWT-токенов.
+
+    Raises:
+        HTTPException: 429, если лимит исчерпан (с заголовком `Retry-After`).
+    """
+    limiter: HybridRateLimiter = request.app.state.rate_limiter
+    decision = await limiter.hit(
+        _route_key(request), _client_identity(request, token_service)
+    )
+    if not decision.allowed:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Слишком много запросов",
+            headers={"Retry-After": str(decision.retry_after)},
+        )
@@ -0,0 +1,17 @@
+"""Классы HTTP-ответов API v1.
+
+Содержит ответы, которые отдают клиенту уже сериализованное тело без повторной
+валидации и сериализации на стороне FastAPI.
+"""
+
+from fastapi.responses import Response
+
+
+class RawJSONResponse(Response):
+    """JSON-ответ с заранее сериализованным телом.
+
+    Тело передаётся как `bytes` и отправляется как есть: FastAPI не применяет к
+    нему `response_model`, поэтому схема используется только для OpenAPI.
+    """
+
+    media_type = "application/json"
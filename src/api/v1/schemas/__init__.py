@@ -5,6 +5,7 @@
 
 from api.v1.schemas.auth import (
     LoginSchema,
+    RefreshTokenSchema,
     RegisterSchema,
     TokenSchema,
     UserResponseSchema,
@@ -20,6 +21,7 @@ __all__ = [
     "OrderCreateSchema",
     "OrderResponseSchema",
     "OrderUpdateSchema",
+    "RefreshTokenSchema",
     "RegisterSchema",
     "TokenSchema",
     "UserResponseSchema",
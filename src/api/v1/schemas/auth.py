@@ -21,10 +21,17 @@ class LoginSchema(BaseModel):
 
 
 class TokenSchema(BaseModel):
-    """Схема ответа с токеном доступа."""
+    """Схема ответа с токеном доступа и токеном обновления."""
 
     access_token: str
     token_type: str = "bearer"
+    refresh_token: str | None = None
+
+
+class RefreshTokenSchema(BaseModel):
+    """Схема запроса с токеном обновления (ротация или выход)."""
+
+    refresh_token: str = Field(min_length=1, max_length=256)
 
 
 class UserResponseSchema(BaseModel):
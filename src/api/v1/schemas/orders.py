@@ -38,3 +38,5 @@ class OrderResponseSchema(BaseModel):
     total_price: Decimal
     status: OrderStatus
     created_at: datetime
+    updated_at: datetime
+    version: int
@@ -10,10 +10,12 @@ class TokenDTO:
     Attributes:
         access_token: Строковое представление JWT.
         token_type: Тип токена (по умолчанию `bearer`).
+        refresh_token: Непрозрачный токен обновления (если выдан).
     """
 
     access_token: str
     token_type: str = "bearer"
+    refresh_token: str | None = None
 
 
 @dataclass(slots=True, kw_only=True)
@@ -27,3 +29,19 @@ class TokenDataDTO:
 
     user_id: int | None = None
     email: str | None = None
+
+
+@dataclass(slots=True, kw_only=True)
+class RefreshSessionDTO:
+    """Сессия, привязанная к токену обновления.
+
+    Attributes:
+        user_id: Идентификатор пользователя.
+        email: Email пользователя (для выпуска нового токена доступа).
+        generation: Поколение сессий пользователя, в котором выполнен вход
+            (`None` — новый вход, сессия получает текущее поколение).
+    """
+
+    user_id: int
+    email: str
+    generation: int | None = None
@@ -20,6 +20,8 @@ class OrderDTO:
         total_price: Итоговая стоимость.
         status: Статус заказа.
         created_at: Дата и время создания.
+        updated_at: Дата и время последнего изменения.
+        version: Версия заказа (для ETag и оптимистичной блокировки).
     """
 
     id: UUID
@@ -28,6 +30,8 @@ class OrderDTO:
     total_price: Decimal
     status: OrderStatus
     created_at: datetime
+    updated_at: datetime
+    version: int
 
 
 @dataclass(slots=True, kw_only=True)
@@ -53,8 +57,11 @@ class UpdateOrderStatusDTO:
         order_id: Идентификатор заказа.
         status: Новый статус.
         user_id: Идентификатор владельца (для проверки прав).
+        expected_version: Ожидаемая текущая версия заказа. Если задана,
+            обновление выполняется только при совпадении версии.
     """
 
     order_id: UUID
     status: OrderStatus
     user_id: int
+    expected_version: int | None = None
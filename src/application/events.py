@@ -0,0 +1,144 @@
+"""Типы outbox-событий, их построение и маршруты публикации.
+
+События создаются функциями `new_order_event` и `order_status_changed_event`
+и записываются в outbox в той же транзакции, что и изменение заказа.
+
+`EventRouteRegistry` сопоставляет тип события (`OutboxEvent.event_type`)
+маршруту в брокере: exchange и ключ маршрутизации. Ключ может быть шаблоном
+`str.format` по полям payload (например, `order.status.{status}`). События
+без зарегистрированного маршрута не публикуются.
+
+Payload `new_order` версионируется полем `schema_version`
+(`NEW_ORDER_SCHEMA_VERSION`). Версия 2 дополняет поля версии 1 снимком заказа
+на момент создания (`items`, `total_price`, `status`, `created_at`,
+`version`), чтобы обработчик не читал заказ из БД. Изменения схемы только
+добавляют поля, поэтому потребитель, знающий версию 1, читает и новые
+сообщения.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+from domain.entities.order import Order
+from domain.entities.outbox_event import OutboxEvent
+from domain.identifiers import new_id
+
+NEW_ORDER_EVENT = "new_order"
+NEW_ORDER_SCHEMA_VERSION = 2
+ORDER_STATUS_CHANGED_EVENT = "order_status_changed"
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class EventRoute:
+    """Маршрут публикации события.
+
+    Attributes:
+        exchange: Имя exchange (`""` — exchange по умолчанию, ключ
+            маршрутизации совпадает с именем очереди).
+        routing_key: Ключ маршрутизации или шаблон по полям payload.
+        exchange_type: Тип exchange, объявляемого при первой публикации.
+    """
+
+    exchange: str
+    routing_key: str
+    exchange_type: Literal["direct", "topic", "fanout"] = "direct"
+
+    def routing_key_for(self, payload: dict[str, Any]) -> str:
+        """Возвращает ключ маршрутизации для payload события.
+
+        Args:
+            payload: Полезная нагрузка события.
+
+        Returns:
+            str: Ключ маршрутизации.
+
+        Raises:
+            KeyError: В payload нет поля, используемого в шаблоне.
+        """
+        return self.routing_key.format_map(payload)
+
+
+@dataclass(slots=True)
+class EventRouteRegistry:
+    """Реестр маршрутов публикации по типам событий."""
+
+    _routes: dict[str, EventRoute] = field(default_factory=dict)
+
+    def register(self, event_type: str, route: EventRoute) -> None:
+        """Регистрирует маршрут для типа события.
+
+        Args:
+            event_type: Тип события.
+            route: Маршрут публикации.
+        """
+        self._routes[event_type] = route
+
+    def get(self, event_type: str) -> EventRoute | None:
+        """Возвращает маршрут для типа события.
+
+        Args:
+            event_type: Тип события.
+
+        Returns:
+            EventRoute | None: Маршрут или `None`, если тип не зарегистрирован.
+        """
+        return self._routes.get(event_type)
+
+
+def new_order_event(order: Order) -> OutboxEvent:
+    """Создаёт событие о создании заказа.
+
+    Payload содержит снимок заказа (схема версии `NEW_ORDER_SCHEMA_VERSION`);
+    сумма передаётся строкой, чтобы не терять точность `Decimal`.
+
+    Args:
+        order: Созданный заказ.
+
+    Returns:
+        OutboxEvent: Событие `new_order`.
+    """
+    event_id = new_id()
+    return OutboxEvent(
+        id=event_id,
+        event_type=NEW_ORDER_EVENT,
+        payload={
+            "event": NEW_ORDER_EVENT,
+            "schema_version": NEW_ORDER_SCHEMA_VERSION,
+            "order_id": str(order.id),
+            "user_id": order.user_id,
+            "event_id": str(event_id),
+            "items": order.items,
+            "total_price": str(order.total_price),
+            "status": order.status.value,
+            "created_at": order.created_at.isoformat(),
+            "version": order.version,
+        },
+    )
+
+
+def order_status_changed_event(order: Order) -> OutboxEvent:
+    """Создаёт событие об изменении статуса заказа.
+
+    Событие публикуется в topic exchange с ключом `order.status.<статус>`;
+    `version` позволяет потребителю отбросить устаревшие события.
+
+    Args:
+        order: Заказ после изменения статуса.
+
+    Returns:
+        OutboxEvent: Событие `order_status_changed`.
+    """
+    event_id = new_id()
+    return OutboxEvent(
+        id=event_id,
+        event_type=ORDER_STATUS_CHANGED_EVENT,
+        payload={
+            "event": ORDER_STATUS_CHANGED_EVENT,
+            "event_id": str(event_id),
+            "order_id": str(order.id),
+            "user_id": order.user_id,
+            "status": order.status.value,
+            "version": order.version,
+            "changed_at": order.updated_at.isoformat(),
+        },
+    )
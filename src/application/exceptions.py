@@ -21,5 +21,27 @@ class OrderNotFoundError(ApplicationError):
     """Заказ не найден (либо недоступен пользователю)."""
 
 
+class OrderVersionConflictError(ApplicationError):
+    """Заказ был изменён параллельно: ожидаемая версия не совпала."""
+
+
 class UnauthorizedError(ApplicationError):
     """Пользователь не имеет прав на выполнение действия."""
+
+
+class SessionStoreUnavailableError(ApplicationError):
+    """Хранилище сессий недоступно, операция с сессиями не выполнена."""
+
+
+class TooManyLoginAttemptsError(ApplicationError):
+    """Вход временно заблокирован после серии неудачных попыток."""
+
+    def __init__(self, message: str, *, retry_after: int) -> None:
+        """Создаёт ошибку блокировки входа.
+
+        Args:
+            message: Текст ошибки.
+            retry_after: Через сколько секунд можно повторить попытку.
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
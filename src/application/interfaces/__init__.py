@@ -9,10 +9,11 @@ from application.interfaces.repositories import (
     OrderRepositoryProtocol,
     UserRepositoryProtocol,
 )
-from application.interfaces.uow import UnitOfWorkProtocol
+from application.interfaces.uow import Durability, UnitOfWorkProtocol
 
 __all__ = [
     "CacheProtocol",
+    "Durability",
     "MessageBrokerPublisherProtocol",
     "OrderRepositoryProtocol",
     "UnitOfWorkProtocol",
@@ -4,6 +4,7 @@
 сценариев.
 """
 
+from collections.abc import Mapping, Sequence
 from typing import Protocol
 
 
@@ -34,6 +35,115 @@ class CacheProtocol(Protocol):
         """
         ...
 
+    async def get_many(self, keys: Sequence[str]) -> list[str | None]:
+        """Получает значения по нескольким ключам за один запрос.
+
+        Args:
+            keys: Ключи в кеше.
+
+        Returns:
+            list[str | None]: Значения в порядке `keys` (`None` для отсутствующих).
+        """
+        ...
+
+    async def set_many(
+        self, items: Mapping[str, str], ttl: int | None = None
+    ) -> bool:
+        """Сохраняет несколько значений за один запрос.
+
+        Args:
+            items: Пары ключ → значение.
+            ttl: Время жизни в секундах. Если `None`, применяется дефолт клиента.
+
+        Returns:
+            bool: Признак успешного сохранения.
+        """
+        ...
+
+    async def set_versioned(
+        self, key: str, value: str, *, version: int, ttl: int | None = None
+    ) -> bool:
+        """Атомарно сохраняет значение, если оно новее уже сохранённого.
+
+        Значение должно начинаться с префикса `<version>|`: по нему кеш
+        сравнивает версию уже сохранённой записи. Запись с меньшей или равной
+        версией не перезаписывает существующую.
+
+        Args:
+            key: Ключ в кеше.
+            value: Значение с префиксом версии.
+            version: Версия сохраняемого значения.
+            ttl: Время жизни в секундах. Если `None`, применяется дефолт клиента.
+
+        Returns:
+            bool: `True`, если значение записано, `False`, если в кеше уже
+            есть более новая версия или запись не удалась.
+        """
+        ...
+
+    async def set_many_versioned(
+        self, items: Mapping[str, tuple[str, int]], ttl: int | None = None
+    ) -> bool:
+        """Пакетный вариант `set_versioned` (один запрос к кешу).
+
+        Args:
+            items: Пары ключ → (значение с префиксом версии, версия).
+            ttl: Время жизни в секундах. Если `None`, применяется дефолт клиента.
+
+        Returns:
+            bool: Признак успешного выполнения пакета.
+        """
+        ...
+
+    async def get_index(self, key: str) -> list[str] | None:
+        """Возвращает элементы индекса в порядке убывания веса.
+
+        Индекс считается прогретым только после `fill_index`: элементы,
+        добавленные через `add_to_index` в холодный индекс, не делают его
+        полным.
+
+        Args:
+            key: Ключ индекса.
+
+        Returns:
+            list[str] | None: Элементы индекса или `None`, если индекс холодный.
+        """
+        ...
+
+    async def fill_index(
+        self, key: str, members: Mapping[str, float], ttl: int | None = None
+    ) -> bool:
+        """Заполняет индекс полным набором элементов и помечает его прогретым.
+
+        Элементы объединяются с уже добавленными через `add_to_index`, поэтому
+        параллельная вставка не теряется, даже если снимок `members` устарел.
+
+        Args:
+            key: Ключ индекса.
+            members: Пары элемент → вес (порядок сортировки).
+            ttl: Время жизни в секундах. Если `None`, применяется дефолт клиента.
+
+        Returns:
+            bool: Признак успешного сохранения.
+        """
+        ...
+
+    async def add_to_index(
+        self, key: str, member: str, *, score: float, ttl: int | None = None
+    ) -> bool:
+        """Добавляет элемент в индекс.
+
+        Args:
+            key: Ключ индекса.
+            member: Элемент.
+            score: Вес элемента (порядок сортировки).
+            ttl: Время жизни в секундах. Если `None`, применяется дефолт клиента.
+
+        Returns:
+            bool: Признак успешного сохранения.
+        """
+        ...
+
     async def delete(self, key: str) -> bool:
         """Удаляет значение по ключу.
 
@@ -44,3 +154,14 @@ class CacheProtocol(Protocol):
             bool: Признак того, что ключ был удалён.
         """
         ...
+
+    async def delete_many(self, keys: Sequence[str]) -> bool:
+        """Удаляет значения по нескольким ключам за один запрос.
+
+        Args:
+            keys: Ключи в кеше.
+
+        Returns:
+            bool: Признак успешного удаления.
+        """
+        ...
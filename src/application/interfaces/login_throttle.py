@@ -0,0 +1,46 @@
+"""Контракт (Protocol) защиты входа от перебора паролей.
+
+Ограничитель учитывает неудачные попытки входа отдельно по email и по
+IP-адресу клиента и блокирует их после превышения порога. Проверка
+блокировки выполняется до обращения к БД и хеширования пароля.
+"""
+
+from typing import Protocol
+
+
+class LoginThrottleProtocol(Protocol):
+    """Протокол учёта неудачных попыток входа."""
+
+    async def retry_after(self, *, email: str, ip: str | None) -> int:
+        """Проверяет, заблокирован ли вход для email или IP-адреса.
+
+        Args:
+            email: Email из попытки входа.
+            ip: IP-адрес клиента (если известен).
+
+        Returns:
+            int: Сколько секунд осталось до снятия блокировки (`0` — вход
+            разрешён).
+        """
+        ...
+
+    async def register_failure(self, *, email: str, ip: str | None) -> int:
+        """Учитывает неудачную попытку входа.
+
+        Args:
+            email: Email из попытки входа.
+            ip: IP-адрес клиента (если известен).
+
+        Returns:
+            int: Длительность назначенной блокировки в секундах (`0` — порог
+            не превышен).
+        """
+        ...
+
+    async def reset(self, *, email: str) -> None:
+        """Сбрасывает счётчик неудач и уровень блокировки email после входа.
+
+        Args:
+            email: Email успешно вошедшего пользователя.
+        """
+        ...
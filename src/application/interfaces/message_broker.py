@@ -4,8 +4,12 @@
 сценариев.
 """
 
+from collections.abc import Sequence
 from typing import Any, Protocol
 
+from application.events import EventRoute
+from domain.entities.outbox_event import OutboxEvent
+
 
 class MessageBrokerPublisherProtocol(Protocol):
     """Протокол издателя событий в брокер сообщений."""
@@ -17,3 +21,20 @@ class MessageBrokerPublisherProtocol(Protocol):
             payload: Данные события (в формате JSON-совместимого словаря).
         """
         ...
+
+    async def publish_many(
+        self, route: EventRoute, events: Sequence[OutboxEvent]
+    ) -> list[Exception | None]:
+        """Публикует пачку outbox-событий одного маршрута.
+
+        Ошибка публикации одного события не прерывает остальные.
+
+        Args:
+            route: Маршрут публикации.
+            events: События для публикации.
+
+        Returns:
+            list[Exception | None]: Результат по каждому событию в порядке
+            `events`: `None` при успехе или исключение.
+        """
+        ...
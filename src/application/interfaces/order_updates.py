@@ -0,0 +1,22 @@
+"""Контракт (Protocol) уведомлений клиентов об изменении заказов.
+
+Уведомления доставляются подключённым клиентам (`GET /orders/stream`) по
+принципу «по возможности»: состояние заказа всегда можно получить через API,
+поэтому потеря уведомления не нарушает корректность.
+"""
+
+from typing import Protocol
+
+from application.dtos.order import OrderDTO
+
+
+class OrderUpdatesPublisherProtocol(Protocol):
+    """Протокол публикации изменений заказов для потоковой выдачи клиентам."""
+
+    async def publish(self, order: OrderDTO) -> None:
+        """Публикует новое состояние заказа его владельцу.
+
+        Args:
+            order: Заказ после изменения.
+        """
+        ...
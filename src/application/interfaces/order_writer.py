@@ -0,0 +1,27 @@
+"""Контракт (Protocol) записи нового заказа вместе с outbox-событием.
+
+Заказ и его событие `new_order` всегда фиксируются в одной транзакции.
+Реализация решает, будет ли это отдельная транзакция на каждый заказ или
+общая транзакция для нескольких одновременных заказов (group commit).
+"""
+
+from typing import Protocol
+
+from domain.entities.order import Order
+from domain.entities.outbox_event import OutboxEvent
+
+
+class OrderWriterProtocol(Protocol):
+    """Протокол записи заказа и его outbox-события."""
+
+    async def create(self, order: Order, event: OutboxEvent) -> Order:
+        """Сохраняет заказ и outbox-событие атомарно.
+
+        Args:
+            order: Доменная сущность заказа.
+            event: Событие о создании заказа.
+
+        Returns:
+            Order: Созданный заказ.
+        """
+        ...
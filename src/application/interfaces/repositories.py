@@ -5,6 +5,8 @@
 т.п.).
 """
 
+from collections.abc import Sequence
+from datetime import datetime
 from typing import Protocol
 from uuid import UUID
 
@@ -39,15 +41,31 @@ class UserRepositoryProtocol(Protocol):
         """
         ...
 
-    async def create(self, user: User) -> User:
-        """Создаёт пользователя.
+    async def create(self, user: User) -> User | None:
+        """Создаёт пользователя, если email ещё не занят.
 
         Args:
             user: Доменная сущность пользователя.
 
         Returns:
-            User: Созданная сущность (с заполненным `id` и `created_at`, если
-            применимо).
+            User | None: Созданная сущность (с заполненными `id` и
+            `created_at`) или `None`, если пользователь с таким email уже
+            существует.
+        """
+        ...
+
+    async def update_password_hash(
+        self, user_id: int, hashed_password: str, *, expected_hash: str
+    ) -> bool:
+        """Заменяет хеш пароля, если он не изменился с момента чтения.
+
+        Args:
+            user_id: Идентификатор пользователя.
+            hashed_password: Новый хеш пароля.
+            expected_hash: Хеш, по которому был проверен пароль.
+
+        Returns:
+            bool: `True`, если хеш обновлён.
         """
         ...
 
@@ -66,6 +84,17 @@ class OrderRepositoryProtocol(Protocol):
         """
         ...
 
+    async def create_many(self, orders: Sequence[Order]) -> list[Order]:
+        """Создаёт несколько заказов одним запросом.
+
+        Args:
+            orders: Доменные сущности заказов.
+
+        Returns:
+            list[Order]: Созданные сущности в порядке `orders`.
+        """
+        ...
+
     async def get_by_id(self, order_id: UUID) -> Order | None:
         """Возвращает заказ по идентификатору.
 
@@ -78,21 +107,30 @@ class OrderRepositoryProtocol(Protocol):
         ...
 
     async def update_status(
-        self, order_id: UUID, status: OrderStatus
+        self,
+        order_id: UUID,
+        status: OrderStatus,
+        *,
+        user_id: int,
+        expected_version: int | None = None,
     ) -> Order | None:
-        """Обновляет статус заказа.
+        """Атомарно обновляет статус заказа и увеличивает его версию.
 
         Args:
             order_id: Идентификатор заказа.
             status: Новый статус.
+            user_id: Идентификатор владельца заказа.
+            expected_version: Ожидаемая текущая версия. Если задана, обновление
+                выполняется только при совпадении (compare-and-set).
 
         Returns:
-            Order | None: Обновлённый заказ или `None`, если не найден.
+            Order | None: Обновлённый заказ или `None`, если заказ не найден,
+            принадлежит другому пользователю или его версия не совпала.
         """
         ...
 
     async def list_by_user(self, user_id: int) -> list[Order]:
-        """Возвращает список заказов пользователя.
+        """Возвращает список заказов пользователя (новые первыми).
 
         Args:
             user_id: Идентификатор пользователя.
@@ -117,8 +155,19 @@ class OutboxRepositoryProtocol(Protocol):
         """
         ...
 
+    async def add_many(self, events: Sequence[OutboxEvent]) -> None:
+        """Добавляет несколько событий в outbox одним запросом.
+
+        Args:
+            events: Доменные сущности событий.
+        """
+        ...
+
     async def list_pending(self, *, limit: int) -> list[OutboxEvent]:
-        """Возвращает список необработанных событий.
+        """Возвращает события, которые пора опубликовать.
+
+        Не возвращает обработанные события, события в dead letter и события,
+        время следующей попытки которых ещё не наступило.
 
         Args:
             limit: Максимальное количество возвращаемых событий.
@@ -135,3 +184,38 @@ class OutboxRepositoryProtocol(Protocol):
             event_id: Идентификатор события.
         """
         ...
+
+    async def mark_processed_many(self, event_ids: Sequence[UUID]) -> None:
+        """Помечает несколько событий обработанными.
+
+        Args:
+            event_ids: Идентификаторы событий.
+        """
+        ...
+
+    async def record_failure(
+        self, event_id: UUID, *, error: str, retry_at: datetime | None
+    ) -> None:
+        """Учитывает неудачную попытку публикации события.
+
+        Args:
+            event_id: Идентификатор события.
+            error: Текст ошибки.
+            retry_at: Время следующей попытки или `None`, чтобы перевести
+                событие в dead letter.
+        """
+        ...
+
+    async def delete_processed_before(
+        self, cutoff: datetime, *, limit: int
+    ) -> int:
+        """Удаляет пачку событий, обработанных раньше `cutoff`.
+
+        Args:
+            cutoff: Граница времени обработки.
+            limit: Максимальное количество удаляемых событий.
+
+        Returns:
+            int: Количество удалённых событий.
+        """
+        ...
@@ -0,0 +1,66 @@
+"""Контракт (Protocol) хранилища сессий токенов обновления.
+
+Хранилище оперирует хешами токенов: сами токены на стороне сервера не
+сохраняются.
+"""
+
+from typing import Protocol
+
+from application.dtos.auth import RefreshSessionDTO
+
+
+class SessionStoreProtocol(Protocol):
+    """Протокол хранилища сессий (refresh-токенов)."""
+
+    async def create(
+        self, token_hash: str, session: RefreshSessionDTO, *, ttl: int
+    ) -> bool:
+        """Сохраняет сессию.
+
+        Сессия с заданным поколением (ротация) сохраняется, только если
+        сессии пользователя не отзывались после её выдачи.
+
+        Args:
+            token_hash: Хеш токена обновления.
+            session: Данные сессии.
+            ttl: Время жизни сессии в секундах.
+
+        Returns:
+            bool: `True`, если сессия сохранена; `False`, если сессии
+            пользователя отозваны после выдачи `session`.
+
+        Raises:
+            SessionStoreUnavailableError: Если хранилище недоступно.
+        """
+        ...
+
+    async def consume(self, token_hash: str) -> RefreshSessionDTO | None:
+        """Атомарно извлекает и удаляет сессию (одноразовое использование).
+
+        Args:
+            token_hash: Хеш токена обновления.
+
+        Returns:
+            RefreshSessionDTO | None: Сессия или `None`, если она не найдена,
+            истекла или уже использована.
+
+        Raises:
+            SessionStoreUnavailableError: Если хранилище недоступно: отказ
+                хранилища не выдаётся за недействительный токен.
+        """
+        ...
+
+    async def revoke_user(self, user_id: int) -> int:
+        """Отзывает все сессии пользователя.
+
+        Args:
+            user_id: Идентификатор пользователя.
+
+        Returns:
+            int: Количество отозванных сессий.
+
+        Raises:
+            SessionStoreUnavailableError: Если хранилище недоступно и сессии
+                не отозваны.
+        """
+        ...
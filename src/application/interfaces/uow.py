@@ -5,6 +5,7 @@ Unit of Work объединяет репозитории и управляет 
 commit/rollback.
 """
 
+from enum import Enum
 from typing import Protocol, Self
 from types import TracebackType
 from application.interfaces.repositories import (
@@ -14,6 +15,21 @@ from application.interfaces.repositories import (
 )
 
 
+class Durability(str, Enum):
+    """Требования к долговечности фиксации транзакции.
+
+    Attributes:
+        FULL: Commit возвращается после записи WAL на диск (по умолчанию).
+        RELAXED: Commit не ждёт записи WAL на диск. При падении БД можно
+            потерять последние такие транзакции (но не нарушить целостность),
+            поэтому режим подходит только для записей, потеря которых
+            безвредна, например служебных отметок доставки outbox.
+    """
+
+    FULL = "full"
+    RELAXED = "relaxed"
+
+
 class UnitOfWorkProtocol(Protocol):
     """Протокол unit-of-work с набором репозиториев и транзакциями."""
 
@@ -49,6 +65,16 @@ class UnitOfWorkProtocol(Protocol):
         """
         ...
 
+    async def set_durability(self, durability: Durability) -> None:
+        """Задаёт долговечность фиксации текущей транзакции.
+
+        Действует до commit/rollback текущей транзакции.
+
+        Args:
+            durability: Требуемая долговечность.
+        """
+        ...
+
     async def commit(self) -> None:
         """Фиксирует транзакцию."""
         ...
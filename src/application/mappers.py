@@ -26,6 +26,8 @@ def order_to_dto(order: Order) -> OrderDTO:
         total_price=order.total_price,
         status=order.status,
         created_at=order.created_at,
+        updated_at=order.updated_at,
+        version=order.version,
     )
 
 
@@ -0,0 +1,167 @@
+"""Формат записи заказа в кеше.
+
+Запись хранится строкой `<version>|<user_id>|<json>`. Заголовок из версии и
+владельца позволяет ответить на условный запрос (`If-None-Match`), проверить
+доступ и сравнить версии при записи без разбора JSON, а сам JSON содержит
+полный снимок `OrderDTO`.
+"""
+
+import json
+from collections.abc import Iterable
+from datetime import datetime
+from decimal import Decimal
+from hashlib import blake2b
+from uuid import UUID
+
+from application.dtos.order import OrderDTO
+from domain.value_objects.order_status import OrderStatus
+
+_SEPARATOR = "|"
+
+
+def order_cache_key(order_id: UUID) -> str:
+    """Формирует ключ кеша для заказа.
+
+    Args:
+        order_id: Идентификатор заказа.
+
+    Returns:
+        str: Ключ кеша.
+    """
+    return f"order:{order_id}"
+
+
+def user_orders_index_key(user_id: int) -> str:
+    """Формирует ключ индекса заказов пользователя.
+
+    Индекс хранит идентификаторы заказов с весом `created_at` (timestamp),
+    сами заказы читаются по ключам `order_cache_key`.
+
+    Args:
+        user_id: Идентификатор пользователя.
+
+    Returns:
+        str: Ключ индекса.
+    """
+    return f"orders:user:{user_id}"
+
+
+def version_etag(version: int) -> str:
+    """Формирует сильный ETag по версии заказа.
+
+    Args:
+        version: Версия заказа.
+
+    Returns:
+        str: ETag в кавычках (формат заголовка `ETag`).
+    """
+    return f'"{version}"'
+
+
+def parse_etag_version(etag: str) -> int | None:
+    """Извлекает версию заказа из ETag (например, из заголовка `If-Match`).
+
+    Args:
+        etag: ETag в формате `version_etag`.
+
+    Returns:
+        int | None: Версия или `None`, если тег имеет чужой формат.
+    """
+    value = etag.strip().removeprefix("W/").strip('"')
+    # `isdigit` без `isascii` пропускает «²» и цифры других алфавитов.
+    if not (value.isascii() and value.isdigit()):
+        return None
+    return int(value)
+
+
+def order_etag(dto: OrderDTO) -> str:
+    """Вычисляет ETag заказа.
+
+    Args:
+        dto: DTO заказа.
+
+    Returns:
+        str: ETag в кавычках.
+    """
+    return version_etag(dto.version)
+
+
+def order_list_etag(dtos: Iterable[OrderDTO]) -> str:
+    """Вычисляет ETag списка заказов по идентификаторам и версиям элементов.
+
+    Args:
+        dtos: DTO заказов в порядке выдачи.
+
+    Returns:
+        str: ETag в кавычках.
+    """
+    hasher = blake2b(digest_size=8)
+    for dto in dtos:
+        hasher.update(f"{dto.id}:{dto.version};".encode())
+    return f'"{hasher.hexdigest()}"'
+
+
+def dump_order_entry(dto: OrderDTO) -> str:
+    """Сериализует DTO заказа в запись кеша.
+
+    Args:
+        dto: DTO заказа.
+
+    Returns:
+        str: Запись вида `<version>|<user_id>|<json>`.
+    """
+    body = json.dumps(
+        {
+            "id": str(dto.id),
+            "user_id": dto.user_id,
+            "items": dto.items,
+            "total_price": str(dto.total_price),
+            "status": dto.status.value,
+            "created_at": dto.created_at.isoformat(),
+            "updated_at": dto.updated_at.isoformat(),
+            "version": dto.version,
+        }
+    )
+    return f"{dto.version}{_SEPARATOR}{dto.user_id}{_SEPARATOR}{body}"
+
+
+def read_order_entry_header(data: str) -> tuple[int, int]:
+    """Извлекает версию и владельца из записи кеша без разбора JSON.
+
+    Args:
+        data: Запись кеша.
+
+    Returns:
+        tuple[int, int]: Версия заказа и идентификатор владельца.
+
+    Raises:
+        ValueError: Если запись имеет неверный формат.
+    """
+    version, user_id, _ = data.split(_SEPARATOR, 2)
+    return int(version), int(user_id)
+
+
+def load_order_entry(data: str) -> OrderDTO:
+    """Десериализует запись кеша в DTO заказа.
+
+    Args:
+        data: Запись кеша.
+
+    Returns:
+        OrderDTO: DTO заказа.
+
+    Raises:
+        ValueError: Если запись имеет неверный формат.
+    """
+    _, _, body = data.split(_SEPARATOR, 2)
+    raw = json.loads(body)
+    return OrderDTO(
+        id=UUID(raw["id"]),
+        user_id=raw["user_id"],
+        items=raw["items"],
+        total_price=Decimal(str(raw["total_price"])),
+        status=OrderStatus(raw["status"]),
+        created_at=datetime.fromisoformat(raw["created_at"]),
+        updated_at=datetime.fromisoformat(raw["updated_at"]),
+        version=raw["version"],
+    )
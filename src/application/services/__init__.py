@@ -1,5 +1,10 @@
 """Публичные сервисы прикладного слоя."""
 
-from application.services.security import PasswordHasher, TokenService
+from application.services.jwt_keys import JWTKeyring
+from application.services.security import (
+    PasswordHasher,
+    PasswordHashProfile,
+    TokenService,
+)
 
-__all__ = ["PasswordHasher", "TokenService"]
+__all__ = ["JWTKeyring", "PasswordHashProfile", "PasswordHasher", "TokenService"]
@@ -0,0 +1,337 @@
+"""Ключи подписи JWT: загрузка из JWKS-файла, подпись и проверка подписи.
+
+Поддерживаемые ключи:
+- `kty: oct` — HMAC (`HS256`/`HS384`/`HS512`);
+- `kty: EC`, `crv: P-256` — ECDSA (`ES256`);
+- `kty: OKP`, `crv: Ed25519` — EdDSA (`EdDSA`).
+
+Ключевой материал разбирается один раз при загрузке набора ключей, поэтому
+проверка подписи не тратит время на разбор ключей и списка алгоритмов.
+Алгоритм закреплён за ключом: токен с чужим `alg` для данного `kid`
+отклоняется.
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import re
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Protocol
+
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+from cryptography.hazmat.primitives.asymmetric.utils import (
+    decode_dss_signature,
+    encode_dss_signature,
+)
+
+_HMAC_DIGESTS: dict[str, Callable[[], Any]] = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512,
+}
+_ES256_COORDINATE_SIZE = 32
+_B64URL_ALPHABET = re.compile(r"[A-Za-z0-9_-]*")
+
+
+def b64url_encode(data: bytes) -> str:
+    """Кодирует байты в base64url без выравнивания (`=`)."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def b64url_decode(data: str) -> bytes:
+    """Декодирует base64url без выравнивания.
+
+    Декодирование строгое: `base64.urlsafe_b64decode` молча пропускает
+    символы вне алфавита, и к подписи токена можно было бы дописать мусор.
+
+    Raises:
+        ValueError: Если строка не является корректным base64url.
+    """
+    if len(data) % 4 == 1 or not _B64URL_ALPHABET.fullmatch(data):
+        raise ValueError("Некорректная строка base64url")
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+class JWTKey(Protocol):
+    """Ключ подписи JWT с закреплённым алгоритмом."""
+
+    kid: str | None
+    algorithm: str
+
+    @property
+    def can_sign(self) -> bool:
+        """Есть ли у ключа приватная часть для подписи."""
+        ...
+
+    def sign(self, signing_input: bytes) -> bytes:
+        """Подписывает `header.payload` токена.
+
+        Args:
+            signing_input: Байты `base64url(header) + "." + base64url(payload)`.
+
+        Returns:
+            bytes: Подпись в формате JWS.
+        """
+        ...
+
+    def verify(self, signing_input: bytes, signature: bytes) -> bool:
+        """Проверяет подпись токена.
+
+        Args:
+            signing_input: Байты `base64url(header) + "." + base64url(payload)`.
+            signature: Подпись в формате JWS.
+
+        Returns:
+            bool: `True`, если подпись верна.
+        """
+        ...
+
+
+@dataclass(slots=True, kw_only=True)
+class HMACKey:
+    """Симметричный ключ HMAC (`HS256`/`HS384`/`HS512`)."""
+
+    kid: str | None
+    algorithm: str
+    secret: bytes = field(repr=False)
+    _template: "hmac.HMAC" = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Готовит HMAC-шаблон с уже применённым ключом."""
+        digest = _HMAC_DIGESTS.get(self.algorithm)
+        if digest is None:
+            raise ValueError(
+                f"Алгоритм {self.algorithm} не поддерживается для HMAC"
+            )
+        self._template = hmac.new(self.secret, digestmod=digest)
+
+    @property
+    def can_sign(self) -> bool:
+        """Симметричный ключ всегда может подписывать."""
+        return True
+
+    def sign(self, signing_input: bytes) -> bytes:
+        """Вычисляет HMAC от `signing_input`."""
+        mac = self._template.copy()
+        mac.update(signing_input)
+        return mac.digest()
+
+    def verify(self, signing_input: bytes, signature: bytes) -> bool:
+        """Сравнивает HMAC за постоянное время."""
+        return hmac.compare_digest(self.sign(signing_input), signature)
+
+
+@dataclass(slots=True, kw_only=True)
+class ES256Key:
+    """Ключ ECDSA P-256 (`ES256`)."""
+
+    kid: str | None
+    public_key: ec.EllipticCurvePublicKey
+    private_key: ec.EllipticCurvePrivateKey | None = field(
+        default=None, repr=False
+    )
+    algorithm: str = "ES256"
+
+    @property
+    def can_sign(self) -> bool:
+        """Подпись возможна только при наличии приватного ключа."""
+        return self.private_key is not None
+
+    def sign(self, signing_input: bytes) -> bytes:
+        """Подписывает и переводит DER-подпись в формат JWS (`r || s`)."""
+        if self.private_key is None:
+            raise ValueError(f"Ключ {self.kid} не содержит приватной части")
+        der = self.private_key.sign(signing_input, ec.ECDSA(hashes.SHA256()))
+        r, s = decode_dss_signature(der)
+        return r.to_bytes(_ES256_COORDINATE_SIZE, "big") + s.to_bytes(
+            _ES256_COORDINATE_SIZE, "big"
+        )
+
+    def verify(self, signing_input: bytes, signature: bytes) -> bool:
+        """Проверяет подпись в формате JWS (`r || s`)."""
+        if len(signature) != 2 * _ES256_COORDINATE_SIZE:
+            return False
+        der = encode_dss_signature(
+            int.from_bytes(signature[:_ES256_COORDINATE_SIZE], "big"),
+            int.from_bytes(signature[_ES256_COORDINATE_SIZE:], "big"),
+        )
+        try:
+            self.public_key.verify(der, signing_input, ec.ECDSA(hashes.SHA256()))
+        except InvalidSignature:
+            return False
+        return True
+
+
+@dataclass(slots=True, kw_only=True)
+class EdDSAKey:
+    """Ключ Ed25519 (`EdDSA`)."""
+
+    kid: str | None
+    public_key: ed25519.Ed25519PublicKey
+    private_key: ed25519.Ed25519PrivateKey | None = field(
+        default=None, repr=False
+    )
+    algorithm: str = "EdDSA"
+
+    @property
+    def can_sign(self) -> bool:
+        """Подпись возможна только при наличии приватного ключа."""
+        return self.private_key is not None
+
+    def sign(self, signing_input: bytes) -> bytes:
+        """Подписывает `signing_input` ключом Ed25519."""
+        if self.private_key is None:
+            raise ValueError(f"Ключ {self.kid} не содержит приватной части")
+        return self.private_key.sign(signing_input)
+
+    def verify(self, signing_input: bytes, signature: bytes) -> bool:
+        """Проверяет подпись Ed25519."""
+        try:
+            self.public_key.verify(signature, signing_input)
+        except InvalidSignature:
+            return False
+        return True
+
+
+def _b64url_int(value: str) -> int:
+    """Декодирует целое число из base64url (координаты и скаляры JWK)."""
+    return int.from_bytes(b64url_decode(value), "big")
+
+
+def parse_jwk(jwk: Mapping[str, Any]) -> JWTKey:
+    """Создаёт ключ подписи из JWK.
+
+    Args:
+        jwk: Описание ключа в формате JWK.
+
+    Returns:
+        JWTKey: Ключ с закреплённым алгоритмом.
+
+    Raises:
+        ValueError: Если тип ключа, кривая или алгоритм не поддерживаются.
+    """
+    kid = jwk.get("kid")
+    kty = jwk.get("kty")
+    alg = jwk.get("alg")
+    key: JWTKey
+    if kty == "oct":
+        key = HMACKey(
+            kid=kid, algorithm=alg or "HS256", secret=b64url_decode(jwk["k"])
+        )
+    elif kty == "EC" and jwk.get("crv") == "P-256":
+        public_key = ec.EllipticCurvePublicNumbers(
+            _b64url_int(jwk["x"]), _b64url_int(jwk["y"]), ec.SECP256R1()
+        ).public_key()
+        private_key = (
+            ec.derive_private_key(_b64url_int(jwk["d"]), ec.SECP256R1())
+            if "d" in jwk
+            else None
+        )
+        key = ES256Key(kid=kid, public_key=public_key, private_key=private_key)
+    elif kty == "OKP" and jwk.get("crv") == "Ed25519":
+        key = EdDSAKey(
+            kid=kid,
+            public_key=ed25519.Ed25519PublicKey.from_public_bytes(
+                b64url_decode(jwk["x"])
+            ),
+            private_key=(
+                ed25519.Ed25519PrivateKey.from_private_bytes(
+                    b64url_decode(jwk["d"])
+                )
+                if "d" in jwk
+                else None
+            ),
+        )
+    else:
+        raise ValueError(f"Неподдерживаемый JWK: kty={kty}, crv={jwk.get('crv')}")
+    if alg is not None and alg != key.algorithm:
+        raise ValueError(f"Алгоритм {alg} не соответствует ключу {kid}")
+    return key
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class JWTKeyring:
+    """Набор ключей подписи с поиском по `kid`.
+
+    Attributes:
+        keys: Ключи по `kid` (`None` — ключ для токенов без `kid`).
+        active_kid: `kid` ключа, которым подписываются новые токены.
+    """
+
+    keys: Mapping[str | None, JWTKey]
+    active_kid: str | None
+
+    def __post_init__(self) -> None:
+        """Проверяет, что активный ключ существует и умеет подписывать."""
+        active = self.keys.get(self.active_kid)
+        if active is None or not active.can_sign:
+            raise ValueError(
+                f"Активный ключ {self.active_kid} отсутствует или не содержит "
+                "приватной части"
+            )
+
+    @property
+    def active_key(self) -> JWTKey:
+        """Ключ для подписи новых токенов."""
+        return self.keys[self.active_kid]
+
+    def get(self, kid: str | None) -> JWTKey | None:
+        """Возвращает ключ по `kid` (или `None`, если ключ неизвестен)."""
+        return self.keys.get(kid)
+
+    @classmethod
+    def from_secret(cls, secret: str, algorithm: str) -> "JWTKeyring":
+        """Создаёт набор из одного HMAC-ключа для токенов без `kid`.
+
+        Args:
+            secret: Секретный ключ подписи.
+            algorithm: Алгоритм HMAC (`HS256`/`HS384`/`HS512`).
+
+        Returns:
+            JWTKeyring: Набор ключей.
+        """
+        key = HMACKey(kid=None, algorithm=algorithm, secret=secret.encode())
+        return cls(keys={None: key}, active_kid=None)
+
+    @classmethod
+    def from_jwks_file(
+        cls,
+        path: str | Path,
+        *,
+        active_kid: str | None = None,
+        fallback: JWTKey | None = None,
+    ) -> "JWTKeyring":
+        """Загружает набор ключей из JWKS-файла (`{"keys": [...]}`).
+
+        Args:
+            path: Путь к файлу.
+            active_kid: `kid` ключа для подписи; по умолчанию — первый ключ с
+                приватной частью.
+            fallback: Ключ для токенов без `kid` (например, прежний общий секрет
+                на время ротации).
+
+        Returns:
+            JWTKeyring: Набор ключей.
+
+        Raises:
+            ValueError: Если файл содержит некорректные ключи.
+        """
+        document = json.loads(Path(path).read_text(encoding="utf-8"))
+        keys: dict[str | None, JWTKey] = {}
+        for jwk in document["keys"]:
+            key = parse_jwk(jwk)
+            if key.kid is None:
+                raise ValueError("Ключ в JWKS-файле должен содержать kid")
+            keys[key.kid] = key
+        if fallback is not None:
+            keys[None] = fallback
+        if active_kid is None:
+            active_kid = next(
+                (kid for kid, key in keys.items() if kid and key.can_sign), None
+            )
+        return cls(keys=keys, active_kid=active_kid)
@@ -1,20 +1,106 @@
 """Сервисы безопасности: хеширование паролей и JWT-токены."""
 
+import hashlib
+import json
+import math
+import secrets
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from typing import Any
 
-from jose import JWTError, jwt
 from passlib.context import CryptContext
+from passlib.hash import argon2
 
 from application.dtos.auth import TokenDTO, TokenDataDTO
 from application.exceptions import InvalidCredentialsError
+from application.services.jwt_keys import JWTKeyring, b64url_decode, b64url_encode
+
+PASSWORD_HASH_SCHEMES = ("pbkdf2_sha256", "argon2")
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class PasswordHashProfile:
+    """Профиль хеширования паролей: схема и её параметры стоимости.
+
+    Attributes:
+        scheme: Схема для новых хешей (`pbkdf2_sha256` или `argon2`).
+        pbkdf2_rounds: Число итераций PBKDF2-SHA256.
+        argon2_time_cost: Число проходов Argon2.
+        argon2_memory_cost: Объём памяти Argon2 в КиБ.
+        argon2_parallelism: Число потоков Argon2.
+    """
+
+    scheme: str = "pbkdf2_sha256"
+    pbkdf2_rounds: int = 29_000
+    argon2_time_cost: int = 2
+    argon2_memory_cost: int = 19_456
+    argon2_parallelism: int = 1
+
+    def context_options(self) -> dict[str, Any]:
+        """Возвращает параметры `CryptContext` для профиля.
+
+        Хеши со стоимостью ниже заданной (и хеши других схем) помечаются
+        устаревшими, поэтому `needs_update` для них возвращает `True`.
+
+        Returns:
+            dict[str, Any]: Именованные аргументы `CryptContext`.
+
+        Raises:
+            ValueError: Если схема не поддерживается или для неё не установлен
+                бэкенд.
+        """
+        if self.scheme not in PASSWORD_HASH_SCHEMES:
+            raise ValueError(f"Схема хеширования {self.scheme} не поддерживается")
+        if self.scheme == "argon2" and not argon2.has_backend():
+            raise ValueError("Для схемы argon2 требуется пакет argon2-cffi")
+        # Хеши остальных доступных схем продолжают проверяться до пересчёта.
+        schemes = [
+            scheme
+            for scheme in PASSWORD_HASH_SCHEMES
+            if scheme != self.scheme
+            and (scheme != "argon2" or argon2.has_backend())
+        ]
+        schemes.insert(0, self.scheme)
+        options: dict[str, Any] = {
+            "schemes": schemes,
+            "default": self.scheme,
+            "deprecated": "auto",
+            "pbkdf2_sha256__rounds": self.pbkdf2_rounds,
+            "pbkdf2_sha256__min_rounds": self.pbkdf2_rounds,
+        }
+        if self.scheme == "argon2":
+            options.update(
+                argon2__rounds=self.argon2_time_cost,
+                argon2__min_rounds=self.argon2_time_cost,
+                argon2__memory_cost=self.argon2_memory_cost,
+                argon2__parallelism=self.argon2_parallelism,
+            )
+        return options
 
 
 class PasswordHasher:
-    """Сервис хеширования и проверки паролей."""
+    """Сервис хеширования и проверки паролей.
+
+    Новые хеши создаются по текущему профилю. Хеши прежних схем и хеши с
+    меньшей стоимостью по-прежнему проверяются, а `verify_and_update`
+    возвращает для них новый хеш, чтобы его можно было сохранить при входе.
+
+    Для неизвестных email `dummy_verify` тратит на проверку столько же времени,
+    сколько проверка настоящего хеша, чтобы по времени ответа нельзя было
+    определить, зарегистрирован ли email.
+    """
 
-    def __init__(self) -> None:
-        """Создаёт хешер паролей с настроенным `CryptContext`."""
-        self._context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+    def __init__(self, profile: PasswordHashProfile | None = None) -> None:
+        """Создаёт хешер паролей с настроенным `CryptContext`.
+
+        Args:
+            profile: Профиль хеширования (по умолчанию PBKDF2-SHA256).
+        """
+        self.profile = profile or PasswordHashProfile()
+        self._context = CryptContext(**self.profile.context_options())
+        self._dummy_hash = self._context.hash(secrets.token_urlsafe(16))
 
     def hash(self, password: str) -> str:
         """Хеширует пароль.
@@ -39,23 +125,75 @@ class PasswordHasher:
         """
         return self._context.verify(password, hashed_password)
 
+    def verify_and_update(
+        self, password: str, hashed_password: str
+    ) -> tuple[bool, str | None]:
+        """Проверяет пароль и при необходимости пересчитывает хеш.
+
+        Args:
+            password: Пароль в открытом виде.
+            hashed_password: Сохранённый хеш.
+
+        Returns:
+            tuple[bool, str | None]: Результат проверки и новый хеш, если
+            сохранённый хеш устарел (иначе `None`).
+        """
+        return self._context.verify_and_update(password, hashed_password)
+
+    def needs_update(self, hashed_password: str) -> bool:
+        """Проверяет, нужно ли пересчитать хеш по текущему профилю.
+
+        Args:
+            hashed_password: Сохранённый хеш.
+
+        Returns:
+            bool: `True`, если схема или стоимость хеша устарели.
+        """
+        return self._context.needs_update(hashed_password)
+
+    def dummy_verify(self, password: str) -> bool:
+        """Выполняет проверку пароля по фиктивному хешу текущего профиля.
+
+        Args:
+            password: Пароль в открытом виде.
+
+        Returns:
+            bool: Всегда `False`.
+        """
+        self._context.verify(password, self._dummy_hash)
+        return False
+
 
 class TokenService:
-    """Сервис создания и проверки JWT-токенов."""
+    """Сервис создания и проверки JWT-токенов.
+
+    Токены подписываются активным ключом из `JWTKeyring`, а проверяются ключом,
+    найденным по `kid` из заголовка токена. Успешно проверенные токены
+    кешируются в ограниченном LRU до истечения их срока действия, поэтому
+    повторная проверка того же токена не пересчитывает подпись.
+    """
 
     def __init__(
-        self, *, secret_key: str, algorithm: str, expires_delta: timedelta
+        self,
+        *,
+        keyring: JWTKeyring,
+        expires_delta: timedelta,
+        cache_size: int = 10_000,
     ) -> None:
-        """Создаёт сервис JWT с заданными параметрами подписи.
+        """Создаёт сервис JWT с заданным набором ключей.
 
         Args:
-            secret_key: Секретный ключ подписи.
-            algorithm: Алгоритм подписи JWT.
+            keyring: Набор ключей подписи.
             expires_delta: Время жизни токена.
+            cache_size: Максимальное число проверенных токенов в кеше
+                (`0` отключает кеш).
         """
-        self.secret_key = secret_key
-        self.algorithm = algorithm
+        self.keyring = keyring
         self.expires_delta = expires_delta
+        self.cache_size = cache_size
+        self._verified: OrderedDict[str, tuple[TokenDataDTO, float]] = (
+            OrderedDict()
+        )
 
     def create_access_token(self, *, user_id: int, email: str) -> TokenDTO:
         """Создаёт токен доступа.
@@ -67,12 +205,43 @@ class TokenService:
         Returns:
             TokenDTO: DTO с токеном доступа.
         """
+        key = self.keyring.active_key
+        header: dict[str, str] = {"alg": key.algorithm, "typ": "JWT"}
+        if key.kid is not None:
+            header["kid"] = key.kid
         expire = datetime.now(UTC) + self.expires_delta
-        to_encode = {"sub": str(user_id), "email": email, "exp": expire}
-        encoded_jwt = jwt.encode(
-            to_encode, self.secret_key, algorithm=self.algorithm
+        payload = {
+            "sub": str(user_id),
+            "email": email,
+            "exp": int(expire.timestamp()),
+        }
+        signing_input = f"{b64url_encode(_json_bytes(header))}.{b64url_encode(_json_bytes(payload))}"
+        signature = key.sign(signing_input.encode("ascii"))
+        return TokenDTO(
+            access_token=f"{signing_input}.{b64url_encode(signature)}"
         )
-        return TokenDTO(access_token=encoded_jwt)
+
+    @staticmethod
+    def create_refresh_token() -> tuple[str, str]:
+        """Создаёт непрозрачный токен обновления.
+
+        Returns:
+            tuple[str, str]: Токен для клиента и его хеш для хранилища сессий.
+        """
+        token = secrets.token_urlsafe(32)
+        return token, TokenService.hash_refresh_token(token)
+
+    @staticmethod
+    def hash_refresh_token(token: str) -> str:
+        """Вычисляет хеш токена обновления (ключ сессии в хранилище).
+
+        Args:
+            token: Токен обновления.
+
+        Returns:
+            str: SHA-256 токена в hex.
+        """
+        return hashlib.sha256(token.encode()).hexdigest()
 
     def decode_token(self, token: str) -> TokenDataDTO:
         """Декодирует и валидирует JWT-токен.
@@ -83,21 +252,90 @@ class TokenService:
         Returns:
             TokenDataDTO: Данные, извлечённые из токена.
 
+        Raises:
+            InvalidCredentialsError: Если токен невалиден или не содержит `sub`.
+        """
+        now = time.time()
+        cached = self._verified.get(token)
+        if cached is not None:
+            data, expires_at = cached
+            if expires_at > now:
+                self._verified.move_to_end(token)
+                return data
+            del self._verified[token]
+
+        data, expires_at = self._verify(token, now)
+        if self.cache_size > 0:
+            self._verified[token] = (data, expires_at)
+            if len(self._verified) > self.cache_size:
+                self._verified.popitem(last=False)
+        return data
+
+    def _verify(self, token: str, now: float) -> tuple[TokenDataDTO, float]:
+        """Проверяет подпись и срок действия токена.
+
+        Args:
+            token: JWT-токен доступа.
+            now: Текущее время (Unix timestamp).
+
+        Returns:
+            tuple[TokenDataDTO, float]: Данные токена и момент истечения (`exp`).
+
         Raises:
             InvalidCredentialsError: Если токен невалиден или не содержит `sub`.
         """
         try:
-            payload = jwt.decode(
-                token, self.secret_key, algorithms=[self.algorithm]
-            )
-            user_id = payload.get("sub")
-            email = payload.get("email")
-            if user_id is None:
-                raise InvalidCredentialsError(
-                    "В токене отсутствует subject (sub)"
-                )
-            return TokenDataDTO(user_id=int(user_id), email=email)
-        except JWTError as exc:
+            signing_input, _, signature = token.rpartition(".")
+            header_segment, _, payload_segment = signing_input.partition(".")
+            header = json.loads(b64url_decode(header_segment))
+            # Расширения из `crit` не поддерживаются и по RFC 7515 такой
+            # токен нужно отклонить.
+            if not isinstance(header, dict) or "crit" in header:
+                raise ValueError("Некорректный заголовок токена")
+            key = self.keyring.get(header.get("kid"))
+            if key is None or header.get("alg") != key.algorithm:
+                raise ValueError("Неизвестный ключ или алгоритм подписи")
+            if not key.verify(
+                signing_input.encode("ascii"), b64url_decode(signature)
+            ):
+                raise ValueError("Неверная подпись токена")
+            payload = json.loads(b64url_decode(payload_segment))
+            if not isinstance(payload, dict):
+                raise ValueError("Некорректное содержимое токена")
+            expires_at = _numeric_date(payload["exp"])
+            not_before = _numeric_date(payload.get("nbf", 0))
+        except (KeyError, TypeError, ValueError) as exc:
+            raise InvalidCredentialsError(
+                "Не удалось проверить учётные данные"
+            ) from exc
+        if expires_at <= now or not_before > now:
+            raise InvalidCredentialsError("Не удалось проверить учётные данные")
+
+        user_id = payload.get("sub")
+        if user_id is None:
+            raise InvalidCredentialsError("В токене отсутствует subject (sub)")
+        try:
+            data = TokenDataDTO(user_id=int(user_id), email=payload.get("email"))
+        except (TypeError, ValueError) as exc:
             raise InvalidCredentialsError(
                 "Не удалось проверить учётные данные"
             ) from exc
+        return data, expires_at
+
+
+def _numeric_date(value: Any) -> float:
+    """Проверяет значение NumericDate (`exp`/`nbf`) из содержимого токена.
+
+    Raises:
+        ValueError: Если значение не является конечным числом.
+    """
+    if isinstance(value, bool) or not isinstance(value, int | float):
+        raise ValueError("Некорректное время в токене")
+    if not math.isfinite(value):
+        raise ValueError("Некорректное время в токене")
+    return float(value)
+
+
+def _json_bytes(value: dict[str, Any]) -> bytes:
+    """Сериализует заголовок/содержимое JWT в компактный JSON."""
+    return json.dumps(value, separators=(",", ":")).encode()
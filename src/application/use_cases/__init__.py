@@ -8,6 +8,9 @@ from application.use_cases.get_order import GetOrderUseCase
 from application.use_cases.dispatch_outbox import DispatchOutboxUseCase
 from application.use_cases.list_user_orders import ListUserOrdersUseCase
 from application.use_cases.login_user import LoginUserUseCase
+from application.use_cases.logout_user import LogoutUserUseCase
+from application.use_cases.prune_outbox import PruneOutboxUseCase
+from application.use_cases.refresh_token import RefreshTokenUseCase
 from application.use_cases.register_user import RegisterUserUseCase
 from application.use_cases.update_order_status import (
     UpdateOrderStatusUseCase,
@@ -19,6 +22,9 @@ __all__ = [
     "GetOrderUseCase",
     "ListUserOrdersUseCase",
     "LoginUserUseCase",
+    "LogoutUserUseCase",
+    "PruneOutboxUseCase",
+    "RefreshTokenUseCase",
     "RegisterUserUseCase",
     "UpdateOrderStatusUseCase",
 ]
@@ -1,25 +1,34 @@
 """Use-case создания заказа.
 
 Сценарий:
-- создаёт заказ в БД;
-- пишет событие в outbox (для надёжной доставки);
-- кеширует заказ в Redis;
+- создаёт заказ в БД и в той же транзакции пишет событие в outbox (для
+  надёжной доставки) через `OrderWriterProtocol`;
+- кеширует заказ в Redis и добавляет его в индекс заказов пользователя;
 - пытается сразу опубликовать событие `new_order` в брокер сообщений.
+
+Отметка о публикации фиксируется с `bookkeeping_durability` (по умолчанию
+без ожидания fsync): если она потеряется при сбое БД, событие будет
+опубликовано повторно из outbox, а потребитель отбросит дубль по `event_id`.
 """
 
-import json
 from dataclasses import dataclass
-from uuid import UUID, uuid4
 
 from loguru import logger
 
 from application.dtos.order import CreateOrderDTO, OrderDTO
+from application.events import new_order_event
 from application.interfaces.cache import CacheProtocol
 from application.interfaces.message_broker import MessageBrokerPublisherProtocol
-from application.interfaces.uow import UnitOfWorkProtocol
+from application.interfaces.order_writer import OrderWriterProtocol
+from application.interfaces.uow import Durability, UnitOfWorkProtocol
 from application.mappers import order_to_dto
-from domain.entities.outbox_event import OutboxEvent
+from application.order_cache import (
+    dump_order_entry,
+    order_cache_key,
+    user_orders_index_key,
+)
 from domain.entities.order import Order
+from domain.identifiers import new_id
 
 
 @dataclass(slots=True, kw_only=True)
@@ -27,9 +36,11 @@ class CreateOrderUseCase:
     """Сценарий создания заказа."""
 
     uow: UnitOfWorkProtocol
+    order_writer: OrderWriterProtocol
     cache: CacheProtocol
     message_broker: MessageBrokerPublisherProtocol
     cache_ttl: int
+    bookkeeping_durability: Durability = Durability.RELAXED
 
     async def __call__(self, payload: CreateOrderDTO) -> OrderDTO:
         """Создаёт заказ и инициирует публикацию события.
@@ -41,36 +52,34 @@ class CreateOrderUseCase:
             OrderDTO: Созданный заказ в виде DTO.
         """
         order = Order(
-            id=uuid4(),
+            id=new_id(),
             user_id=payload.user_id,
             items=payload.items,
             total_price=payload.total_price,
         )
 
-        event_id = uuid4()
-        outbox_payload = {
-            "event": "new_order",
-            "order_id": str(order.id),
-            "user_id": order.user_id,
-            "event_id": str(event_id),
-        }
-
-        async with self.uow:
-            created = await self.uow.order_repo.create(order)
-            event = await self.uow.outbox_repo.add(
-                OutboxEvent(
-                    id=event_id, event_type="new_order", payload=outbox_payload
-                )
-            )
-            event_id = event.id
-            await self.uow.commit()
+        event = new_order_event(order)
+        outbox_payload = event.payload
+        event_id = event.id
+        created = await self.order_writer.create(order, event)
 
         dto = order_to_dto(created)
-        cache_key = self._cache_key(dto.id)
-        await self.cache.set(cache_key, self._serialize(dto), ttl=self.cache_ttl)
+        await self.cache.set_versioned(
+            order_cache_key(dto.id),
+            dump_order_entry(dto),
+            version=dto.version,
+            ttl=self.cache_ttl,
+        )
+        await self.cache.add_to_index(
+            user_orders_index_key(dto.user_id),
+            str(dto.id),
+            score=dto.created_at.timestamp(),
+            ttl=self.cache_ttl,
+        )
         try:
             await self.message_broker.publish_new_order(outbox_payload)
             async with self.uow:
+                await self.uow.set_durability(self.bookkeeping_durability)
                 await self.uow.outbox_repo.mark_processed(event_id)
                 await self.uow.commit()
         except Exception as exc:
@@ -79,34 +88,3 @@ class CreateOrderUseCase:
                 extra={"error": str(exc), "event_id": str(event_id)},
             )
         return dto
-
-    def _cache_key(self, order_id: UUID) -> str:
-        """Формирует ключ кеша для заказа.
-
-        Args:
-            order_id: Идентификатор заказа.
-
-        Returns:
-            str: Ключ кеша.
-        """
-        return f"order:{order_id}"
-
-    def _serialize(self, dto: OrderDTO) -> str:
-        """Сериализует DTO заказа в JSON-строку для кеша.
-
-        Args:
-            dto: DTO заказа.
-
-        Returns:
-            str: JSON-строка.
-        """
-        return json.dumps(
-            {
-                "id": str(dto.id),
-                "user_id": dto.user_id,
-                "items": dto.items,
-                "total_price": str(dto.total_price),
-                "status": dto.status.value,
-                "created_at": dto.created_at.isoformat(),
-            }
-        )
@@ -2,14 +2,35 @@
 
 Сценарий выбирает необработанные события из БД и публикует их в брокер.
 Используется для надёжной доставки сообщений при временных сбоях брокера.
+Транзакция с отметками о публикации фиксируется с `durability` (по умолчанию
+без ожидания fsync): потерянная отметка приводит лишь к повторной публикации.
+
+Маршрут публикации определяется по типу события (`EventRouteRegistry`);
+события пачки группируются по маршрутам и публикуются одной пачкой на
+маршрут. Событие незарегистрированного типа сразу переводится в dead letter,
+чтобы не выбираться снова и не вытеснять из пачки остальные события.
+
+Ошибка публикации одного события не прерывает пачку: у события
+увеличивается счётчик попыток, следующая попытка откладывается
+экспоненциально (после n-й неудачной попытки — на
+`retry_base_seconds * 2**(n - 1)`, не больше `retry_max_seconds`), а после
+`max_attempts` неудачных попыток событие переводится в dead letter и больше
+не выбирается.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+from loguru import logger
 
+from application.events import EventRoute, EventRouteRegistry
 from application.interfaces.message_broker import MessageBrokerPublisherProtocol
-from application.interfaces.uow import UnitOfWorkProtocol
+from application.interfaces.uow import Durability, UnitOfWorkProtocol
+from domain.entities.outbox_event import OutboxEvent
+
+_MAX_ERROR_LENGTH = 1_000
 
 
 @dataclass(slots=True, kw_only=True)
@@ -18,7 +39,12 @@ class DispatchOutboxUseCase:
 
     uow: UnitOfWorkProtocol
     message_broker: MessageBrokerPublisherProtocol
+    routes: EventRouteRegistry
     batch_size: int = 100
+    durability: Durability = Durability.RELAXED
+    max_attempts: int = 10
+    retry_base_seconds: float = 5.0
+    retry_max_seconds: float = 3_600.0
 
     async def __call__(self) -> int:
         """Публикует пачку outbox-событий и помечает их обработанными.
@@ -27,14 +53,63 @@ class DispatchOutboxUseCase:
             int: Количество успешно обработанных событий.
         """
         async with self.uow:
+            await self.uow.set_durability(self.durability)
             pending = await self.uow.outbox_repo.list_pending(
                 limit=self.batch_size
             )
-            processed = 0
+            by_route: dict[EventRoute, list[OutboxEvent]] = {}
             for event in pending:
-                if event.event_type == "new_order":
-                    await self.message_broker.publish_new_order(event.payload)
-                    await self.uow.outbox_repo.mark_processed(event.id)
-                    processed += 1
+                route = self.routes.get(event.event_type)
+                if route is None:
+                    await self._dead_letter_unrouted(event)
+                    continue
+                by_route.setdefault(route, []).append(event)
+
+            processed = 0
+            for route, events in by_route.items():
+                errors = await self.message_broker.publish_many(route, events)
+                published = []
+                for event, error in zip(events, errors, strict=True):
+                    if error is None:
+                        published.append(event.id)
+                    else:
+                        await self._record_failure(event, error)
+                await self.uow.outbox_repo.mark_processed_many(published)
+                processed += len(published)
             await self.uow.commit()
             return processed
+
+    async def _dead_letter_unrouted(self, event: OutboxEvent) -> None:
+        """Переводит событие без маршрута публикации в dead letter."""
+        error = f"Нет маршрута для типа события {event.event_type!r}"
+        await self.uow.outbox_repo.record_failure(
+            event.id, error=error, retry_at=None
+        )
+        logger.error(
+            error,
+            extra={"event_id": str(event.id), "event_type": event.event_type},
+        )
+
+    async def _record_failure(self, event: OutboxEvent, exc: Exception) -> None:
+        """Откладывает следующую попытку или переводит событие в dead letter."""
+        attempts = event.attempts + 1
+        retry_at: datetime | None = None
+        if attempts < self.max_attempts:
+            delay = min(
+                self.retry_base_seconds * 2 ** (attempts - 1),
+                self.retry_max_seconds,
+            )
+            retry_at = datetime.now(UTC) + timedelta(seconds=delay)
+        await self.uow.outbox_repo.record_failure(
+            event.id, error=str(exc)[:_MAX_ERROR_LENGTH], retry_at=retry_at
+        )
+        logger.warning(
+            "Не удалось опубликовать outbox-событие",
+            extra={
+                "event_id": str(event.id),
+                "attempts": attempts,
+                "retry_at": retry_at.isoformat() if retry_at else None,
+                "dead_lettered": retry_at is None,
+                "error": str(exc),
+            },
+        )
@@ -1,13 +1,12 @@
 """Use-case получения заказа с кешированием.
 
 Сценарий пытается сначала отдать заказ из Redis (TTL управляется настройкой),
-а при промахе — загружает из БД и обновляет кеш.
+а при промахе — загружает из БД и обновляет кеш. Заполнение кеша версионное:
+снимок, прочитанный до параллельного обновления, не перезапишет более новую
+версию заказа.
 """
 
-import json
 from dataclasses import dataclass
-from datetime import datetime
-from decimal import Decimal
 from uuid import UUID
 from json import JSONDecodeError
 
@@ -16,7 +15,13 @@ from application.exceptions import OrderNotFoundError
 from application.mappers import order_to_dto
 from application.interfaces.cache import CacheProtocol
 from application.interfaces.uow import UnitOfWorkProtocol
-from domain.value_objects.order_status import OrderStatus
+from application.order_cache import (
+    dump_order_entry,
+    load_order_entry,
+    order_cache_key,
+    read_order_entry_header,
+    version_etag,
+)
 
 
 @dataclass(slots=True, kw_only=True)
@@ -40,11 +45,11 @@ class GetOrderUseCase:
         Raises:
             OrderNotFoundError: Если заказ не найден или недоступен пользователю.
         """
-        cache_key = self._cache_key(order_id)
+        cache_key = order_cache_key(order_id)
         cached = await self.cache.get(cache_key)
         if cached:
             try:
-                dto = self._deserialize(cached)
+                dto = load_order_entry(cached)
                 self._ensure_owner(dto, user_id=user_id)
                 return dto
             except (JSONDecodeError, KeyError, ValueError, TypeError):
@@ -57,58 +62,40 @@ class GetOrderUseCase:
 
         dto = order_to_dto(order)
         self._ensure_owner(dto, user_id=user_id)
-        await self.cache.set(cache_key, self._serialize(dto), ttl=self.cache_ttl)
+        await self.cache.set_versioned(
+            cache_key,
+            dump_order_entry(dto),
+            version=dto.version,
+            ttl=self.cache_ttl,
+        )
         return dto
 
-    def _cache_key(self, order_id: UUID) -> str:
-        """Формирует ключ кеша для заказа.
-
-        Args:
-            order_id: Идентификатор заказа.
-
-        Returns:
-            str: Ключ кеша.
-        """
-        return f"order:{order_id}"
+    async def get_cached_etag(
+        self, order_id: UUID, *, user_id: int
+    ) -> str | None:
+        """Возвращает ETag заказа из кеша без обращения к БД.
 
-    def _serialize(self, dto: OrderDTO) -> str:
-        """Сериализует DTO заказа в JSON-строку для кеша.
+        Используется для ответа на условный запрос: читается только заголовок
+        записи кеша, JSON с данными заказа не разбирается.
 
         Args:
-            dto: DTO заказа.
-
-        Returns:
-            str: JSON-строка.
-        """
-        return json.dumps(
-            {
-                "id": str(dto.id),
-                "user_id": dto.user_id,
-                "items": dto.items,
-                "total_price": str(dto.total_price),
-                "status": dto.status.value,
-                "created_at": dto.created_at.isoformat(),
-            }
-        )
-
-    def _deserialize(self, data: str) -> OrderDTO:
-        """Десериализует JSON-строку из кеша в DTO заказа.
-
-        Args:
-            data: JSON-строка.
+            order_id: Идентификатор заказа.
+            user_id: Идентификатор пользователя, запрашивающего заказ.
 
         Returns:
-            OrderDTO: DTO заказа.
+            str | None: ETag, если заказ есть в кеше и принадлежит пользователю,
+            иначе `None`.
         """
-        raw = json.loads(data)
-        return OrderDTO(
-            id=UUID(raw["id"]),
-            user_id=raw["user_id"],
-            items=raw["items"],
-            total_price=Decimal(str(raw["total_price"])),
-            status=OrderStatus(raw["status"]),
-            created_at=datetime.fromisoformat(raw["created_at"]),
-        )
+        cached = await self.cache.get(order_cache_key(order_id))
+        if not cached:
+            return None
+        try:
+            version, owner_id = read_order_entry_header(cached)
+        except ValueError:
+            return None
+        if owner_id != user_id:
+            return None
+        return version_etag(version)
 
     @staticmethod
     def _ensure_owner(dto: OrderDTO, *, user_id: int) -> None:
@@ -1,20 +1,37 @@
-"""Use-case получения списка заказов пользователя."""
+"""Use-case получения списка заказов пользователя.
+
+Список читается из кеша: индекс идентификаторов заказов пользователя
+(по убыванию `created_at`) плюс пакетное чтение записей заказов. В БД сценарий
+обращается только при холодном индексе или отсутствии части записей, после
+чего прогревает кеш.
+"""
 
 from dataclasses import dataclass
+from json import JSONDecodeError
+from uuid import UUID
 
 from application.dtos.order import OrderDTO
+from application.interfaces.cache import CacheProtocol
 from application.interfaces.uow import UnitOfWorkProtocol
 from application.mappers import order_to_dto
+from application.order_cache import (
+    dump_order_entry,
+    load_order_entry,
+    order_cache_key,
+    user_orders_index_key,
+)
 
 
 @dataclass(slots=True, kw_only=True)
 class ListUserOrdersUseCase:
-    """Сценарий получения списка заказов пользователя."""
+    """Сценарий получения списка заказов пользователя (с кешем)."""
 
     uow: UnitOfWorkProtocol
+    cache: CacheProtocol
+    cache_ttl: int
 
     async def __call__(self, user_id: int) -> list[OrderDTO]:
-        """Возвращает заказы пользователя.
+        """Возвращает заказы пользователя (новые первыми).
 
         Args:
             user_id: Идентификатор пользователя.
@@ -22,6 +39,63 @@ class ListUserOrdersUseCase:
         Returns:
             list[OrderDTO]: Список заказов пользователя.
         """
+        index_key = user_orders_index_key(user_id)
+        order_ids = await self.cache.get_index(index_key)
+        if order_ids is not None:
+            cached = await self._load_cached(order_ids, user_id=user_id)
+            if cached is not None:
+                return cached
+
         async with self.uow:
             orders = await self.uow.order_repo.list_by_user(user_id)
-        return [order_to_dto(order) for order in orders]
+        dtos = [order_to_dto(order) for order in orders]
+
+        # Сначала записи заказов, затем индекс: прогретый индекс не должен
+        # ссылаться на отсутствующие записи.
+        await self.cache.set_many_versioned(
+            {
+                order_cache_key(dto.id): (dump_order_entry(dto), dto.version)
+                for dto in dtos
+            },
+            ttl=self.cache_ttl,
+        )
+        await self.cache.fill_index(
+            index_key,
+            {str(dto.id): dto.created_at.timestamp() for dto in dtos},
+            ttl=self.cache_ttl,
+        )
+        return dtos
+
+    async def _load_cached(
+        self, order_ids: list[str], *, user_id: int
+    ) -> list[OrderDTO] | None:
+        """Загружает заказы из кеша по идентификаторам из индекса.
+
+        Args:
+            order_ids: Идентификаторы заказов из индекса.
+            user_id: Идентификатор владельца.
+
+        Returns:
+            list[OrderDTO] | None: Заказы или `None`, если хотя бы одной записи
+            нет в кеше либо она повреждена (повреждённая запись удаляется).
+        """
+        if not order_ids:
+            return []
+        try:
+            keys = [order_cache_key(UUID(order_id)) for order_id in order_ids]
+        except ValueError:
+            return None
+        entries = await self.cache.get_many(keys)
+        dtos: list[OrderDTO] = []
+        for key, entry in zip(keys, entries, strict=True):
+            if entry is None:
+                return None
+            try:
+                dto = load_order_entry(entry)
+            except (JSONDecodeError, KeyError, ValueError, TypeError):
+                await self.cache.delete(key)
+                return None
+            if dto.user_id != user_id:
+                return None
+            dtos.append(dto)
+        return dtos
@@ -1,45 +1,137 @@
-"""Use-case входа пользователя (выдача JWT)."""
+"""Use-case входа пользователя (выдача JWT и токена обновления)."""
 
+import asyncio
 from dataclasses import dataclass
+from typing import NoReturn
 
-from application.dtos.auth import TokenDTO
-from application.exceptions import InvalidCredentialsError
+from loguru import logger
+
+from application.dtos.auth import RefreshSessionDTO, TokenDTO
+from application.exceptions import (
+    InvalidCredentialsError,
+    SessionStoreUnavailableError,
+    TooManyLoginAttemptsError,
+)
 from application.services.security import PasswordHasher, TokenService
-from application.interfaces.repositories import UserRepositoryProtocol
+from application.interfaces.login_throttle import LoginThrottleProtocol
+from application.interfaces.sessions import SessionStoreProtocol
+from application.interfaces.uow import UnitOfWorkProtocol
 
 
 @dataclass(slots=True, kw_only=True)
 class LoginUserUseCase:
-    """Сценарий входа пользователя и выдачи токена доступа."""
+    """Сценарий входа пользователя и выдачи токенов.
+
+    Если сохранённый хеш пароля устарел (другая схема или меньшая стоимость),
+    он пересчитывается по текущему профилю и сохраняется при успешном входе.
+
+    Блокировка после серии неудачных попыток проверяется до обращения к БД и
+    хеширования, поэтому заблокированные попытки не расходуют CPU. Для
+    неизвестного email выполняется проверка по фиктивному хешу: такая попытка
+    тоже учитывается как неудачная и поэтому укладывается в тот же бюджет.
+
+    Проверка пароля выполняется в пуле потоков и вне транзакции: на время KDF
+    не блокируется цикл событий и не удерживается соединение с БД.
+    """
 
-    users: UserRepositoryProtocol
+    uow: UnitOfWorkProtocol
     password_hasher: PasswordHasher
     token_service: TokenService
+    sessions: SessionStoreProtocol
+    throttle: LoginThrottleProtocol
+    refresh_ttl: int
 
-    async def __call__(self, *, email: str, password: str) -> TokenDTO:
-        """Проверяет учётные данные и возвращает JWT-токен.
+    async def __call__(
+        self, *, email: str, password: str, client_ip: str | None = None
+    ) -> TokenDTO:
+        """Проверяет учётные данные и возвращает токены.
 
         Args:
             email: Email пользователя.
             password: Пароль пользователя.
+            client_ip: IP-адрес клиента для учёта неудачных попыток.
 
         Returns:
-            TokenDTO: DTO токена доступа.
+            TokenDTO: DTO токена доступа и токена обновления (токен обновления
+            не выдаётся, если хранилище сессий недоступно).
 
         Raises:
             InvalidCredentialsError: Если email/пароль неверны или пользователь
                 находится в некорректном состоянии.
+            TooManyLoginAttemptsError: Если вход для email или IP-адреса
+                временно заблокирован.
         """
-        user = await self.users.get_by_email(email)
+        retry_after = await self.throttle.retry_after(email=email, ip=client_ip)
+        if retry_after:
+            raise TooManyLoginAttemptsError(
+                "Слишком много неудачных попыток входа", retry_after=retry_after
+            )
+
+        async with self.uow:
+            user = await self.uow.user_repo.get_by_email(email)
+            # Читающая транзакция завершается до KDF, соединение возвращается
+            # в пул.
+            await self.uow.rollback()
+
         if user is None:
-            raise InvalidCredentialsError("Неверный email или пароль")
+            await asyncio.to_thread(self.password_hasher.dummy_verify, password)
+            await self._reject(email, client_ip)
 
-        if not self.password_hasher.verify(password, user.hashed_password):
-            raise InvalidCredentialsError("Неверный email или пароль")
+        verified, new_hash = await asyncio.to_thread(
+            self.password_hasher.verify_and_update,
+            password,
+            user.hashed_password,
+        )
+        if not verified:
+            await self._reject(email, client_ip)
 
         if user.id is None:
             raise InvalidCredentialsError("Некорректная запись пользователя")
 
-        return self.token_service.create_access_token(
+        if new_hash is not None:
+            # Хеш заменяется, только если он не изменился после чтения.
+            async with self.uow:
+                if await self.uow.user_repo.update_password_hash(
+                    user.id, new_hash, expected_hash=user.hashed_password
+                ):
+                    await self.uow.commit()
+                    logger.info(
+                        "Хеш пароля пересчитан по текущему профилю",
+                        extra={"user_id": user.id},
+                    )
+
+        token = self.token_service.create_access_token(
             user_id=user.id, email=user.email
         )
+        await self.throttle.reset(email=email)
+        refresh_token, token_hash = self.token_service.create_refresh_token()
+        try:
+            await self.sessions.create(
+                token_hash,
+                RefreshSessionDTO(user_id=user.id, email=user.email),
+                ttl=self.refresh_ttl,
+            )
+        except SessionStoreUnavailableError:
+            # Пароль уже проверен: без хранилища сессий вход выдаёт только
+            # токен доступа.
+            return token
+        token.refresh_token = refresh_token
+        return token
+
+    async def _reject(self, email: str, client_ip: str | None) -> NoReturn:
+        """Учитывает неудачную попытку и отклоняет вход.
+
+        Args:
+            email: Email из попытки входа.
+            client_ip: IP-адрес клиента.
+
+        Raises:
+            InvalidCredentialsError: Всегда.
+        """
+        lockout = await self.throttle.register_failure(email=email, ip=client_ip)
+        if lockout:
+            logger.warning(
+                "Вход временно заблокирован после неудачных попыток",
+                extra={"client_ip": client_ip, "lockout_seconds": lockout},
+            )
+        raise InvalidCredentialsError("Неверный email или пароль")
@@ -0,0 +1,40 @@
+"""Use-case выхода пользователя (отзыв токенов обновления)."""
+
+from dataclasses import dataclass
+
+from application.interfaces.sessions import SessionStoreProtocol
+from application.services.security import TokenService
+
+
+@dataclass(slots=True, kw_only=True)
+class LogoutUserUseCase:
+    """Сценарий отзыва сессий пользователя."""
+
+    sessions: SessionStoreProtocol
+
+    async def __call__(self, refresh_token: str) -> None:
+        """Отзывает одну сессию по её токену обновления.
+
+        Args:
+            refresh_token: Токен обновления отзываемой сессии.
+
+        Raises:
+            SessionStoreUnavailableError: Если хранилище сессий недоступно.
+        """
+        await self.sessions.consume(
+            TokenService.hash_refresh_token(refresh_token)
+        )
+
+    async def revoke_all(self, user_id: int) -> int:
+        """Отзывает все сессии пользователя (выход на всех устройствах).
+
+        Args:
+            user_id: Идентификатор пользователя.
+
+        Returns:
+            int: Количество отозванных сессий.
+
+        Raises:
+            SessionStoreUnavailableError: Если хранилище сессий недоступно.
+        """
+        return await self.sessions.revoke_user(user_id)
@@ -0,0 +1,55 @@
+"""Use-case удаления обработанных outbox-событий.
+
+Обработанные события нужны только для отладки и повторной публикации
+вручную, поэтому хранятся ограниченное время. Удаление идёт короткими
+транзакциями по `batch_size` строк, чтобы не держать блокировки и не
+создавать всплесков WAL; при первом запуске на большой таблице старые строки
+удаляются постепенно за несколько запусков (или сразу, при `max_batches=None`).
+"""
+
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+from loguru import logger
+
+from application.interfaces.uow import Durability, UnitOfWorkProtocol
+
+
+@dataclass(slots=True, kw_only=True)
+class PruneOutboxUseCase:
+    """Сценарий удаления outbox-событий старше срока хранения."""
+
+    uow: UnitOfWorkProtocol
+    retention: timedelta
+    batch_size: int = 5_000
+    max_batches: int | None = 100
+
+    async def __call__(self) -> int:
+        """Удаляет пачки обработанных событий, пока они не закончатся.
+
+        Returns:
+            int: Количество удалённых событий.
+        """
+        cutoff = datetime.now(UTC) - self.retention
+        deleted = 0
+        batches = 0
+        while self.max_batches is None or batches < self.max_batches:
+            async with self.uow:
+                await self.uow.set_durability(Durability.RELAXED)
+                count = await self.uow.outbox_repo.delete_processed_before(
+                    cutoff, limit=self.batch_size
+                )
+                await self.uow.commit()
+            deleted += count
+            batches += 1
+            if count < self.batch_size:
+                break
+        logger.info(
+            "Удалены обработанные outbox-события",
+            extra={
+                "deleted": deleted,
+                "batches": batches,
+                "cutoff": cutoff.isoformat(),
+            },
+        )
+        return deleted
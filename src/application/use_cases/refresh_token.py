@@ -0,0 +1,56 @@
+"""Use-case обновления токена доступа по токену обновления.
+
+Токен обновления одноразовый: сессия извлекается из хранилища и удаляется,
+а клиент получает новую пару токенов (ротация). Сценарий не обращается к БД
+и не проверяет пароль.
+"""
+
+from dataclasses import dataclass
+
+from application.dtos.auth import TokenDTO
+from application.exceptions import InvalidCredentialsError
+from application.interfaces.sessions import SessionStoreProtocol
+from application.services.security import TokenService
+
+
+@dataclass(slots=True, kw_only=True)
+class RefreshTokenUseCase:
+    """Сценарий ротации токена обновления."""
+
+    sessions: SessionStoreProtocol
+    token_service: TokenService
+    refresh_ttl: int
+
+    async def __call__(self, refresh_token: str) -> TokenDTO:
+        """Выдаёт новую пару токенов взамен токена обновления.
+
+        Args:
+            refresh_token: Токен обновления, выданный ранее.
+
+        Returns:
+            TokenDTO: Новый токен доступа и новый токен обновления.
+
+        Raises:
+            InvalidCredentialsError: Если токен не найден, истёк, уже
+                использован или отозван.
+            SessionStoreUnavailableError: Если хранилище сессий недоступно.
+        """
+        session = await self.sessions.consume(
+            self.token_service.hash_refresh_token(refresh_token)
+        )
+        if session is None:
+            raise InvalidCredentialsError("Недействительный токен обновления")
+
+        # Прежний токен уже погашен, поэтому без новой сессии клиент потерял
+        # бы вход: ошибка хранилища не скрывается и возвращается клиенту.
+        new_refresh_token, token_hash = self.token_service.create_refresh_token()
+        if not await self.sessions.create(
+            token_hash, session, ttl=self.refresh_ttl
+        ):
+            # Сессии пользователя отозваны, пока токен ротировался.
+            raise InvalidCredentialsError("Недействительный токен обновления")
+        token = self.token_service.create_access_token(
+            user_id=session.user_id, email=session.email
+        )
+        token.refresh_token = new_refresh_token
+        return token
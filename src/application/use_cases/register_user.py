@@ -1,5 +1,6 @@
 """Use-case регистрации пользователя."""
 
+import asyncio
 from dataclasses import dataclass
 
 from application.dtos.user import UserCreateDTO, UserDTO
@@ -12,7 +13,12 @@ from domain.entities.user import User
 
 @dataclass(slots=True, kw_only=True)
 class RegisterUserUseCase:
-    """Сценарий регистрации пользователя."""
+    """Сценарий регистрации пользователя.
+
+    Пароль хешируется в пуле потоков, чтобы не блокировать event loop, а
+    пользователь создаётся одним запросом с разрешением конфликта по email в
+    БД (без предварительной проверки и гонки между проверкой и вставкой).
+    """
 
     uow: UnitOfWorkProtocol
     password_hasher: PasswordHasher
@@ -29,14 +35,14 @@ class RegisterUserUseCase:
         Raises:
             UserAlreadyExistsError: Если пользователь с таким email уже существует.
         """
+        hashed = await asyncio.to_thread(
+            self.password_hasher.hash, payload.password
+        )
+        user = User(email=payload.email, hashed_password=hashed)
         async with self.uow:
-            existing = await self.uow.user_repo.get_by_email(payload.email)
-            if existing:
-                raise UserAlreadyExistsError("Пользователь уже зарегистрирован")
-
-            hashed = self.password_hasher.hash(payload.password)
-            user = User(email=payload.email, hashed_password=hashed)
             created = await self.uow.user_repo.create(user)
+            if created is None:
+                raise UserAlreadyExistsError("Пользователь уже зарегистрирован")
             await self.uow.commit()
 
         return user_to_dto(created)
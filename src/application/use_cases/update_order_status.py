@@ -1,21 +1,28 @@
 """Use-case обновления статуса заказа.
 
-Сценарий обновляет статус заказа в БД с проверкой владельца и синхронно
-обновляет запись в кеше.
+Сценарий атомарно обновляет статус заказа в БД (compare-and-set по владельцу и,
+при необходимости, по версии) и записывает новую версию в кеш. Запись в кеш
+версионная: более старая версия не может перезаписать более новую.
+
+В той же транзакции в outbox записывается событие `order_status_changed`,
+которое публикуется в topic exchange с ключом `order.status.<статус>`:
+потребители (доставка, уведомления) подписываются на нужные статусы вместо
+опроса `GET /orders/{id}/`. После фиксации новое состояние заказа
+публикуется владельцу в поток `GET /orders/stream` (по возможности).
 """
 
-import json
 from dataclasses import dataclass
-from datetime import datetime
-from decimal import Decimal
-from uuid import UUID
+
+from loguru import logger
 
 from application.dtos.order import OrderDTO, UpdateOrderStatusDTO
-from application.exceptions import OrderNotFoundError
+from application.events import order_status_changed_event
+from application.exceptions import OrderNotFoundError, OrderVersionConflictError
 from application.interfaces.cache import CacheProtocol
+from application.interfaces.order_updates import OrderUpdatesPublisherProtocol
 from application.interfaces.uow import UnitOfWorkProtocol
 from application.mappers import order_to_dto
-from domain.value_objects.order_status import OrderStatus
+from application.order_cache import dump_order_entry, order_cache_key
 
 
 @dataclass(slots=True, kw_only=True)
@@ -24,87 +31,54 @@ class UpdateOrderStatusUseCase:
 
     uow: UnitOfWorkProtocol
     cache: CacheProtocol
+    updates: OrderUpdatesPublisherProtocol
     cache_ttl: int
 
     async def __call__(self, payload: UpdateOrderStatusDTO) -> OrderDTO:
         """Обновляет статус заказа.
 
         Args:
-            payload: DTO с идентификатором заказа, новым статусом и владельцем.
+            payload: DTO с идентификатором заказа, новым статусом, владельцем и
+                (опционально) ожидаемой версией.
 
         Returns:
             OrderDTO: Обновлённый заказ.
 
         Raises:
             OrderNotFoundError: Если заказ не найден или не принадлежит пользователю.
+            OrderVersionConflictError: Если версия заказа не совпала с ожидаемой.
         """
         async with self.uow:
-            existing = await self.uow.order_repo.get_by_id(payload.order_id)
-            if existing is None:
-                raise OrderNotFoundError("Заказ не найден")
-            if existing.user_id != payload.user_id:
-                raise OrderNotFoundError("Заказ не найден")
-
             order = await self.uow.order_repo.update_status(
-                payload.order_id, payload.status
+                payload.order_id,
+                payload.status,
+                user_id=payload.user_id,
+                expected_version=payload.expected_version,
             )
             if order is None:
-                raise OrderNotFoundError("Заказ не найден")
+                existing = await self.uow.order_repo.get_by_id(payload.order_id)
+                if existing is None or existing.user_id != payload.user_id:
+                    raise OrderNotFoundError("Заказ не найден")
+                raise OrderVersionConflictError(
+                    "Заказ был изменён другим запросом, обновите данные"
+                )
+            await self.uow.outbox_repo.add_many(
+                [order_status_changed_event(order)]
+            )
             await self.uow.commit()
 
         dto = order_to_dto(order)
-        cache_key = self._cache_key(payload.order_id)
-        await self.cache.set(cache_key, self._serialize(dto), ttl=self.cache_ttl)
-        return dto
-
-    def _cache_key(self, order_id: UUID) -> str:
-        """Формирует ключ кеша для заказа.
-
-        Args:
-            order_id: Идентификатор заказа.
-
-        Returns:
-            str: Ключ кеша.
-        """
-        return f"order:{order_id}"
-
-    def _serialize(self, dto: OrderDTO) -> str:
-        """Сериализует DTO заказа в JSON-строку для кеша.
-
-        Args:
-            dto: DTO заказа.
-
-        Returns:
-            str: JSON-строка.
-        """
-        return json.dumps(
-            {
-                "id": str(dto.id),
-                "user_id": dto.user_id,
-                "items": dto.items,
-                "total_price": str(dto.total_price),
-                "status": dto.status.value,
-                "created_at": dto.created_at.isoformat(),
-            }
-        )
-
-    def _deserialize(self, data: str) -> OrderDTO:
-        """Десериализует JSON-строку из кеша в DTO заказа.
-
-        Примечание: метод оставлен для симметрии и возможного расширения.
-
-        Args:
-            data: JSON-строка.
-
-        Returns:
-            OrderDTO: DTO заказа.
-        """
-        raw = json.loads(data)
-        return OrderDTO(
-            id=UUID(raw["id"]),
-            user_id=raw["user_id"],
-            items=raw["items"],
-            total_price=Decimal(str(raw["total_price"])),
-            status=OrderStatus(raw["status"]),
-            created_at=datetime.fromisoformat(raw["created_at"]),
+        await self.cache.set_versioned(
+            order_cache_key(payload.order_id),
+            dump_order_entry(dto),
+            version=dto.version,
+            ttl=self.cache_ttl,
         )
+        try:
+            await self.updates.publish(dto)
+        except Exception as exc:
+            logger.warning(
+                "Не удалось опубликовать изменение заказа в поток",
+                extra={"error": str(exc), "order_id": str(dto.id)},
+            )
+        return dto
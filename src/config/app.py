@@ -17,7 +17,6 @@ class AppSettings(BaseSettings):
         "INFO", alias="LOG_LEVEL"
     )
     debug: bool = Field(False, alias="DEBUG")
-    rate_limit_per_minute: int = Field(30, alias="RATE_LIMIT_PER_MINUTE")
 
     class Config:
         """Настройки загрузки переменных окружения для Pydantic Settings."""
@@ -1,25 +1,62 @@
 """Настройки аутентификации (JWT)."""
 
 from datetime import timedelta
+from typing import Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
 
 class AuthSettings(BaseSettings):
-    """Настройки для создания и проверки JWT-токенов."""
+    """Настройки для создания и проверки JWT-токенов.
+
+    Если задан `JWT_KEYS_FILE` (JWKS-файл с ключами `EdDSA`/`ES256`/`HS*`),
+    токены подписываются ключом `JWT_ACTIVE_KID`, а `JWT_SECRET_KEY` остаётся
+    ключом для ранее выданных токенов без `kid`.
+
+    Профиль хеширования паролей задаётся схемой (`PASSWORD_HASH_SCHEME`) и её
+    стоимостью. Хеши прежней схемы или меньшей стоимости пересчитываются при
+    следующем успешном входе пользователя. Подобрать стоимость под железо
+    помогает `make calibrate-password-hash`.
+    """
 
     jwt_secret_key: str = Field(..., alias="JWT_SECRET_KEY")
     jwt_algorithm: str = Field("HS256", alias="JWT_ALGORITHM")
     access_token_expire_minutes: int = Field(
         60, alias="ACCESS_TOKEN_EXPIRE_MINUTES"
     )
+    refresh_token_expire_days: int = Field(30, alias="REFRESH_TOKEN_EXPIRE_DAYS")
+    jwt_keys_file: str | None = Field(None, alias="JWT_KEYS_FILE")
+    jwt_active_kid: str | None = Field(None, alias="JWT_ACTIVE_KID")
+    jwt_verify_cache_size: int = Field(
+        10_000, ge=0, alias="JWT_VERIFY_CACHE_SIZE"
+    )
+    password_hash_scheme: Literal["pbkdf2_sha256", "argon2"] = Field(
+        "pbkdf2_sha256", alias="PASSWORD_HASH_SCHEME"
+    )
+    password_pbkdf2_rounds: int = Field(
+        29_000, ge=1_000, alias="PASSWORD_PBKDF2_ROUNDS"
+    )
+    password_argon2_time_cost: int = Field(
+        2, ge=1, alias="PASSWORD_ARGON2_TIME_COST"
+    )
+    password_argon2_memory_cost: int = Field(
+        19_456, ge=8, alias="PASSWORD_ARGON2_MEMORY_COST"
+    )
+    password_argon2_parallelism: int = Field(
+        1, ge=1, alias="PASSWORD_ARGON2_PARALLELISM"
+    )
 
     @property
     def access_token_expire(self) -> timedelta:
         """Время жизни токена доступа."""
         return timedelta(minutes=self.access_token_expire_minutes)
 
+    @property
+    def refresh_token_expire(self) -> timedelta:
+        """Время жизни токена обновления (сессии)."""
+        return timedelta(days=self.refresh_token_expire_days)
+
     class Config:
         """Настройки загрузки переменных окружения для Pydantic Settings."""
 
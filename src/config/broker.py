@@ -1,5 +1,7 @@
 """Настройки брокера сообщений (RabbitMQ)."""
 
+from typing import Literal
+
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
@@ -11,6 +13,12 @@ class BrokerSettings(BaseSettings):
     broker_new_order_queue: str = Field(
         "new_order", alias="BROKER_NEW_ORDER_QUEUE"
     )
+    broker_order_events_exchange: str = Field(
+        "order_events", alias="BROKER_ORDER_EVENTS_EXCHANGE"
+    )
+    broker_content_type: Literal["application/json", "application/msgpack"] = (
+        Field("application/json", alias="BROKER_CONTENT_TYPE")
+    )
     publish_retries: int = Field(3, alias="PUBLISH_RETRIES")
     publish_retry_backoff: float = Field(0.5, alias="PUBLISH_RETRY_BACKOFF")
 
@@ -7,13 +7,43 @@ from pydantic_settings import BaseSettings
 
 
 class DatabaseSettings(BaseSettings):
-    """Настройки подключения к PostgreSQL."""
+    """Настройки подключения к PostgreSQL.
+
+    Кеши подготовленных выражений на одно соединение (`0` отключает кеш):
+    - `POSTGRES_PREPARED_STATEMENT_CACHE_SIZE` — кеш адаптера SQLAlchemy, через
+      который проходят все запросы приложения;
+    - `POSTGRES_STATEMENT_CACHE_SIZE` — кеш самого asyncpg
+      (`statement_cache_size`), в него попадают только служебные запросы
+      драйвера (проверка соединения, интроспекция типов).
+    Значения по умолчанию совпадают с умолчаниями SQLAlchemy и asyncpg. При
+    работе через pgbouncer в режиме transaction pooling оба кеша отключаются.
+
+    `ORDER_GROUP_COMMIT_ENABLED` включает общую транзакцию для заказов,
+    созданных в воркере одновременно: пачка записывается, когда в ней
+    `ORDER_GROUP_COMMIT_MAX_BATCH` заказов или через
+    `ORDER_GROUP_COMMIT_MAX_DELAY_MS` мс после первого заказа.
+    """
 
     postgres_user: str = Field(..., alias="POSTGRES_USER")
     postgres_password: str = Field(..., alias="POSTGRES_PASSWORD")
     postgres_server: str = Field(..., alias="POSTGRES_SERVER")
     postgres_port: int = Field(5432, alias="POSTGRES_PORT")
     postgres_db: str = Field(..., alias="POSTGRES_DB")
+    postgres_prepared_statement_cache_size: int = Field(
+        100, ge=0, alias="POSTGRES_PREPARED_STATEMENT_CACHE_SIZE"
+    )
+    postgres_statement_cache_size: int = Field(
+        100, ge=0, alias="POSTGRES_STATEMENT_CACHE_SIZE"
+    )
+    order_group_commit_enabled: bool = Field(
+        False, alias="ORDER_GROUP_COMMIT_ENABLED"
+    )
+    order_group_commit_max_batch: int = Field(
+        64, ge=1, alias="ORDER_GROUP_COMMIT_MAX_BATCH"
+    )
+    order_group_commit_max_delay_ms: float = Field(
+        2.0, ge=0, alias="ORDER_GROUP_COMMIT_MAX_DELAY_MS"
+    )
 
     @computed_field
     def database_url(self) -> PostgresDsn:
@@ -10,30 +10,48 @@ from collections.abc import AsyncIterator
 from dishka import Provider, Scope, provide
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from application.interfaces.login_throttle import LoginThrottleProtocol
+from application.interfaces.order_updates import OrderUpdatesPublisherProtocol
+from application.interfaces.order_writer import OrderWriterProtocol
 from application.interfaces.repositories import (
     OrderRepositoryProtocol,
     OutboxRepositoryProtocol,
     UserRepositoryProtocol,
 )
+from application.interfaces.sessions import SessionStoreProtocol
 from application.interfaces.uow import UnitOfWorkProtocol
-from application.services import PasswordHasher, TokenService
+from application.services import (
+    JWTKeyring,
+    PasswordHasher,
+    PasswordHashProfile,
+    TokenService,
+)
 from application.use_cases import (
     CreateOrderUseCase,
     GetOrderUseCase,
     ListUserOrdersUseCase,
     LoginUserUseCase,
+    LogoutUserUseCase,
+    RefreshTokenUseCase,
     RegisterUserUseCase,
     UpdateOrderStatusUseCase,
 )
 from config.base import Settings
-from infra.broker import RabbitPublisher
-from infra.cache import RedisCacheClient
+from infra.broker import RabbitPublisher, build_codecs
+from infra.cache import (
+    RedisCacheClient,
+    RedisLoginThrottle,
+    RedisOrderUpdatesPublisher,
+    RedisSessionStore,
+)
+from infra.cache.order_updates import order_updates_channel
 from infra.cache.redis_resource import get_redis_client
 from infra.db.repositories import (
     OrderRepositorySQLAlchemy,
     OutboxRepositorySQLAlchemy,
     UserRepositorySQLAlchemy,
 )
+from infra.db.order_writer import GroupCommitOrderWriter, UnitOfWorkOrderWriter
 from infra.db.session import create_engine, get_session_factory
 from infra.db.uow import UnitOfWorkSQLAlchemy
 from api.v1.mappers import OrderPresentationMapper
@@ -69,13 +87,52 @@ class ProviderSet(Provider):
         Yields:
             async_sessionmaker[AsyncSession]: Фабрика сессий.
         """
-        engine = create_engine(settings.database_url, is_echo=settings.debug)
+        engine = create_engine(
+            settings.database_url,
+            is_echo=settings.debug,
+            prepared_statement_cache_size=(
+                settings.database.postgres_prepared_statement_cache_size
+            ),
+            statement_cache_size=settings.database.postgres_statement_cache_size,
+        )
         factory = get_session_factory(engine)
         try:
             yield factory
         finally:
             await engine.dispose()
 
+    @provide(scope=Scope.APP)
+    async def get_group_commit_order_writer(
+        self, settings: Settings, factory: async_sessionmaker[AsyncSession]
+    ) -> AsyncIterator[GroupCommitOrderWriter | None]:
+        """Создаёт накопитель заказов воркера для group commit.
+
+        Накопитель создаётся, только если group commit включён
+        (`ORDER_GROUP_COMMIT_ENABLED`). При остановке приложения он
+        записывает накопленные заказы.
+
+        Args:
+            settings: Настройки приложения.
+            factory: Фабрика сессий.
+
+        Yields:
+            GroupCommitOrderWriter | None: Накопитель заказов или `None`, если
+            group commit выключен.
+        """
+        database = settings.database
+        if not database.order_group_commit_enabled:
+            yield None
+            return
+        writer = GroupCommitOrderWriter(
+            session_factory=factory,
+            max_batch=database.order_group_commit_max_batch,
+            max_delay=database.order_group_commit_max_delay_ms / 1000,
+        )
+        try:
+            yield writer
+        finally:
+            await writer.close()
+
     @provide(scope=Scope.REQUEST)
     async def get_session(
         self, factory: async_sessionmaker[AsyncSession]
@@ -92,9 +149,25 @@ class ProviderSet(Provider):
             yield session
 
     @provide(scope=Scope.APP)
-    def get_password_hasher(self) -> PasswordHasher:
-        """Создаёт сервис хеширования паролей."""
-        return PasswordHasher()
+    def get_password_hasher(self, settings: Settings) -> PasswordHasher:
+        """Создаёт сервис хеширования паролей по профилю из настроек.
+
+        Args:
+            settings: Настройки приложения.
+
+        Returns:
+            PasswordHasher: Сервис хеширования паролей.
+        """
+        auth = settings.auth
+        return PasswordHasher(
+            PasswordHashProfile(
+                scheme=auth.password_hash_scheme,
+                pbkdf2_rounds=auth.password_pbkdf2_rounds,
+                argon2_time_cost=auth.password_argon2_time_cost,
+                argon2_memory_cost=auth.password_argon2_memory_cost,
+                argon2_parallelism=auth.password_argon2_parallelism,
+            )
+        )
 
     @provide(scope=Scope.APP)
     def get_token_service(self, settings: Settings) -> TokenService:
@@ -106,10 +179,18 @@ class ProviderSet(Provider):
         Returns:
             TokenService: Сервис токенов.
         """
+        auth = settings.auth
+        keyring = JWTKeyring.from_secret(auth.jwt_secret_key, auth.jwt_algorithm)
+        if auth.jwt_keys_file:
+            keyring = JWTKeyring.from_jwks_file(
+                auth.jwt_keys_file,
+                active_kid=auth.jwt_active_kid or None,
+                fallback=keyring.active_key,
+            )
         return TokenService(
-            secret_key=settings.auth.jwt_secret_key,
-            algorithm=settings.auth.jwt_algorithm,
-            expires_delta=settings.auth.access_token_expire,
+            keyring=keyring,
+            expires_delta=auth.access_token_expire,
+            cache_size=auth.jwt_verify_cache_size,
         )
 
     @provide(scope=Scope.APP)
@@ -129,6 +210,7 @@ class ProviderSet(Provider):
             queue_name=settings.broker.broker_new_order_queue,
             retries=settings.broker.publish_retries,
             retry_backoff=settings.broker.publish_retry_backoff,
+            codec=build_codecs().require(settings.broker.broker_content_type),
         )
         try:
             yield publisher
@@ -190,6 +272,27 @@ class UnitOfWorkProvider(Provider):
             outbox_repo=outbox_repo,
         )
 
+    @provide(scope=Scope.REQUEST)
+    def get_order_writer(
+        self,
+        uow: UnitOfWorkProtocol,
+        group_commit: GroupCommitOrderWriter | None,
+    ) -> OrderWriterProtocol:
+        """Выбирает способ записи новых заказов.
+
+        Args:
+            uow: Unit of Work запроса.
+            group_commit: Накопитель заказов воркера (`None`, если group
+                commit выключен).
+
+        Returns:
+            OrderWriterProtocol: Group commit, если он включён, иначе запись в
+            транзакции запроса.
+        """
+        if group_commit is not None:
+            return group_commit
+        return UnitOfWorkOrderWriter(uow=uow)
+
 
 class CacheProvider(Provider):
     """Провайдер кеша (Redis)."""
@@ -213,6 +316,58 @@ class CacheProvider(Provider):
             prefix=settings.redis.redis_cache_prefix,
         )
 
+    @provide(scope=Scope.APP)
+    def get_session_store(self, settings: Settings) -> SessionStoreProtocol:
+        """Создаёт хранилище сессий (refresh-токенов) на Redis.
+
+        Args:
+            settings: Настройки приложения.
+
+        Returns:
+            SessionStoreProtocol: Хранилище сессий.
+        """
+        return RedisSessionStore(
+            client=get_redis_client(), prefix=settings.redis.redis_cache_prefix
+        )
+
+    @provide(scope=Scope.APP)
+    def get_order_updates_publisher(
+        self, settings: Settings
+    ) -> OrderUpdatesPublisherProtocol:
+        """Создаёт публикацию изменений заказов в Redis pub/sub.
+
+        Args:
+            settings: Настройки приложения.
+
+        Returns:
+            OrderUpdatesPublisherProtocol: Публикация изменений заказов.
+        """
+        return RedisOrderUpdatesPublisher(
+            client=get_redis_client(),
+            channel=order_updates_channel(settings.redis.redis_cache_prefix),
+        )
+
+    @provide(scope=Scope.APP)
+    def get_login_throttle(self, settings: Settings) -> LoginThrottleProtocol:
+        """Создаёт ограничитель неудачных попыток входа на Redis.
+
+        Args:
+            settings: Настройки приложения.
+
+        Returns:
+            LoginThrottleProtocol: Ограничитель попыток входа.
+        """
+        limits = settings.rate_limit
+        return RedisLoginThrottle(
+            client=get_redis_client(),
+            max_failures_per_email=limits.login_max_failures_per_email,
+            max_failures_per_ip=limits.login_max_failures_per_ip,
+            window_seconds=limits.login_failure_window_seconds,
+            lockout_base_seconds=limits.login_lockout_base_seconds,
+            lockout_max_seconds=limits.login_lockout_max_seconds,
+            prefix=settings.redis.redis_cache_prefix,
+        )
+
 
 class MapperProvider(Provider):
     """Провайдер presentation-мапперов для API."""
@@ -236,21 +391,49 @@ class UseCaseProvider(Provider):
     @provide(scope=Scope.REQUEST)
     def login_user_use_case(
         self,
-        users: UserRepositoryProtocol,
+        uow: UnitOfWorkProtocol,
         password_hasher: PasswordHasher,
         token_service: TokenService,
+        sessions: SessionStoreProtocol,
+        throttle: LoginThrottleProtocol,
+        settings: Settings,
     ) -> LoginUserUseCase:
-        """Создаёт use-case входа пользователя (выдачи токена)."""
+        """Создаёт use-case входа пользователя (выдачи токенов)."""
         return LoginUserUseCase(
-            users=users,
+            uow=uow,
             password_hasher=password_hasher,
             token_service=token_service,
+            sessions=sessions,
+            throttle=throttle,
+            refresh_ttl=int(settings.auth.refresh_token_expire.total_seconds()),
         )
 
+    @provide(scope=Scope.REQUEST)
+    def refresh_token_use_case(
+        self,
+        sessions: SessionStoreProtocol,
+        token_service: TokenService,
+        settings: Settings,
+    ) -> RefreshTokenUseCase:
+        """Создаёт use-case ротации токена обновления."""
+        return RefreshTokenUseCase(
+            sessions=sessions,
+            token_service=token_service,
+            refresh_ttl=int(settings.auth.refresh_token_expire.total_seconds()),
+        )
+
+    @provide(scope=Scope.REQUEST)
+    def logout_user_use_case(
+        self, sessions: SessionStoreProtocol
+    ) -> LogoutUserUseCase:
+        """Создаёт use-case отзыва сессий пользователя."""
+        return LogoutUserUseCase(sessions=sessions)
+
     @provide(scope=Scope.REQUEST)
     def create_order_use_case(
         self,
         uow: UnitOfWorkProtocol,
+        order_writer: OrderWriterProtocol,
         cache: RedisCacheClient,
         broker: RabbitPublisher,
         settings: Settings,
@@ -258,6 +441,7 @@ class UseCaseProvider(Provider):
         """Создаёт use-case создания заказа."""
         return CreateOrderUseCase(
             uow=uow,
+            order_writer=order_writer,
             cache=cache,
             message_broker=broker,
             cache_ttl=settings.redis.redis_cache_ttl,
@@ -274,16 +458,25 @@ class UseCaseProvider(Provider):
 
     @provide(scope=Scope.REQUEST)
     def update_order_status_use_case(
-        self, uow: UnitOfWorkProtocol, cache: RedisCacheClient, settings: Settings
+        self,
+        uow: UnitOfWorkProtocol,
+        cache: RedisCacheClient,
+        updates: OrderUpdatesPublisherProtocol,
+        settings: Settings,
     ) -> UpdateOrderStatusUseCase:
         """Создаёт use-case обновления статуса заказа."""
         return UpdateOrderStatusUseCase(
-            uow=uow, cache=cache, cache_ttl=settings.redis.redis_cache_ttl
+            uow=uow,
+            cache=cache,
+            updates=updates,
+            cache_ttl=settings.redis.redis_cache_ttl,
         )
 
     @provide(scope=Scope.REQUEST)
     def list_user_orders_use_case(
-        self, uow: UnitOfWorkProtocol
+        self, uow: UnitOfWorkProtocol, cache: RedisCacheClient, settings: Settings
     ) -> ListUserOrdersUseCase:
         """Создаёт use-case получения заказов пользователя."""
-        return ListUserOrdersUseCase(uow=uow)
+        return ListUserOrdersUseCase(
+            uow=uow, cache=cache, cache_ttl=settings.redis.redis_cache_ttl
+        )
@@ -0,0 +1,45 @@
+"""Настройки обслуживания outbox-таблицы."""
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class OutboxSettings(BaseSettings):
+    """Настройки отправки и хранения outbox-событий.
+
+    Неудачная публикация события откладывается на
+    `OUTBOX_RETRY_BASE_SECONDS * 2**(попытка - 1)` секунд (не больше
+    `OUTBOX_RETRY_MAX_SECONDS`); после `OUTBOX_MAX_ATTEMPTS` неудачных попыток
+    событие переводится в dead letter.
+
+    Обработанные события старше `OUTBOX_RETENTION_HOURS` удаляются
+    периодической задачей пачками по `OUTBOX_RETENTION_BATCH_SIZE` строк
+    (не более `OUTBOX_RETENTION_MAX_BATCHES` пачек за запуск).
+    """
+
+    outbox_dispatch_batch_size: int = Field(
+        100, ge=1, alias="OUTBOX_DISPATCH_BATCH_SIZE"
+    )
+    outbox_max_attempts: int = Field(10, ge=1, alias="OUTBOX_MAX_ATTEMPTS")
+    outbox_retry_base_seconds: float = Field(
+        5.0, gt=0, alias="OUTBOX_RETRY_BASE_SECONDS"
+    )
+    outbox_retry_max_seconds: float = Field(
+        3_600.0, gt=0, alias="OUTBOX_RETRY_MAX_SECONDS"
+    )
+    outbox_retention_hours: float = Field(
+        72.0, gt=0, alias="OUTBOX_RETENTION_HOURS"
+    )
+    outbox_retention_batch_size: int = Field(
+        5_000, ge=1, alias="OUTBOX_RETENTION_BATCH_SIZE"
+    )
+    outbox_retention_max_batches: int = Field(
+        100, ge=1, alias="OUTBOX_RETENTION_MAX_BATCHES"
+    )
+
+    class Config:
+        """Настройки загрузки переменных окружения для Pydantic Settings."""
+
+        env_file = ".env"
+        env_file_encoding = "utf-8"
+        extra = "ignore"
@@ -0,0 +1,48 @@
+"""Настройки ограничения частоты запросов (rate limiting)."""
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class RateLimitSettings(BaseSettings):
+    """Настройки гибридного лимитера запросов.
+
+    Лимиты задаются числом запросов в минуту на пару «маршрут + клиент»
+    (пользователь из JWT или IP-адрес для анонимных запросов).
+
+    Параметры `LOGIN_*` задают защиту входа от перебора: пороги неудачных
+    попыток в скользящем окне для email и IP-адреса и длительность
+    блокировки, которая удваивается с каждой следующей блокировкой.
+    """
+
+    rate_limit_per_minute: int = Field(30, alias="RATE_LIMIT_PER_MINUTE")
+    rate_limit_routes: dict[str, int] = Field({}, alias="RATE_LIMIT_ROUTES")
+    rate_limit_sync_threshold: float = Field(
+        0.8, gt=0, le=1, alias="RATE_LIMIT_SYNC_THRESHOLD"
+    )
+    rate_limit_flush_interval: float = Field(
+        1.0, gt=0, alias="RATE_LIMIT_FLUSH_INTERVAL"
+    )
+    rate_limit_prefix: str = Field("ratelimit:", alias="RATE_LIMIT_PREFIX")
+    login_max_failures_per_email: int = Field(
+        5, ge=1, alias="LOGIN_MAX_FAILURES_PER_EMAIL"
+    )
+    login_max_failures_per_ip: int = Field(
+        50, ge=1, alias="LOGIN_MAX_FAILURES_PER_IP"
+    )
+    login_failure_window_seconds: int = Field(
+        900, ge=1, alias="LOGIN_FAILURE_WINDOW_SECONDS"
+    )
+    login_lockout_base_seconds: int = Field(
+        30, ge=1, alias="LOGIN_LOCKOUT_BASE_SECONDS"
+    )
+    login_lockout_max_seconds: int = Field(
+        3600, ge=1, alias="LOGIN_LOCKOUT_MAX_SECONDS"
+    )
+
+    class Config:
+        """Настройки загрузки переменных окружения для Pydantic Settings."""
+
+        env_file = ".env"
+        env_file_encoding = "utf-8"
+        extra = "ignore"
@@ -14,7 +14,7 @@ class RedisSettings(BaseSettings):
     redis_port: int = Field(6379, alias="REDIS_PORT")
     redis_host: str = Field("redis", alias="REDIS_HOST")
     redis_db: int = Field(0, alias="REDIS_DB")
-    redis_cache_ttl: int = Field(300, alias="REDIS_CACHE_TTL")
+    redis_cache_ttl: int = Field(3600, alias="REDIS_CACHE_TTL")
     redis_cache_prefix: str = Field("order_service:", alias="REDIS_CACHE_PREFIX")
 
     class Config:
@@ -0,0 +1,51 @@
+"""Настройки production-сервера (gunicorn/granian)."""
+
+import os
+from typing import Literal
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+def available_cpus() -> int:
+    """Возвращает число CPU, доступных текущему процессу.
+
+    Учитывает привязку процесса к CPU (`sched_getaffinity`), если она
+    поддерживается платформой.
+
+    Returns:
+        int: Число доступных CPU (не меньше 1).
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return os.cpu_count() or 1
+
+
+class ServerSettings(BaseSettings):
+    """Настройки запуска приложения в несколько процессов.
+
+    Каждый воркер — отдельный процесс со своим event loop, поэтому по
+    умолчанию воркеров столько же, сколько доступных CPU. `WEB_CONCURRENCY`
+    задаёт число воркеров явно (например, при ограничении CPU квотой cgroup,
+    которую `sched_getaffinity` не видит).
+    """
+
+    server_runtime: Literal["gunicorn", "granian"] = Field(
+        "gunicorn", alias="SERVER_RUNTIME"
+    )
+    server_host: str = Field("0.0.0.0", alias="SERVER_HOST")
+    server_port: int = Field(8000, alias="SERVER_PORT")
+    web_concurrency: int | None = Field(None, ge=1, alias="WEB_CONCURRENCY")
+    server_access_log: bool = Field(True, alias="SERVER_ACCESS_LOG")
+
+    @property
+    def workers(self) -> int:
+        """Число воркеров: `WEB_CONCURRENCY` или число доступных CPU."""
+        return self.web_concurrency or available_cpus()
+
+    class Config:
+        """Настройки загрузки переменных окружения для Pydantic Settings."""
+
+        env_file = ".env"
+        env_file_encoding = "utf-8"
+        extra = "ignore"
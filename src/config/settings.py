@@ -11,7 +11,10 @@ from config.auth import AuthSettings
 from config.broker import BrokerSettings
 from config.cors import CORSSettings
 from config.database import DatabaseSettings
+from config.outbox import OutboxSettings
+from config.rate_limit import RateLimitSettings
 from config.redis import RedisSettings
+from config.server import ServerSettings
 
 
 class Settings(BaseSettings):
@@ -21,8 +24,11 @@ class Settings(BaseSettings):
     database: DatabaseSettings = DatabaseSettings()
     redis: RedisSettings = RedisSettings()
     broker: BrokerSettings = BrokerSettings()
+    outbox: OutboxSettings = OutboxSettings()
     cors: CORSSettings = CORSSettings()
     auth: AuthSettings = AuthSettings()
+    rate_limit: RateLimitSettings = RateLimitSettings()
+    server: ServerSettings = ServerSettings()
 
     @property
     def app_name(self) -> str:
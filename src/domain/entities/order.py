@@ -4,9 +4,10 @@ from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from decimal import Decimal
 from typing import Any
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from domain.exceptions import DomainValidationError
+from domain.identifiers import new_id
 from domain.value_objects.order_status import OrderStatus
 
 
@@ -17,6 +18,7 @@ class Order:
     Инварианты:
     - `total_price` > 0
     - список `items` не пустой
+    - `version` >= 1
 
     Attributes:
         user_id: Идентификатор пользователя-владельца.
@@ -25,14 +27,19 @@ class Order:
         status: Текущий статус заказа.
         id: Идентификатор заказа (UUID).
         created_at: Время создания заказа (UTC).
+        updated_at: Время последнего изменения заказа (UTC).
+        version: Версия заказа; увеличивается при каждом изменении и
+            используется для оптимистичной блокировки.
     """
 
     user_id: int
     items: list[dict[str, Any]]
     total_price: Decimal
     status: OrderStatus = OrderStatus.PENDING
-    id: UUID = field(default_factory=uuid4)
+    id: UUID = field(default_factory=new_id)
     created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    version: int = 1
 
     def __post_init__(self) -> None:
         """Проверяет доменные инварианты после создания объекта.
@@ -46,3 +53,39 @@ class Order:
             raise DomainValidationError(
                 "Заказ должен содержать как минимум один товар."
             )
+        if self.version < 1:
+            raise DomainValidationError("Версия заказа должна быть не меньше 1.")
+
+    @classmethod
+    def restore(
+        cls,
+        *,
+        id: UUID,  # noqa: A002
+        user_id: int,
+        items: list[dict[str, Any]],
+        total_price: Decimal,
+        status: OrderStatus,
+        created_at: datetime,
+        updated_at: datetime,
+        version: int,
+    ) -> "Order":
+        """Восстанавливает заказ из доверенного хранилища без проверки инвариантов.
+
+        Предназначен для строк, прочитанных из БД: инварианты проверены при
+        создании заказа и поддерживаются схемой, поэтому `__post_init__` для
+        каждой строки не вызывается.
+
+        Returns:
+            Order: Заказ с переданными значениями полей.
+        """
+        order = object.__new__(cls)
+        setattr_ = object.__setattr__
+        setattr_(order, "id", id)
+        setattr_(order, "user_id", user_id)
+        setattr_(order, "items", items)
+        setattr_(order, "total_price", total_price)
+        setattr_(order, "status", status)
+        setattr_(order, "created_at", created_at)
+        setattr_(order, "updated_at", updated_at)
+        setattr_(order, "version", version)
+        return order
@@ -10,7 +10,9 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
-from uuid import UUID, uuid4
+from uuid import UUID
+
+from domain.identifiers import new_id
 
 
 @dataclass(slots=True, frozen=True, kw_only=True)
@@ -23,10 +25,19 @@ class OutboxEvent:
         id: Идентификатор события (UUID).
         created_at: Время создания события (UTC).
         processed_at: Время обработки (UTC) или `None`, если не обработано.
+        attempts: Количество неудачных попыток публикации.
+        next_attempt_at: Время (UTC), раньше которого событие не публикуется.
+        last_error: Текст последней ошибки публикации.
+        dead_lettered_at: Время (UTC), когда попытки публикации прекращены,
+            или `None`.
     """
 
     event_type: str
     payload: dict[str, Any]
-    id: UUID = field(default_factory=uuid4)
+    id: UUID = field(default_factory=new_id)
     created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
     processed_at: datetime | None = None
+    attempts: int = 0
+    next_attempt_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    last_error: str | None = None
+    dead_lettered_at: datetime | None = None
@@ -0,0 +1,97 @@
+"""Генерация идентификаторов доменных сущностей.
+
+По умолчанию идентификаторы — UUIDv7 (RFC 9562): старшие 48 бит содержат
+время в миллисекундах, поэтому новые ключи упорядочены по времени создания и
+попадают в правый край B-tree индекса первичного ключа, а не в случайные
+страницы, как UUIDv4.
+
+Генератор подключаемый: `set_id_generator` заменяет его во всём процессе
+(например, на `uuid.uuid4` или детерминированный генератор).
+"""
+
+import os
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from uuid import UUID
+
+IdGenerator = Callable[[], UUID]
+
+_COUNTER_BITS = 12
+_COUNTER_MAX = (1 << _COUNTER_BITS) - 1
+
+
+class _MonotonicUUID7:
+    """UUIDv7, монотонно возрастающий в пределах процесса.
+
+    В пределах одной миллисекунды 12 бит `rand_a` используются как счётчик
+    (метод 1 из RFC 9562, раздел 6.2). При переполнении счётчика или переводе
+    часов назад время берётся из предыдущего идентификатора плюс 1 мс, поэтому
+    порядок идентификаторов не нарушается.
+    """
+
+    __slots__ = ("_counter", "_lock", "_timestamp_ms")
+
+    def __init__(self) -> None:
+        """Создаёт генератор с пустым состоянием."""
+        self._lock = threading.Lock()
+        self._timestamp_ms = 0
+        self._counter = 0
+
+    def __call__(self) -> UUID:
+        """Возвращает следующий идентификатор.
+
+        Returns:
+            UUID: UUID версии 7.
+        """
+        now_ms = time.time_ns() // 1_000_000
+        random_bits = int.from_bytes(os.urandom(10))
+        with self._lock:
+            if now_ms > self._timestamp_ms:
+                self._timestamp_ms = now_ms
+                self._counter = random_bits >> 73
+            elif self._counter < _COUNTER_MAX:
+                self._counter += 1
+            else:
+                self._timestamp_ms += 1
+                self._counter = 0
+            timestamp_ms = self._timestamp_ms
+            counter = self._counter
+        value = (
+            (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+            | 0x7 << 76
+            | counter << 64
+            | 0b10 << 62
+            | random_bits & 0x3FFF_FFFF_FFFF_FFFF
+        )
+        return UUID(int=value)
+
+
+def _default_uuid7() -> IdGenerator:
+    """Возвращает `uuid.uuid7` из стандартной библиотеки или собственную реализацию."""
+    stdlib_uuid7: IdGenerator | None = getattr(uuid, "uuid7", None)
+    return stdlib_uuid7 if stdlib_uuid7 is not None else _MonotonicUUID7()
+
+
+uuid7: IdGenerator = _default_uuid7()
+_generator: IdGenerator = uuid7
+
+
+def new_id() -> UUID:
+    """Возвращает новый идентификатор текущим генератором процесса.
+
+    Returns:
+        UUID: Новый идентификатор (по умолчанию UUIDv7).
+    """
+    return _generator()
+
+
+def set_id_generator(generator: IdGenerator) -> None:
+    """Заменяет генератор идентификаторов для всего процесса.
+
+    Args:
+        generator: Функция без аргументов, возвращающая `UUID`.
+    """
+    global _generator
+    _generator = generator
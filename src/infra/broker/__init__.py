@@ -1,5 +1,7 @@
 """Интеграция с брокером сообщений."""
 
+from infra.broker.codecs import build_codecs
 from infra.broker.publisher import RabbitPublisher
+from infra.broker.routes import build_event_routes
 
-__all__ = ["RabbitPublisher"]
+__all__ = ["RabbitPublisher", "build_codecs", "build_event_routes"]
@@ -0,0 +1,145 @@
+"""Кодеки тела сообщений брокера.
+
+Формат тела определяется заголовком `content_type`: издатель кодирует
+сообщения кодеком из настроек (`BROKER_CONTENT_TYPE`), потребитель выбирает
+кодек по `content_type` каждого сообщения, поэтому смена формата не требует
+одновременного обновления издателей и потребителей. Сообщение без
+`content_type` считается JSON.
+
+Доступные кодеки:
+- `application/json`;
+- `application/msgpack` (`application/x-msgpack`).
+
+Версия схемы payload (`schema_version`, по умолчанию 1) дублируется в
+заголовке `SCHEMA_VERSION_HEADER`, чтобы её можно было узнать, не декодируя
+тело.
+"""
+
+import json
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, TypeVar
+
+import msgpack
+from pydantic import TypeAdapter
+
+JSON_CONTENT_TYPE = "application/json"
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+SCHEMA_VERSION_HEADER = "x-schema-version"
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class MessageCodec:
+    """Кодек тела сообщения.
+
+    Attributes:
+        content_type: MIME-тип, записываемый в `content_type` сообщения.
+        encode: Преобразует payload в тело сообщения.
+        decode: Преобразует тело сообщения в JSON-совместимые данные.
+    """
+
+    content_type: str
+    encode: Callable[[dict[str, Any]], bytes]
+    decode: Callable[[bytes], Any]
+
+    def validate(self, adapter: TypeAdapter[T], body: bytes) -> T:
+        """Декодирует тело сообщения и проверяет его схемой.
+
+        JSON проверяется сразу из байтов, без промежуточного словаря.
+
+        Args:
+            adapter: Заранее собранная схема сообщения.
+            body: Тело сообщения.
+
+        Returns:
+            T: Проверенное сообщение.
+
+        Raises:
+            ValueError: Тело не декодируется или не соответствует схеме.
+        """
+        if self.content_type == JSON_CONTENT_TYPE:
+            return adapter.validate_json(body)
+        return adapter.validate_python(self.decode(body))
+
+
+def _json_encode(payload: dict[str, Any]) -> bytes:
+    """Кодирует payload в компактный JSON (UTF-8)."""
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+JSON_CODEC = MessageCodec(
+    content_type=JSON_CONTENT_TYPE, encode=_json_encode, decode=json.loads
+)
+
+
+MSGPACK_CODEC = MessageCodec(
+    content_type=MSGPACK_CONTENT_TYPE,
+    encode=partial(msgpack.packb, use_bin_type=True),
+    decode=partial(msgpack.unpackb, raw=False),
+)
+
+
+@dataclass(slots=True)
+class CodecRegistry:
+    """Реестр кодеков по MIME-типам."""
+
+    _codecs: dict[str, MessageCodec] = field(default_factory=dict)
+
+    def register(self, content_type: str, codec: MessageCodec) -> None:
+        """Регистрирует кодек для MIME-типа.
+
+        Args:
+            content_type: MIME-тип (без параметров).
+            codec: Кодек.
+        """
+        self._codecs[content_type.lower()] = codec
+
+    def get(self, content_type: str | None) -> MessageCodec | None:
+        """Возвращает кодек для `content_type` сообщения.
+
+        Параметры MIME-типа (например, `; charset=utf-8`) не учитываются.
+
+        Args:
+            content_type: Значение `content_type` сообщения.
+
+        Returns:
+            MessageCodec | None: Кодек (JSON, если тип не указан) или `None`,
+            если тип не поддерживается.
+        """
+        if not content_type:
+            return self._codecs.get(JSON_CONTENT_TYPE)
+        mime = content_type.partition(";")[0].strip().lower()
+        return self._codecs.get(mime)
+
+    def require(self, content_type: str) -> MessageCodec:
+        """Возвращает кодек для MIME-типа из настроек.
+
+        Args:
+            content_type: MIME-тип.
+
+        Returns:
+            MessageCodec: Кодек.
+
+        Raises:
+            RuntimeError: Кодек не зарегистрирован.
+        """
+        codec = self.get(content_type)
+        if codec is None:
+            raise RuntimeError(f"Кодек сообщений для {content_type!r} недоступен")
+        return codec
+
+
+def build_codecs() -> CodecRegistry:
+    """Собирает реестр доступных кодеков.
+
+    Returns:
+        CodecRegistry: Кодеки JSON и MessagePack.
+    """
+    codecs = CodecRegistry()
+    codecs.register(JSON_CONTENT_TYPE, JSON_CODEC)
+    codecs.register(MSGPACK_CONTENT_TYPE, MSGPACK_CODEC)
+    codecs.register("application/x-msgpack", MSGPACK_CODEC)
+    return codecs
@@ -1,22 +1,50 @@
 """Публикация событий в RabbitMQ.
 
-Модуль реализует издателя событий `new_order` через `aio-pika` с простыми
-повторными попытками и экспоненциальной задержкой.
+Модуль реализует издателя событий через `aio-pika`: `publish_new_order`
+публикует одно событие с повторными попытками и экспоненциальной задержкой,
+`publish_many` — пачку outbox-событий одного маршрута. Сообщения пачки
+отправляются одновременно и подтверждаются брокером (publisher confirms)
+независимо друг от друга, поэтому пачка ждёт подтверждений один раз, а не
+на каждое сообщение.
+
+Тело сообщения кодируется кодеком `codec` (JSON по умолчанию, см.
+`infra.broker.codecs`), версия схемы payload передаётся в заголовке
+`SCHEMA_VERSION_HEADER`.
 """
 
 from __future__ import annotations
 
 import asyncio
-import json
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import Any
 
 import aio_pika
-from aio_pika.abc import AbstractChannel, AbstractRobustConnection
+from aio_pika.abc import (
+    AbstractChannel,
+    AbstractExchange,
+    AbstractRobustConnection,
+)
 
+from application.events import EventRoute
 from application.interfaces.message_broker import (
     MessageBrokerPublisherProtocol,
 )
+from domain.entities.outbox_event import OutboxEvent
+from infra.broker.codecs import JSON_CODEC, SCHEMA_VERSION_HEADER, MessageCodec
+
+
+def _build_message(
+    payload: dict[str, Any], message_id: str | None, codec: MessageCodec
+) -> aio_pika.Message:
+    """Создаёт persistent-сообщение с телом в формате кодека."""
+    return aio_pika.Message(
+        body=codec.encode(payload),
+        delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+        content_type=codec.content_type,
+        headers={SCHEMA_VERSION_HEADER: payload.get("schema_version", 1)},
+        message_id=message_id,
+    )
 
 
 @dataclass(slots=True, kw_only=True)
@@ -28,17 +56,22 @@ class RabbitPublisher(MessageBrokerPublisherProtocol):
         queue_name: Имя очереди для публикации.
         retries: Количество попыток публикации.
         retry_backoff: Базовая задержка между попытками (секунды).
+        codec: Кодек тела сообщений.
     """
 
     url: str
     queue_name: str
     retries: int = 3
     retry_backoff: float = 0.5
+    codec: MessageCodec = JSON_CODEC
 
     _connection: AbstractRobustConnection | None = field(
         default=None, init=False, repr=False
     )
     _channel: AbstractChannel | None = field(default=None, init=False, repr=False)
+    _exchanges: dict[str, AbstractExchange] = field(
+        default_factory=dict, init=False, repr=False
+    )
     _lock: asyncio.Lock = field(
         default_factory=asyncio.Lock, init=False, repr=False
     )
@@ -56,12 +89,7 @@ class RabbitPublisher(MessageBrokerPublisherProtocol):
         raw_event_id = payload.get("event_id")
         if isinstance(raw_event_id, str) and raw_event_id:
             message_id = raw_event_id
-        message = aio_pika.Message(
-            body=json.dumps(payload).encode("utf-8"),
-            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
-            content_type="application/json",
-            message_id=message_id,
-        )
+        message = _build_message(payload, message_id, self.codec)
 
         last_exc: Exception | None = None
         attempts = max(1, int(self.retries))
@@ -82,6 +110,47 @@ class RabbitPublisher(MessageBrokerPublisherProtocol):
         if last_exc:
             raise last_exc
 
+    async def publish_many(
+        self, route: EventRoute, events: Sequence[OutboxEvent]
+    ) -> list[Exception | None]:
+        """Публикует пачку outbox-событий одного маршрута.
+
+        Идентификатор outbox-события передаётся как `message_id`.
+
+        Args:
+            route: Маршрут публикации.
+            events: События для публикации.
+
+        Returns:
+            list[Exception | None]: Результат по каждому событию в порядке
+            `events`: `None` при успехе или исключение.
+        """
+        if not events:
+            return []
+        try:
+            exchange = await self._ensure_exchange(route)
+        except Exception as exc:
+            await self._reset()
+            return [exc for _ in events]
+
+        async def publish(event: OutboxEvent) -> None:
+            await exchange.publish(
+                _build_message(event.payload, str(event.id), self.codec),
+                routing_key=route.routing_key_for(event.payload),
+            )
+
+        results = await asyncio.gather(
+            *(publish(event) for event in events), return_exceptions=True
+        )
+        errors: list[Exception | None] = []
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(
+                result, Exception
+            ):
+                raise result
+            errors.append(result)
+        return errors
+
     async def close(self) -> None:
         """Закрывает соединение/канал с брокером (best-effort)."""
         await self._reset()
@@ -102,13 +171,37 @@ class RabbitPublisher(MessageBrokerPublisherProtocol):
                 channel = await conn.channel()
                 await channel.declare_queue(self.queue_name, durable=True)
                 self._channel = channel
+                self._exchanges.clear()
             ch = self._channel
             assert ch is not None
             return ch
 
+    async def _ensure_exchange(self, route: EventRoute) -> AbstractExchange:
+        """Возвращает exchange маршрута, объявляя его при первом обращении.
+
+        Args:
+            route: Маршрут публикации.
+
+        Returns:
+            AbstractExchange: Exchange для публикации.
+        """
+        channel = await self._ensure_channel()
+        if not route.exchange:
+            return channel.default_exchange
+        exchange = self._exchanges.get(route.exchange)
+        if exchange is None:
+            exchange = await channel.declare_exchange(
+                route.exchange,
+                aio_pika.ExchangeType(route.exchange_type),
+                durable=True,
+            )
+            self._exchanges[route.exchange] = exchange
+        return exchange
+
     async def _reset(self) -> None:
         """Сбрасывает текущее соединение и канал (best-effort)."""
         async with self._lock:
+            self._exchanges.clear()
             if self._channel is not None:
                 try:
                     await self._channel.close()
@@ -0,0 +1,37 @@
+"""Маршруты публикации outbox-событий в RabbitMQ."""
+
+from application.events import (
+    NEW_ORDER_EVENT,
+    ORDER_STATUS_CHANGED_EVENT,
+    EventRoute,
+    EventRouteRegistry,
+)
+
+
+def build_event_routes(
+    *, new_order_queue: str, order_events_exchange: str
+) -> EventRouteRegistry:
+    """Создаёт реестр маршрутов для всех публикуемых типов событий.
+
+    Args:
+        new_order_queue: Очередь событий `new_order` (публикуются через
+            exchange по умолчанию).
+        order_events_exchange: Topic exchange событий заказа
+            (`order_status_changed` с ключом `order.status.<статус>`).
+
+    Returns:
+        EventRouteRegistry: Реестр маршрутов.
+    """
+    routes = EventRouteRegistry()
+    routes.register(
+        NEW_ORDER_EVENT, EventRoute(exchange="", routing_key=new_order_queue)
+    )
+    routes.register(
+        ORDER_STATUS_CHANGED_EVENT,
+        EventRoute(
+            exchange=order_events_exchange,
+            routing_key="order.status.{status}",
+            exchange_type="topic",
+        ),
+    )
+    return routes
@@ -0,0 +1,67 @@
+"""Схемы входящих сообщений брокера.
+
+Схема события `new_order` выбирается по полю `schema_version` (нет поля —
+версия 1). Версии новее известной читаются последней известной схемой:
+изменения схемы только добавляют поля. Схема собирается один раз при импорте
+(`NEW_ORDER_EVENT_SCHEMA`).
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Annotated, Any, Literal
+from uuid import UUID
+
+from pydantic import BaseModel, Discriminator, Tag, TypeAdapter
+
+from domain.value_objects.order_status import OrderStatus
+
+
+class NewOrderEvent(BaseModel):
+    """Схема события `new_order` версии 1 (без снимка заказа)."""
+
+    event: Literal["new_order"]
+    order_id: UUID
+    user_id: int
+    event_id: UUID | None = None
+
+
+class NewOrderEventV2(NewOrderEvent):
+    """Схема события `new_order` версии 2 со снимком заказа."""
+
+    schema_version: int
+    items: list[dict[str, Any]]
+    total_price: Decimal
+    status: OrderStatus
+    created_at: datetime
+    version: int
+
+
+def _new_order_schema_tag(payload: Any) -> str | None:
+    """Возвращает тег схемы события по полю `schema_version`."""
+    if not isinstance(payload, dict):
+        return None
+    version = payload.get("schema_version", 1)
+    if isinstance(version, bool) or not isinstance(version, int) or version < 1:
+        return None
+    return "v1" if version == 1 else "v2"
+
+
+NEW_ORDER_EVENT_SCHEMA: TypeAdapter[NewOrderEvent | NewOrderEventV2] = (
+    TypeAdapter(
+        Annotated[
+            Annotated[NewOrderEvent, Tag("v1")]
+            | Annotated[NewOrderEventV2, Tag("v2")],
+            Discriminator(_new_order_schema_tag),
+        ]
+    )
+)
+
+
+def order_snapshot(event: NewOrderEvent) -> dict[str, Any] | None:
+    """Возвращает JSON-совместимый снимок заказа из события версии 2+."""
+    if not isinstance(event, NewOrderEventV2):
+        return None
+    return event.model_dump(
+        mode="json",
+        include={"items", "total_price", "status", "created_at", "version"},
+    )
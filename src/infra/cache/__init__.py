@@ -1,5 +1,14 @@
-"""Интеграция с Redis (кеш)."""
+"""Интеграция с Redis (кеш, хранилище сессий, защита входа и уведомления)."""
 
+from infra.cache.login_throttle import RedisLoginThrottle
+from infra.cache.order_updates import OrderUpdatesHub, RedisOrderUpdatesPublisher
 from infra.cache.redis_client import RedisCacheClient
+from infra.cache.session_store import RedisSessionStore
 
-__all__ = ["RedisCacheClient"]
+__all__ = [
+    "OrderUpdatesHub",
+    "RedisCacheClient",
+    "RedisLoginThrottle",
+    "RedisOrderUpdatesPublisher",
+    "RedisSessionStore",
+]
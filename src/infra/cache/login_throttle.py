@@ -0,0 +1,176 @@
+"""Защита входа от перебора паролей на Redis.
+
+Неудачные попытки хранятся в скользящем окне: сортированное множество
+`login:fail:<субъект>` с отметками времени попыток. Когда число попыток в окне
+достигает порога, назначается блокировка `login:lock:<субъект>`, длительность
+которой удваивается с каждой следующей блокировкой (уровень хранится в
+`login:level:<субъект>`) вплоть до максимума. Субъект — хеш email или
+IP-адрес клиента.
+
+Ошибки Redis не блокируют вход: ограничитель пропускает попытку и пишет
+предупреждение в лог.
+"""
+
+import hashlib
+import secrets
+import time
+from dataclasses import dataclass, field
+
+import redis.asyncio as redis
+from loguru import logger
+from redis.commands.core import AsyncScript
+
+from application.interfaces.login_throttle import LoginThrottleProtocol
+
+# Скрипт учитывает попытку в скользящем окне и при достижении порога
+# назначает блокировку, удваивая длительность на каждом следующем уровне.
+# KEYS: окно попыток, ключ блокировки, ключ уровня.
+# ARGV: now_ms, window_ms, max_failures, base_s, max_s, member, level_ttl_s.
+_REGISTER_FAILURE_SCRIPT = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+redis.call('ZADD', KEYS[1], now, ARGV[6])
+redis.call('PEXPIRE', KEYS[1], window)
+if redis.call('ZCARD', KEYS[1]) < tonumber(ARGV[3]) then
+    return 0
+end
+local level = redis.call('INCR', KEYS[3])
+redis.call('EXPIRE', KEYS[3], ARGV[7])
+local lock = math.floor(
+    math.min(tonumber(ARGV[4]) * 2 ^ (level - 1), tonumber(ARGV[5]))
+)
+redis.call('SET', KEYS[2], level, 'EX', lock)
+redis.call('DEL', KEYS[1])
+return lock
+"""
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class RedisLoginThrottle(LoginThrottleProtocol):
+    """Учёт неудачных попыток входа по email и IP-адресу на Redis.
+
+    Attributes:
+        client: Асинхронный Redis-клиент.
+        max_failures_per_email: Порог неудач в окне для одного email.
+        max_failures_per_ip: Порог неудач в окне для одного IP-адреса.
+        window_seconds: Длина скользящего окна в секундах.
+        lockout_base_seconds: Длительность первой блокировки.
+        lockout_max_seconds: Максимальная длительность блокировки.
+        prefix: Префикс ключей.
+    """
+
+    client: redis.Redis  # type: ignore[type-arg]
+    max_failures_per_email: int = 5
+    max_failures_per_ip: int = 50
+    window_seconds: int = 900
+    lockout_base_seconds: int = 30
+    lockout_max_seconds: int = 3600
+    prefix: str = ""
+    _register_failure: AsyncScript = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Регистрирует Lua-скрипт учёта неудачной попытки."""
+        object.__setattr__(
+            self,
+            "_register_failure",
+            self.client.register_script(_REGISTER_FAILURE_SCRIPT),
+        )
+
+    def _subjects(self, email: str, ip: str | None) -> list[tuple[str, int]]:
+        """Возвращает субъекты попытки входа и их пороги неудач."""
+        digest = hashlib.sha256(email.strip().lower().encode()).hexdigest()
+        subjects = [(f"email:{digest}", self.max_failures_per_email)]
+        if ip:
+            subjects.append((f"ip:{ip}", self.max_failures_per_ip))
+        return subjects
+
+    def _key(self, kind: str, subject: str) -> str:
+        """Формирует ключ Redis для субъекта."""
+        return f"{self.prefix}login:{kind}:{subject}"
+
+    async def retry_after(self, *, email: str, ip: str | None) -> int:
+        """Проверяет блокировку email и IP-адреса одним pipeline (`TTL`).
+
+        Args:
+            email: Email из попытки входа.
+            ip: IP-адрес клиента (если известен).
+
+        Returns:
+            int: Оставшееся время самой длинной блокировки (`0` — вход
+            разрешён или Redis недоступен).
+        """
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for subject, _ in self._subjects(email, ip):
+                    pipe.ttl(self._key("lock", subject))
+                ttls = await pipe.execute()
+        except redis.RedisError as exc:
+            logger.warning(
+                "Ошибка Redis при проверке блокировки входа",
+                extra={"error": str(exc)},
+            )
+            return 0
+        return max(0, *(int(ttl) for ttl in ttls))
+
+    async def register_failure(self, *, email: str, ip: str | None) -> int:
+        """Учитывает неудачную попытку для email и IP-адреса.
+
+        Args:
+            email: Email из попытки входа.
+            ip: IP-адрес клиента (если известен).
+
+        Returns:
+            int: Длительность назначенной блокировки (`0` — порог не превышен
+            или Redis недоступен).
+        """
+        now_ms = int(time.time() * 1000)
+        member = f"{now_ms}-{secrets.token_hex(4)}"
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for subject, max_failures in self._subjects(email, ip):
+                    await self._register_failure(
+                        keys=[
+                            self._key("fail", subject),
+                            self._key("lock", subject),
+                            self._key("level", subject),
+                        ],
+                        args=[
+                            now_ms,
+                            self.window_seconds * 1000,
+                            max_failures,
+                            self.lockout_base_seconds,
+                            self.lockout_max_seconds,
+                            member,
+                            self.lockout_max_seconds * 2,
+                        ],
+                        client=pipe,
+                    )
+                lockouts = await pipe.execute()
+        except redis.RedisError as exc:
+            logger.warning(
+                "Ошибка Redis при учёте неудачного входа",
+                extra={"error": str(exc)},
+            )
+            return 0
+        return max(int(lockout) for lockout in lockouts)
+
+    async def reset(self, *, email: str) -> None:
+        """Сбрасывает окно неудач и уровень блокировки email.
+
+        Счётчик IP-адреса не сбрасывается: успешный вход в один аккаунт не
+        должен открывать перебор остальных с того же адреса.
+
+        Args:
+            email: Email успешно вошедшего пользователя.
+        """
+        subject, _ = self._subjects(email, None)[0]
+        try:
+            await self.client.delete(
+                self._key("fail", subject), self._key("level", subject)
+            )
+        except redis.RedisError as exc:
+            logger.warning(
+                "Ошибка Redis при сбросе счётчика входа",
+                extra={"error": str(exc)},
+            )
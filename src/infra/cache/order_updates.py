@@ -0,0 +1,172 @@
+"""Потоковая выдача изменений заказов через Redis pub/sub.
+
+Изменения публикуются в один канал Redis сообщениями `<user_id>|<json>`, где
+JSON совпадает с телом ответа `GET /orders/{id}/`. Каждый воркер держит одну
+подписку на канал (`OrderUpdatesHub`) и раздаёт сообщения локальным
+подписчикам по `user_id`, не разбирая JSON; число подписок Redis не зависит
+от числа открытых клиентских соединений.
+
+Доставка «по возможности»: сообщения, опубликованные во время переподключения
+к Redis, теряются. Медленный подписчик, у которого переполнилась очередь,
+отключается, чтобы клиент переподключился и перечитал состояние.
+"""
+
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+
+import redis.asyncio as redis
+from loguru import logger
+from pydantic import TypeAdapter
+
+from application.dtos.order import OrderDTO
+from application.interfaces.order_updates import OrderUpdatesPublisherProtocol
+
+_SEPARATOR = "|"
+_ORDER_SERIALIZER: TypeAdapter[OrderDTO] = TypeAdapter(OrderDTO)
+
+OrderUpdatesQueue = asyncio.Queue[str | None]
+
+
+def order_updates_channel(prefix: str) -> str:
+    """Возвращает имя канала Redis с изменениями заказов.
+
+    Args:
+        prefix: Префикс ключей приложения.
+
+    Returns:
+        str: Имя канала.
+    """
+    return f"{prefix}orders:updates"
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class RedisOrderUpdatesPublisher(OrderUpdatesPublisherProtocol):
+    """Публикация изменений заказов в канал Redis.
+
+    Attributes:
+        client: Асинхронный Redis-клиент.
+        channel: Канал изменений заказов.
+    """
+
+    client: redis.Redis  # type: ignore[type-arg]
+    channel: str
+
+    async def publish(self, order: OrderDTO) -> None:
+        """Публикует новое состояние заказа.
+
+        Args:
+            order: Заказ после изменения.
+        """
+        body = _ORDER_SERIALIZER.dump_json(order).decode()
+        await self.client.publish(
+            self.channel, f"{order.user_id}{_SEPARATOR}{body}"
+        )
+
+
+@dataclass(slots=True, kw_only=True)
+class OrderUpdatesHub:
+    """Подписка воркера на изменения заказов с раздачей по пользователям.
+
+    Attributes:
+        client: Асинхронный Redis-клиент (`decode_responses=True`).
+        channel: Канал изменений заказов.
+        queue_size: Размер очереди одного подписчика.
+        reconnect_delay: Пауза (секунды) перед повторной подпиской после
+            ошибки Redis.
+    """
+
+    client: redis.Redis  # type: ignore[type-arg]
+    channel: str
+    queue_size: int = 100
+    reconnect_delay: float = 1.0
+    _listeners: dict[int, set[OrderUpdatesQueue]] = field(
+        default_factory=dict, init=False
+    )
+    _task: asyncio.Task[None] | None = field(default=None, init=False)
+
+    def start(self) -> None:
+        """Запускает фоновую подписку на канал."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Останавливает подписку и отключает всех подписчиков."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        for queues in self._listeners.values():
+            for queue in queues:
+                _disconnect(queue)
+
+    @contextlib.asynccontextmanager
+    async def subscribe(self, user_id: int) -> AsyncIterator[OrderUpdatesQueue]:
+        """Подписывает локального получателя на изменения заказов пользователя.
+
+        Args:
+            user_id: Идентификатор пользователя.
+
+        Yields:
+            OrderUpdatesQueue: Очередь JSON-тел заказов; `None` означает, что
+            подписка завершена и соединение нужно закрыть.
+        """
+        queue: OrderUpdatesQueue = asyncio.Queue(maxsize=self.queue_size)
+        self._listeners.setdefault(user_id, set()).add(queue)
+        try:
+            yield queue
+        finally:
+            queues = self._listeners.get(user_id)
+            if queues is not None:
+                queues.discard(queue)
+                if not queues:
+                    del self._listeners[user_id]
+
+    async def _run(self) -> None:
+        """Читает канал и переподписывается после любых ошибок.
+
+        Подписка живёт всё время работы воркера, поэтому и непредвиденная
+        ошибка не должна молча оставлять клиентов без обновлений.
+        """
+        while True:
+            try:
+                async with self.client.pubsub(
+                    ignore_subscribe_messages=True
+                ) as pubsub:
+                    await pubsub.subscribe(self.channel)
+                    async for message in pubsub.listen():
+                        self._dispatch(message["data"])
+            except redis.RedisError as exc:
+                logger.warning(
+                    "Подписка на изменения заказов прервана; переподключение",
+                    extra={"error": str(exc), "channel": self.channel},
+                )
+            except Exception as exc:
+                logger.error(
+                    "Ошибка подписки на изменения заказов; переподключение",
+                    extra={"error": repr(exc), "channel": self.channel},
+                )
+            await asyncio.sleep(self.reconnect_delay)
+
+    def _dispatch(self, data: str) -> None:
+        """Передаёт сообщение очередям подписчиков его владельца."""
+        user_part, _, body = data.partition(_SEPARATOR)
+        # `isdigit` без `isascii` пропускает «²», на котором `int` падает.
+        is_user_id = user_part.isascii() and user_part.isdigit()
+        queues = self._listeners.get(int(user_part)) if is_user_id else None
+        if not queues:
+            return
+        for queue in queues:
+            try:
+                queue.put_nowait(body)
+            except asyncio.QueueFull:
+                _disconnect(queue)
+
+
+def _disconnect(queue: OrderUpdatesQueue) -> None:
+    """Очищает очередь подписчика и помещает в неё признак завершения."""
+    while not queue.empty():
+        queue.get_nowait()
+    queue.put_nowait(None)
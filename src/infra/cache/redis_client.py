@@ -1,12 +1,31 @@
 """Реализация кеша на Redis."""
 
-from dataclasses import dataclass
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
 
 from loguru import logger
 import redis.asyncio as redis
+from redis.commands.core import AsyncScript
 
 from application.interfaces.cache import CacheProtocol
 
+# Скрипт атомарно сравнивает версию из префикса текущего значения и новую
+# версию, перезаписывая ключ только более новой версией.
+_SET_VERSIONED_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if current then
+    local current_version = tonumber(string.match(current, '^(%d+)|'))
+    if current_version and current_version >= tonumber(ARGV[2]) then
+        return 0
+    end
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[3])
+return 1
+"""
+
+# Служебный элемент отсортированного множества: признак полного индекса.
+_INDEX_COMPLETE_MARKER = "__complete__"
+
 
 @dataclass(slots=True, frozen=True, kw_only=True)
 class RedisCacheClient(CacheProtocol):
@@ -21,6 +40,15 @@ class RedisCacheClient(CacheProtocol):
     client: redis.Redis  # type: ignore[type-arg]
     ttl: int
     prefix: str = ""
+    _set_versioned: AsyncScript = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Регистрирует Lua-скрипты (EVALSHA с автоматическим SCRIPT LOAD)."""
+        object.__setattr__(
+            self,
+            "_set_versioned",
+            self.client.register_script(_SET_VERSIONED_SCRIPT),
+        )
 
     def _k(self, key: str) -> str:
         """Формирует полный ключ с учётом префикса."""
@@ -66,6 +94,197 @@ class RedisCacheClient(CacheProtocol):
             )
             return False
 
+    async def get_many(self, keys: Sequence[str]) -> list[str | None]:
+        """Возвращает значения по нескольким ключам одной командой `MGET`.
+
+        Args:
+            keys: Ключи без префикса.
+
+        Returns:
+            list[str | None]: Значения в порядке `keys`; при ошибке Redis —
+            список из `None`.
+        """
+        if not keys:
+            return []
+        try:
+            values: list[str | None] = await self.client.mget(
+                [self._k(key) for key in keys]
+            )
+            return values
+        except redis.RedisError as exc:
+            logger.error(
+                "Ошибка Redis при пакетном чтении",
+                extra={"error": str(exc), "keys_count": len(keys)},
+            )
+            return [None] * len(keys)
+
+    async def set_many(
+        self, items: Mapping[str, str], ttl: int | None = None
+    ) -> bool:
+        """Сохраняет несколько значений через pipeline (один round trip).
+
+        Args:
+            items: Пары ключ (без префикса) → значение.
+            ttl: TTL в секундах. Если `None`, используется `self.ttl`.
+
+        Returns:
+            bool: `True` при успехе, иначе `False`.
+        """
+        if not items:
+            return True
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.set(self._k(key), value, ex=ttl or self.ttl)
+                await pipe.execute()
+            return True
+        except redis.RedisError as exc:
+            logger.error(
+                "Ошибка Redis при пакетной записи",
+                extra={"error": str(exc), "keys_count": len(items)},
+            )
+            return False
+
+    async def set_versioned(
+        self, key: str, value: str, *, version: int, ttl: int | None = None
+    ) -> bool:
+        """Сохраняет значение, только если оно новее уже сохранённого.
+
+        Args:
+            key: Ключ без префикса.
+            value: Значение с префиксом `<version>|`.
+            version: Версия сохраняемого значения.
+            ttl: TTL в секундах. Если `None`, используется `self.ttl`.
+
+        Returns:
+            bool: `True`, если значение записано, иначе `False`.
+        """
+        try:
+            written = await self._set_versioned(
+                keys=[self._k(key)], args=[value, version, ttl or self.ttl]
+            )
+            return bool(written)
+        except redis.RedisError as exc:
+            logger.error(
+                "Ошибка Redis при версионной записи",
+                extra={"error": str(exc), "key": key, "full_key": self._k(key)},
+            )
+            return False
+
+    async def set_many_versioned(
+        self, items: Mapping[str, tuple[str, int]], ttl: int | None = None
+    ) -> bool:
+        """Выполняет версионную запись нескольких значений через pipeline.
+
+        Args:
+            items: Пары ключ (без префикса) → (значение с префиксом `<version>|`,
+                версия).
+            ttl: TTL в секундах. Если `None`, используется `self.ttl`.
+
+        Returns:
+            bool: `True` при успехе, иначе `False`.
+        """
+        if not items:
+            return True
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key, (value, version) in items.items():
+                    await self._set_versioned(
+                        keys=[self._k(key)],
+                        args=[value, version, ttl or self.ttl],
+                        client=pipe,
+                    )
+                await pipe.execute()
+            return True
+        except redis.RedisError as exc:
+            logger.error(
+                "Ошибка Redis при пакетной версионной записи",
+                extra={"error": str(exc), "keys_count": len(items)},
+            )
+            return False
+
+    async def get_index(self, key: str) -> list[str] | None:
+        """Возвращает элементы индекса (sorted set) по убыванию веса.
+
+        Args:
+            key: Ключ индекса без префикса.
+
+        Returns:
+            list[str] | None: Элементы индекса или `None`, если индекс не
+            заполнен (нет маркера полноты) либо произошла ошибка Redis.
+        """
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                pipe.zscore(self._k(key), _INDEX_COMPLETE_MARKER)
+                pipe.zrevrange(self._k(key), 0, -1)
+                marker, members = await pipe.execute()
+        except redis.RedisError as exc:
+            logger.error(
+                "Ошибка Redis при чтении индекса",
+                extra={"error": str(exc), "key": key, "full_key": self._k(key)},
+            )
+            return None
+        if marker is None:
+            return None
+        return [member for member in members if member != _INDEX_COMPLETE_MARKER]
+
+    async def fill_index(
+        self, key: str, members: Mapping[str, float], ttl: int | None = None
+    ) -> bool:
+        """Заполняет индекс и добавляет маркер полноты (в одной транзакции).
+
+        Args:
+            key: Ключ индекса без префикса.
+            members: Пары элемент → вес.
+            ttl: TTL в секундах. Если `None`, используется `self.ttl`.
+
+        Returns:
+            bool: `True` при успехе, иначе `False`.
+        """
+        mapping: dict[str | bytes, float] = {
+            member: score for member, score in members.items()
+        }
+        mapping[_INDEX_COMPLETE_MARKER] = float("-inf")
+        try:
+            async with self.client.pipeline(transaction=True) as pipe:
+                pipe.zadd(self._k(key), mapping)
+                pipe.expire(self._k(key), ttl or self.ttl)
+                await pipe.execute()
+            return True
+        except redis.RedisError as exc:
+            logger.error(
+                "Ошибка Redis при заполнении индекса",
+                extra={"error": str(exc), "key": key, "full_key": self._k(key)},
+            )
+            return False
+
+    async def add_to_index(
+        self, key: str, member: str, *, score: float, ttl: int | None = None
+    ) -> bool:
+        """Добавляет элемент в индекс (sorted set).
+
+        Args:
+            key: Ключ индекса без префикса.
+            member: Элемент.
+            score: Вес элемента.
+            ttl: TTL в секундах. Если `None`, используется `self.ttl`.
+
+        Returns:
+            bool: `True` при успехе, иначе `False`.
+        """
+        try:
+            async with self.client.pipeline(transaction=True) as pipe:
+                pipe.zadd(self._k(key), {member: score})
+                pipe.expire(self._k(key), ttl or self.ttl)
+                await pipe.execute()
+            return True
+        except redis.RedisError as exc:
+            logger.error(
+                "Ошибка Redis при добавлении в индекс",
+                extra={"error": str(exc), "key": key, "full_key": self._k(key)},
+            )
+            return False
+
     async def delete(self, key: str) -> bool:
         """Удаляет значение по ключу.
 
@@ -85,6 +304,27 @@ class RedisCacheClient(CacheProtocol):
             )
             return False
 
+    async def delete_many(self, keys: Sequence[str]) -> bool:
+        """Удаляет значения по нескольким ключам одной командой `DEL`.
+
+        Args:
+            keys: Ключи без префикса.
+
+        Returns:
+            bool: `True` при успехе, иначе `False`.
+        """
+        if not keys:
+            return True
+        try:
+            await self.client.delete(*(self._k(key) for key in keys))
+            return True
+        except redis.RedisError as exc:
+            logger.error(
+                "Ошибка Redis при пакетном удалении",
+                extra={"error": str(exc), "keys_count": len(keys)},
+            )
+            return False
+
     async def close(self) -> None:
         """Закрывает соединение с Redis (best-effort)."""
         try:
@@ -0,0 +1,216 @@
+"""Хранилище сессий токенов обновления на Redis.
+
+Сессия хранится по ключу `session:<hash>` (JSON с `user_id`, `email` и
+поколением), а хеш дополнительно попадает в множество
+`sessions:user:<user_id>`, по которому отзываются все сессии пользователя.
+Токен одноразовый: `consume` извлекает сессию командой `GETDEL`.
+
+Отзыв увеличивает поколение сессий пользователя (`sessions:generation:<id>`).
+Сессия помнит поколение, в котором выдан исходный вход, и ротация сохраняет
+новую сессию, только если поколение с тех пор не изменилось (проверка и
+запись выполняются одним Lua-скриптом). Поэтому ротация, которая успела
+погасить старый токен до отзыва, не переживает отзыв. Ключ поколения хранится
+без TTL: иначе после его истечения старые сессии снова стали бы действующими.
+
+Lua-скрипты получают все ключи через `KEYS`, но ключи сессий и множества
+пользователя попадают в разные слоты, поэтому поддерживается только Redis без
+кластера.
+"""
+
+import contextlib
+import json
+from dataclasses import dataclass, field
+
+import redis.asyncio as redis
+from loguru import logger
+from redis.commands.core import AsyncScript
+
+from application.dtos.auth import RefreshSessionDTO
+from application.exceptions import SessionStoreUnavailableError
+from application.interfaces.sessions import SessionStoreProtocol
+
+# Скрипт сохраняет сессию, если поколение пользователя не изменилось.
+# KEYS: сессия, множество пользователя, поколение; ARGV: JSON сессии, TTL,
+# хеш токена и ожидаемое поколение (пустая строка — текущее). Возвращает 1,
+# если сессия сохранена, и 0, если сессии пользователя были отозваны.
+_CREATE_SCRIPT = """
+local generation = tonumber(redis.call('GET', KEYS[3]) or '0')
+if ARGV[4] ~= '' and tonumber(ARGV[4]) ~= generation then
+    return 0
+end
+local session = cjson.decode(ARGV[1])
+session['generation'] = generation
+redis.call('SET', KEYS[1], cjson.encode(session), 'EX', ARGV[2])
+redis.call('SADD', KEYS[2], ARGV[3])
+redis.call('EXPIRE', KEYS[2], ARGV[2])
+return 1
+"""
+
+# Скрипт увеличивает поколение, удаляет сессии и убирает их хеши из множества.
+# KEYS[1] — множество, KEYS[2] — поколение, KEYS[3..] — ключи сессий, ARGV —
+# их хеши по порядку. Сессии, созданные после чтения множества, остаются в нём,
+# но их поколение уже устарело, и ротировать их нельзя.
+_REVOKE_USER_SCRIPT = """
+redis.call('INCR', KEYS[2])
+local revoked = 0
+for i = 3, #KEYS do
+    revoked = revoked + redis.call('DEL', KEYS[i])
+    redis.call('SREM', KEYS[1], ARGV[i - 2])
+end
+return revoked
+"""
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class RedisSessionStore(SessionStoreProtocol):
+    """Хранилище сессий (refresh-токенов) на базе Redis.
+
+    Attributes:
+        client: Асинхронный Redis-клиент.
+        prefix: Префикс ключей.
+    """
+
+    client: redis.Redis  # type: ignore[type-arg]
+    prefix: str = ""
+    _create: AsyncScript = field(init=False, repr=False)
+    _revoke_user: AsyncScript = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Регистрирует Lua-скрипты сохранения и отзыва сессий."""
+        object.__setattr__(
+            self, "_create", self.client.register_script(_CREATE_SCRIPT)
+        )
+        object.__setattr__(
+            self, "_revoke_user", self.client.register_script(_REVOKE_USER_SCRIPT)
+        )
+
+    def _session_key(self, token_hash: str) -> str:
+        """Формирует ключ сессии."""
+        return f"{self.prefix}session:{token_hash}"
+
+    def _user_key(self, user_id: int) -> str:
+        """Формирует ключ множества сессий пользователя."""
+        return f"{self.prefix}sessions:user:{user_id}"
+
+    def _generation_key(self, user_id: int) -> str:
+        """Формирует ключ поколения сессий пользователя."""
+        return f"{self.prefix}sessions:generation:{user_id}"
+
+    async def create(
+        self, token_hash: str, session: RefreshSessionDTO, *, ttl: int
+    ) -> bool:
+        """Сохраняет сессию и регистрирует её в множестве пользователя.
+
+        Args:
+            token_hash: Хеш токена обновления.
+            session: Данные сессии.
+            ttl: Время жизни сессии в секундах.
+
+        Returns:
+            bool: `True`, если сессия сохранена; `False`, если сессии
+            пользователя отозваны после выдачи `session`.
+
+        Raises:
+            SessionStoreUnavailableError: Если Redis недоступен.
+        """
+        value = json.dumps({"user_id": session.user_id, "email": session.email})
+        expected = "" if session.generation is None else str(session.generation)
+        try:
+            created = await self._create(
+                keys=[
+                    self._session_key(token_hash),
+                    self._user_key(session.user_id),
+                    self._generation_key(session.user_id),
+                ],
+                args=[value, ttl, token_hash, expected],
+            )
+        except redis.RedisError as exc:
+            logger.error(
+                "Ошибка Redis при сохранении сессии",
+                extra={"error": str(exc), "user_id": session.user_id},
+            )
+            raise SessionStoreUnavailableError(
+                "Хранилище сессий недоступно"
+            ) from exc
+        return bool(created)
+
+    async def consume(self, token_hash: str) -> RefreshSessionDTO | None:
+        """Извлекает и удаляет сессию (`GETDEL`).
+
+        Args:
+            token_hash: Хеш токена обновления.
+
+        Returns:
+            RefreshSessionDTO | None: Сессия или `None`, если она не найдена.
+
+        Raises:
+            SessionStoreUnavailableError: Если Redis недоступен.
+        """
+        try:
+            value = await self.client.getdel(self._session_key(token_hash))
+        except redis.RedisError as exc:
+            logger.error(
+                "Ошибка Redis при чтении сессии",
+                extra={"error": str(exc), "token_hash": token_hash},
+            )
+            raise SessionStoreUnavailableError(
+                "Хранилище сессий недоступно"
+            ) from exc
+        if value is None:
+            return None
+        try:
+            raw = json.loads(value)
+            session = RefreshSessionDTO(
+                user_id=int(raw["user_id"]),
+                email=str(raw["email"]),
+                generation=int(raw.get("generation", 0)),
+            )
+        except (KeyError, TypeError, ValueError):
+            logger.warning(
+                "Повреждённая запись сессии удалена",
+                extra={"token_hash": token_hash},
+            )
+            return None
+        # Устаревший хеш в множестве безвреден: множество очищается отзывом или
+        # истечением TTL.
+        with contextlib.suppress(redis.RedisError):
+            await self.client.srem(self._user_key(session.user_id), token_hash)
+        return session
+
+    async def revoke_user(self, user_id: int) -> int:
+        """Отзывает все сессии пользователя.
+
+        Хеши читаются из множества пользователя, затем Lua-скрипт атомарно
+        увеличивает поколение сессий пользователя и удаляет сессии.
+
+        Args:
+            user_id: Идентификатор пользователя.
+
+        Returns:
+            int: Количество отозванных сессий.
+
+        Raises:
+            SessionStoreUnavailableError: Если Redis недоступен.
+        """
+        user_key = self._user_key(user_id)
+        try:
+            hashes = list(await self.client.smembers(user_key))
+            # Скрипт вызывается и без сессий: поколение нужно увеличить, даже
+            # если единственная сессия сейчас ротируется.
+            revoked = await self._revoke_user(
+                keys=[
+                    user_key,
+                    self._generation_key(user_id),
+                    *map(self._session_key, hashes),
+                ],
+                args=hashes,
+            )
+        except redis.RedisError as exc:
+            logger.error(
+                "Ошибка Redis при отзыве сессий",
+                extra={"error": str(exc), "user_id": user_id},
+            )
+            raise SessionStoreUnavailableError(
+                "Хранилище сессий недоступно"
+            ) from exc
+        return int(revoked)
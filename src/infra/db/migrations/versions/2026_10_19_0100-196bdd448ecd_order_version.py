@@ -0,0 +1,43 @@
+"""Order version and updated_at
+
+Revision ID: 196bdd448ecd
+Revises: 97a3cd550d8b
+Create Date: 2026-10-19 01:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "196bdd448ecd"
+down_revision: str | Sequence[str] | None = "97a3cd550d8b"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "orders",
+        sa.Column("version", sa.Integer(), server_default="1", nullable=False),
+    )
+    op.add_column(
+        "orders",
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+    )
+    op.execute("UPDATE orders SET updated_at = created_at")
+    op.alter_column("orders", "updated_at", nullable=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("orders", "updated_at")
+    op.drop_column("orders", "version")
@@ -0,0 +1,47 @@
+"""Outbox pending partial index
+
+Revision ID: 5baac6fca73e
+Revises: 196bdd448ecd
+Create Date: 2026-10-19 02:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "5baac6fca73e"
+down_revision: str | Sequence[str] | None = "196bdd448ecd"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Индекс создаётся `CONCURRENTLY` (вне транзакции миграции), чтобы не
+    блокировать запись в outbox на большой таблице.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_outbox_events_pending",
+            "outbox_events",
+            ["created_at"],
+            unique=False,
+            postgresql_where=sa.text("processed_at IS NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_outbox_events_pending",
+            table_name="outbox_events",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,88 @@
+"""Outbox retry bookkeeping
+
+Revision ID: 81b713e080da
+Revises: 5baac6fca73e
+Create Date: 2026-10-19 03:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "81b713e080da"
+down_revision: str | Sequence[str] | None = "5baac6fca73e"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Новые колонки добавляются со значениями по умолчанию без перезаписи
+    таблицы; индекс очереди пересоздаётся `CONCURRENTLY`.
+    """
+    op.add_column(
+        "outbox_events",
+        sa.Column("attempts", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.add_column(
+        "outbox_events",
+        sa.Column(
+            "next_attempt_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    )
+    op.add_column(
+        "outbox_events", sa.Column("last_error", sa.Text(), nullable=True)
+    )
+    op.add_column(
+        "outbox_events",
+        sa.Column("dead_lettered_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_outbox_events_due",
+            "outbox_events",
+            ["next_attempt_at"],
+            unique=False,
+            postgresql_where=sa.text(
+                "processed_at IS NULL AND dead_lettered_at IS NULL"
+            ),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_outbox_events_pending",
+            table_name="outbox_events",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_outbox_events_pending",
+            "outbox_events",
+            ["created_at"],
+            unique=False,
+            postgresql_where=sa.text("processed_at IS NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_outbox_events_due",
+            table_name="outbox_events",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("outbox_events", "dead_lettered_at")
+    op.drop_column("outbox_events", "last_error")
+    op.drop_column("outbox_events", "next_attempt_at")
+    op.drop_column("outbox_events", "attempts")
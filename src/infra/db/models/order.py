@@ -5,7 +5,7 @@ from decimal import Decimal
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import DateTime, Enum, ForeignKey, JSON, Numeric, func
+from sqlalchemy import DateTime, Enum, ForeignKey, Integer, JSON, Numeric, func
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -36,3 +36,12 @@ class OrderModel(Base):
         server_default=func.now(),
         default=lambda: datetime.now(UTC),
     )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+    )
+    version: Mapped[int] = mapped_column(
+        Integer, server_default="1", default=1, nullable=False
+    )
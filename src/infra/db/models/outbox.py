@@ -4,22 +4,38 @@ from __future__ import annotations
 
 from datetime import UTC, datetime
 from typing import Any
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import DateTime, JSON, String, func
+from sqlalchemy import DateTime, Index, Integer, JSON, String, Text, func, text
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
 
+from domain.identifiers import new_id
 from infra.db.base import Base
 
 
 class OutboxEventModel(Base):
-    """SQLAlchemy-модель outbox-события."""
+    """SQLAlchemy-модель outbox-события.
+
+    Частичный индекс `ix_outbox_events_due` содержит только события, которые
+    ещё нужно опубликовать (не обработанные и не в dead letter), упорядоченные
+    по `next_attempt_at`: выборка очереди не зависит от числа обработанных
+    строк и не читает события, время повтора которых ещё не наступило.
+    """
 
     __tablename__ = "outbox_events"
+    __table_args__ = (
+        Index(
+            "ix_outbox_events_due",
+            "next_attempt_at",
+            postgresql_where=text(
+                "processed_at IS NULL AND dead_lettered_at IS NULL"
+            ),
+        ),
+    )
 
     id: Mapped[UUID] = mapped_column(
-        PGUUID(as_uuid=True), primary_key=True, default=uuid4, nullable=False
+        PGUUID(as_uuid=True), primary_key=True, default=new_id, nullable=False
     )
     event_type: Mapped[str] = mapped_column(
         String(100), nullable=False, index=True
@@ -37,3 +53,16 @@ class OutboxEventModel(Base):
         nullable=True,
         index=True,
     )
+    attempts: Mapped[int] = mapped_column(
+        Integer, server_default="0", default=0, nullable=False
+    )
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+    )
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    dead_lettered_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
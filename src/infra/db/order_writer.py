@@ -0,0 +1,200 @@
+"""Запись новых заказов: отдельная транзакция или group commit.
+
+`UnitOfWorkOrderWriter` сохраняет каждый заказ в собственной транзакции
+запроса. `GroupCommitOrderWriter` (включается `ORDER_GROUP_COMMIT_ENABLED`)
+собирает заказы, пришедшие в воркер одновременно, в течение `max_delay`
+секунд или до `max_batch` штук и сохраняет их многострочными `INSERT` в одной
+транзакции: вместо ожидания fsync WAL на каждый заказ пачка ждёт один.
+
+Если пачка не записалась (например, одна строка нарушила ограничение), заказы
+повторно записываются в одной транзакции, каждый внутри своего savepoint:
+ошибка получает только тот вызов, чья строка её вызвала. Ошибка самого
+`COMMIT` не повторяется: при обрыве соединения исход фиксации неизвестен, и
+повтор сообщил бы уже сохранённым заказам о нарушении первичного ключа, поэтому
+все вызовы пачки получают исходную ошибку.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from application.interfaces.order_writer import OrderWriterProtocol
+from application.interfaces.uow import UnitOfWorkProtocol
+from domain.entities.order import Order
+from domain.entities.outbox_event import OutboxEvent
+from infra.db.repositories import (
+    OrderRepositorySQLAlchemy,
+    OutboxRepositorySQLAlchemy,
+)
+
+
+@dataclass(slots=True, kw_only=True)
+class UnitOfWorkOrderWriter(OrderWriterProtocol):
+    """Запись заказа в отдельной транзакции unit-of-work запроса."""
+
+    uow: UnitOfWorkProtocol
+
+    async def create(self, order: Order, event: OutboxEvent) -> Order:
+        """Сохраняет заказ и outbox-событие и фиксирует транзакцию.
+
+        Args:
+            order: Доменная сущность заказа.
+            event: Событие о создании заказа.
+
+        Returns:
+            Order: Созданный заказ.
+        """
+        async with self.uow:
+            created = await self.uow.order_repo.create(order)
+            await self.uow.outbox_repo.add(event)
+            await self.uow.commit()
+        return created
+
+
+@dataclass(slots=True)
+class _PendingOrder:
+    """Заказ, ожидающий записи в составе пачки."""
+
+    order: Order
+    event: OutboxEvent
+    future: asyncio.Future[Order]
+
+
+@dataclass(slots=True, kw_only=True)
+class GroupCommitOrderWriter(OrderWriterProtocol):
+    """Накопитель заказов воркера с общей транзакцией на пачку.
+
+    Attributes:
+        session_factory: Фабрика сессий SQLAlchemy.
+        max_batch: Размер пачки, при котором запись начинается сразу.
+        max_delay: Максимальное ожидание (секунды) первого заказа пачки.
+    """
+
+    session_factory: async_sessionmaker[AsyncSession]
+    max_batch: int = 64
+    max_delay: float = 0.002
+    _pending: list[_PendingOrder] = field(default_factory=list, init=False)
+    _timer: asyncio.TimerHandle | None = field(default=None, init=False)
+    _flushes: set[asyncio.Task[None]] = field(default_factory=set, init=False)
+
+    async def create(self, order: Order, event: OutboxEvent) -> Order:
+        """Ставит заказ в текущую пачку и ждёт её фиксации.
+
+        Args:
+            order: Доменная сущность заказа.
+            event: Событие о создании заказа.
+
+        Returns:
+            Order: Созданный заказ.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Order] = loop.create_future()
+        self._pending.append(_PendingOrder(order, event, future))
+        if len(self._pending) >= self.max_batch:
+            self._flush_pending()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._flush_pending)
+        return await future
+
+    async def close(self) -> None:
+        """Записывает накопленные заказы и дожидается незавершённых пачек."""
+        self._flush_pending()
+        if self._flushes:
+            await asyncio.gather(*self._flushes)
+
+    def _flush_pending(self) -> None:
+        """Забирает текущую пачку и запускает её запись в фоне."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.create_task(self._flush(batch))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, batch: list[_PendingOrder]) -> None:
+        """Записывает пачку; при ошибке повторяет запись с изоляцией заказов."""
+        batch = [item for item in batch if not item.future.done()]
+        if not batch:
+            return
+        async with self.session_factory() as session:
+            try:
+                created = await self._insert_batch(session, batch)
+            except Exception as exc:
+                await session.rollback()
+                logger.warning(
+                    "Групповая запись заказов не удалась; повтор по одному заказу",
+                    extra={"error": str(exc), "batch_size": len(batch)},
+                )
+                created = None
+            else:
+                try:
+                    await session.commit()
+                except Exception as exc:
+                    logger.error(
+                        "Ошибка фиксации пачки заказов, исход неизвестен",
+                        extra={"error": str(exc), "batch_size": len(batch)},
+                    )
+                    for item in batch:
+                        _reject(item.future, exc)
+                    return
+        if created is None:
+            await self._insert_isolated(batch)
+            return
+        for item, order in zip(batch, created, strict=True):
+            _resolve(item.future, order)
+
+    @staticmethod
+    async def _insert_batch(
+        session: AsyncSession, batch: list[_PendingOrder]
+    ) -> list[Order]:
+        """Выполняет два многострочных `INSERT` пачки (без фиксации)."""
+        created = await OrderRepositorySQLAlchemy(session=session).create_many(
+            [item.order for item in batch]
+        )
+        await OutboxRepositorySQLAlchemy(session=session).add_many(
+            [item.event for item in batch]
+        )
+        return created
+
+    async def _insert_isolated(self, batch: list[_PendingOrder]) -> None:
+        """Записывает каждый заказ пачки в своём savepoint общей транзакции."""
+        outcomes: list[tuple[_PendingOrder, Order | Exception]] = []
+        try:
+            async with self.session_factory() as session, session.begin():
+                orders = OrderRepositorySQLAlchemy(session=session)
+                outbox = OutboxRepositorySQLAlchemy(session=session)
+                for item in batch:
+                    try:
+                        async with session.begin_nested():
+                            created = await orders.create(item.order)
+                            await outbox.add_many([item.event])
+                    except Exception as exc:
+                        outcomes.append((item, exc))
+                    else:
+                        outcomes.append((item, created))
+        except Exception as exc:
+            for item in batch:
+                _reject(item.future, exc)
+            return
+        for item, outcome in outcomes:
+            if isinstance(outcome, Exception):
+                _reject(item.future, outcome)
+            else:
+                _resolve(item.future, outcome)
+
+
+def _resolve(future: asyncio.Future[Order], order: Order) -> None:
+    """Передаёт результат ожидающему вызову, если он ещё ждёт."""
+    if not future.done():
+        future.set_result(order)
+
+
+def _reject(future: asyncio.Future[Order], exc: Exception) -> None:
+    """Передаёт ошибку ожидающему вызову, если он ещё ждёт."""
+    if not future.done():
+        future.set_exception(exc)
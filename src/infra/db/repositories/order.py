@@ -1,11 +1,21 @@
-"""Репозиторий заказов на SQLAlchemy."""
+"""Репозиторий заказов на SQLAlchemy.
 
+Запросы только на чтение выбирают колонки через Core (`select(*columns)`) и
+преобразуют кортежи строк напрямую в `Order.restore`, минуя identity map ORM
+и повторную проверку инвариантов: строки БД считаются доверенными.
+
+Все запросы собираются один раз на уровне модуля и выполняются с
+привязанными параметрами (`bindparam`): SQL и ключ кеша компиляции не
+меняются между вызовами, поэтому asyncpg переиспользует подготовленные
+выражения соединения.
+"""
+
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 from uuid import UUID
-from decimal import Decimal
 
-from sqlalchemy import select, update
+from sqlalchemy import bindparam, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from application.interfaces.repositories import OrderRepositoryProtocol
@@ -13,6 +23,76 @@ from domain.entities.order import Order
 from domain.value_objects.order_status import OrderStatus
 from infra.db.models import OrderModel
 
+_ORDER_COLUMNS = (
+    OrderModel.id,
+    OrderModel.user_id,
+    OrderModel.items,
+    OrderModel.total_price,
+    OrderModel.status,
+    OrderModel.created_at,
+    OrderModel.updated_at,
+    OrderModel.version,
+)
+
+_INSERT_ORDER = insert(OrderModel).returning(*_ORDER_COLUMNS)
+_INSERT_ORDERS = insert(OrderModel).returning(
+    *_ORDER_COLUMNS, sort_by_parameter_order=True
+)
+_GET_BY_ID = select(*_ORDER_COLUMNS).where(OrderModel.id == bindparam("order_id"))
+_LIST_BY_USER = (
+    select(*_ORDER_COLUMNS)
+    .where(OrderModel.user_id == bindparam("user_id"))
+    .order_by(OrderModel.created_at.desc(), OrderModel.id.desc())
+)
+_UPDATE_STATUS = (
+    update(OrderModel)
+    .where(
+        OrderModel.id == bindparam("order_id"),
+        OrderModel.user_id == bindparam("owner_id"),
+    )
+    .values(
+        status=bindparam("new_status"),
+        version=OrderModel.version + 1,
+        updated_at=func.now(),
+    )
+    .returning(*_ORDER_COLUMNS)
+    .execution_options(synchronize_session=False)
+)
+_UPDATE_STATUS_IF_VERSION = _UPDATE_STATUS.where(
+    OrderModel.version == bindparam("expected_version")
+)
+
+
+def _order_params(order: Order) -> dict[str, Any]:
+    """Возвращает параметры вставки заказа."""
+    return {
+        "id": order.id,
+        "user_id": order.user_id,
+        "items": order.items,
+        "total_price": order.total_price,
+        "status": order.status,
+        "created_at": order.created_at,
+        "updated_at": order.updated_at,
+        "version": order.version,
+    }
+
+
+def _row_to_entity(row: Sequence[Any]) -> Order:
+    """Преобразует строку `_ORDER_COLUMNS` в доменную сущность без проверок."""
+    id_, user_id, items, total_price, status, created_at, updated_at, version = (
+        row
+    )
+    return Order.restore(
+        id=id_,
+        user_id=user_id,
+        items=items,
+        total_price=total_price,
+        status=status,
+        created_at=created_at,
+        updated_at=updated_at,
+        version=version,
+    )
+
 
 @dataclass(slots=True, kw_only=True)
 class OrderRepositorySQLAlchemy(OrderRepositoryProtocol):
@@ -21,7 +101,7 @@ class OrderRepositorySQLAlchemy(OrderRepositoryProtocol):
     session: AsyncSession
 
     async def create(self, order: Order) -> Order:
-        """Создаёт заказ в БД.
+        """Создаёт заказ в БД одним запросом `INSERT ... RETURNING`.
 
         Args:
             order: Доменная сущность заказа.
@@ -29,18 +109,24 @@ class OrderRepositorySQLAlchemy(OrderRepositoryProtocol):
         Returns:
             Order: Созданный заказ.
         """
-        model = OrderModel(
-            id=order.id,
-            user_id=order.user_id,
-            items=order.items,
-            total_price=order.total_price,
-            status=order.status,
-            created_at=order.created_at,
+        result = await self.session.execute(_INSERT_ORDER, _order_params(order))
+        return _row_to_entity(result.tuples().one())
+
+    async def create_many(self, orders: Sequence[Order]) -> list[Order]:
+        """Создаёт несколько заказов многострочным `INSERT ... RETURNING`.
+
+        Args:
+            orders: Доменные сущности заказов.
+
+        Returns:
+            list[Order]: Созданные заказы в порядке `orders`.
+        """
+        if not orders:
+            return []
+        result = await self.session.execute(
+            _INSERT_ORDERS, [_order_params(order) for order in orders]
         )
-        self.session.add(model)
-        await self.session.flush()
-        await self.session.refresh(model)
-        return self._to_entity_required(model)
+        return [_row_to_entity(row) for row in result.tuples()]
 
     async def get_by_id(self, order_id: UUID) -> Order | None:
         """Возвращает заказ по идентификатору.
@@ -51,38 +137,49 @@ class OrderRepositorySQLAlchemy(OrderRepositoryProtocol):
         Returns:
             Order | None: Заказ или `None`, если не найден.
         """
-        result = await self.session.execute(
-            select(OrderModel).where(OrderModel.id == order_id)
-        )
-        model = result.scalar_one_or_none()
-        return self._to_entity(model)
+        result = await self.session.execute(_GET_BY_ID, {"order_id": order_id})
+        row = result.tuples().one_or_none()
+        return _row_to_entity(row) if row is not None else None
 
     async def update_status(
-        self, order_id: UUID, status: OrderStatus
+        self,
+        order_id: UUID,
+        status: OrderStatus,
+        *,
+        user_id: int,
+        expected_version: int | None = None,
     ) -> Order | None:
-        """Обновляет статус заказа.
+        """Атомарно обновляет статус заказа и увеличивает его версию.
+
+        Выполняется одним запросом `UPDATE ... RETURNING`: условие по владельцу
+        и (если задана) по ожидаемой версии проверяется в самой БД, поэтому
+        параллельные обновления не могут перезаписать друг друга.
 
         Args:
             order_id: Идентификатор заказа.
             status: Новый статус.
+            user_id: Идентификатор владельца заказа.
+            expected_version: Ожидаемая текущая версия (compare-and-set).
 
         Returns:
-            Order | None: Обновлённый заказ или `None`, если не найден.
+            Order | None: Обновлённый заказ или `None`, если заказ не найден,
+            принадлежит другому пользователю или его версия не совпала.
         """
-        await self.session.execute(
-            update(OrderModel)
-            .where(OrderModel.id == order_id)
-            .values(status=status)
-        )
-        await self.session.flush()
-        result = await self.session.execute(
-            select(OrderModel).where(OrderModel.id == order_id)
-        )
-        model = result.scalar_one_or_none()
-        return self._to_entity(model)
+        params: dict[str, Any] = {
+            "order_id": order_id,
+            "owner_id": user_id,
+            "new_status": status,
+        }
+        stmt = _UPDATE_STATUS
+        if expected_version is not None:
+            stmt = _UPDATE_STATUS_IF_VERSION
+            params["expected_version"] = expected_version
+        result = await self.session.execute(stmt, params)
+        row = result.tuples().one_or_none()
+        return _row_to_entity(row) if row is not None else None
 
     async def list_by_user(self, user_id: int) -> list[Order]:
-        """Возвращает список заказов пользователя.
+        """Возвращает список заказов пользователя (новые первыми).
 
         Args:
             user_id: Идентификатор пользователя.
@@ -90,44 +187,5 @@ class OrderRepositorySQLAlchemy(OrderRepositoryProtocol):
         Returns:
             list[Order]: Список заказов.
         """
-        result = await self.session.execute(
-            select(OrderModel).where(OrderModel.user_id == user_id)
-        )
-        models = result.scalars().all()
-        return [self._to_entity_required(model) for model in models]
-
-    def _to_entity(self, model: OrderModel | None) -> Order | None:
-        """Преобразует ORM-модель в доменную сущность (или `None`)."""
-        if model is None:
-            return None
-        return Order(
-            id=model.id,
-            user_id=model.user_id,
-            items=self._ensure_list(model.items),
-            total_price=self._ensure_decimal(model.total_price),
-            status=OrderStatus(model.status),
-            created_at=model.created_at,
-        )
-
-    def _to_entity_required(self, model: OrderModel) -> Order:
-        """Преобразует ORM-модель в доменную сущность (обязательная)."""
-        return Order(
-            id=model.id,
-            user_id=model.user_id,
-            items=self._ensure_list(model.items),
-            total_price=self._ensure_decimal(model.total_price),
-            status=OrderStatus(model.status),
-            created_at=model.created_at,
-        )
-
-    def _ensure_list(self, items: Any) -> list[dict[str, Any]]:
-        """Гарантирует, что `items` является списком словарей."""
-        if isinstance(items, list):
-            return items
-        return []
-
-    def _ensure_decimal(self, value: Any) -> Decimal:
-        """Гарантирует, что `value` представлен как `Decimal`."""
-        if isinstance(value, Decimal):
-            return value
-        return Decimal(str(value))
+        result = await self.session.execute(_LIST_BY_USER, {"user_id": user_id})
+        return [_row_to_entity(row) for row in result.tuples()]
@@ -1,18 +1,54 @@
-"""Репозиторий outbox-событий на SQLAlchemy."""
+"""Репозиторий outbox-событий на SQLAlchemy.
+
+Очередь на публикацию — необработанные события без dead letter, у которых
+наступило `next_attempt_at`; неудачная попытка увеличивает `attempts` и
+переносит `next_attempt_at` (или переводит событие в dead letter).
+
+Удаление устаревших событий выполняется пачками: подзапрос выбирает не более
+`limit` обработанных строк (`FOR UPDATE SKIP LOCKED`), поэтому каждая
+транзакция короткая и не конфликтует с параллельной отправкой событий.
+"""
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from typing import Any, cast
 from uuid import UUID
 
-from sqlalchemy import select, update
+from sqlalchemy import bindparam, delete, func, insert, select, update
+from sqlalchemy.engine import CursorResult
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from application.interfaces.repositories import OutboxRepositoryProtocol
 from domain.entities.outbox_event import OutboxEvent
 from infra.db.models import OutboxEventModel
 
+_DELETE_PROCESSED_BEFORE = delete(OutboxEventModel).where(
+    OutboxEventModel.id.in_(
+        select(OutboxEventModel.id)
+        .where(OutboxEventModel.processed_at < bindparam("cutoff"))
+        .limit(bindparam("batch_limit"))
+        .with_for_update(skip_locked=True)
+    )
+)
+
+
+def _event_params(event: OutboxEvent) -> dict[str, Any]:
+    """Возвращает значения колонок outbox-события."""
+    return {
+        "id": event.id,
+        "event_type": event.event_type,
+        "payload": event.payload,
+        "created_at": event.created_at,
+        "processed_at": event.processed_at,
+        "attempts": event.attempts,
+        "next_attempt_at": event.next_attempt_at,
+        "last_error": event.last_error,
+        "dead_lettered_at": event.dead_lettered_at,
+    }
+
 
 @dataclass(slots=True, kw_only=True)
 class OutboxRepositorySQLAlchemy(OutboxRepositoryProtocol):
@@ -29,20 +65,26 @@ class OutboxRepositorySQLAlchemy(OutboxRepositoryProtocol):
         Returns:
             OutboxEvent: Созданное событие.
         """
-        model = OutboxEventModel(
-            id=event.id,
-            event_type=event.event_type,
-            payload=event.payload,
-            created_at=event.created_at,
-            processed_at=event.processed_at,
-        )
+        model = OutboxEventModel(**_event_params(event))
         self.session.add(model)
         await self.session.flush()
         await self.session.refresh(model)
         return self._to_entity_required(model)
 
+    async def add_many(self, events: Sequence[OutboxEvent]) -> None:
+        """Добавляет несколько событий в outbox многострочным `INSERT`.
+
+        Args:
+            events: Доменные сущности событий.
+        """
+        if not events:
+            return
+        await self.session.execute(
+            insert(OutboxEventModel), [_event_params(event) for event in events]
+        )
+
     async def list_pending(self, *, limit: int) -> list[OutboxEvent]:
-        """Возвращает список необработанных событий.
+        """Возвращает события, которые пора опубликовать.
 
         Args:
             limit: Максимальное количество событий.
@@ -52,8 +94,12 @@ class OutboxRepositorySQLAlchemy(OutboxRepositoryProtocol):
         """
         result = await self.session.execute(
             select(OutboxEventModel)
-            .where(OutboxEventModel.processed_at.is_(None))
-            .order_by(OutboxEventModel.created_at.asc())
+            .where(
+                OutboxEventModel.processed_at.is_(None),
+                OutboxEventModel.dead_lettered_at.is_(None),
+                OutboxEventModel.next_attempt_at <= func.now(),
+            )
+            .order_by(OutboxEventModel.next_attempt_at.asc())
             .limit(limit)
             .with_for_update(skip_locked=True)
         )
@@ -72,6 +118,66 @@ class OutboxRepositorySQLAlchemy(OutboxRepositoryProtocol):
             .values(processed_at=datetime.now(UTC))
         )
 
+    async def mark_processed_many(self, event_ids: Sequence[UUID]) -> None:
+        """Помечает несколько событий обработанными одним запросом.
+
+        Args:
+            event_ids: Идентификаторы событий.
+        """
+        if not event_ids:
+            return
+        await self.session.execute(
+            update(OutboxEventModel)
+            .where(OutboxEventModel.id.in_(event_ids))
+            .values(processed_at=datetime.now(UTC))
+        )
+
+    async def record_failure(
+        self, event_id: UUID, *, error: str, retry_at: datetime | None
+    ) -> None:
+        """Учитывает неудачную попытку публикации события.
+
+        Args:
+            event_id: Идентификатор события.
+            error: Текст ошибки.
+            retry_at: Время следующей попытки или `None`, чтобы перевести
+                событие в dead letter.
+        """
+        values: dict[str, Any] = {
+            "attempts": OutboxEventModel.attempts + 1,
+            "last_error": error,
+        }
+        if retry_at is None:
+            values["dead_lettered_at"] = datetime.now(UTC)
+        else:
+            values["next_attempt_at"] = retry_at
+        await self.session.execute(
+            update(OutboxEventModel)
+            .where(OutboxEventModel.id == event_id)
+            .values(values)
+        )
+
+    async def delete_processed_before(
+        self, cutoff: datetime, *, limit: int
+    ) -> int:
+        """Удаляет пачку событий, обработанных раньше `cutoff`.
+
+        Args:
+            cutoff: Граница времени обработки.
+            limit: Максимальное количество удаляемых событий.
+
+        Returns:
+            int: Количество удалённых событий.
+        """
+        result = cast(
+            "CursorResult[Any]",
+            await self.session.execute(
+                _DELETE_PROCESSED_BEFORE,
+                {"cutoff": cutoff, "batch_limit": limit},
+            ),
+        )
+        return result.rowcount
+
     def _to_entity_required(self, model: OutboxEventModel) -> OutboxEvent:
         """Преобразует ORM-модель outbox в доменную сущность."""
         return OutboxEvent(
@@ -80,4 +186,8 @@ class OutboxRepositorySQLAlchemy(OutboxRepositoryProtocol):
             payload=model.payload,
             created_at=model.created_at,
             processed_at=model.processed_at,
+            attempts=model.attempts,
+            next_attempt_at=model.next_attempt_at,
+            last_error=model.last_error,
+            dead_lettered_at=model.dead_lettered_at,
         )
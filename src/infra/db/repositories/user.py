@@ -1,14 +1,60 @@
-"""Репозиторий пользователей на SQLAlchemy."""
+"""Репозиторий пользователей на SQLAlchemy.
 
+Запросы собираются один раз на уровне модуля и выполняются с привязанными
+параметрами (`bindparam`), поэтому asyncpg переиспользует подготовленные
+выражения соединения.
+"""
+
+from collections.abc import Sequence
 from dataclasses import dataclass
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from application.interfaces.repositories import UserRepositoryProtocol
 from domain.entities.user import User
 from infra.db.models import UserModel
 
+_USER_COLUMNS = (
+    UserModel.id,
+    UserModel.email,
+    UserModel.hashed_password,
+    UserModel.created_at,
+)
+
+_GET_BY_EMAIL = select(*_USER_COLUMNS).where(
+    UserModel.email == bindparam("email")
+)
+_GET_BY_ID = select(*_USER_COLUMNS).where(UserModel.id == bindparam("user_id"))
+_INSERT_USER = (
+    pg_insert(UserModel)
+    .on_conflict_do_nothing(index_elements=[UserModel.email])
+    .returning(UserModel.id, UserModel.created_at)
+)
+_UPDATE_PASSWORD_HASH = (
+    update(UserModel)
+    .where(
+        UserModel.id == bindparam("user_id"),
+        UserModel.hashed_password == bindparam("expected_hash"),
+    )
+    .values(hashed_password=bindparam("new_hash"))
+    .returning(UserModel.id)
+    .execution_options(synchronize_session=False)
+)
+
+
+def _row_to_entity(row: Sequence[Any]) -> User:
+    """Преобразует строку `_USER_COLUMNS` в доменную сущность."""
+    user_id, email, hashed_password, created_at = row
+    return User(
+        id=user_id,
+        email=email,
+        hashed_password=hashed_password,
+        created_at=created_at,
+    )
+
 
 @dataclass(slots=True, kw_only=True)
 class UserRepositorySQLAlchemy(UserRepositoryProtocol):
@@ -25,11 +71,9 @@ class UserRepositorySQLAlchemy(UserRepositoryProtocol):
         Returns:
             User | None: Пользователь или `None`, если не найден.
         """
-        result = await self.session.execute(
-            select(UserModel).where(UserModel.email == email)
-        )
-        model = result.scalar_one_or_none()
-        return self._to_entity(model)
+        result = await self.session.execute(_GET_BY_EMAIL, {"email": email})
+        row = result.tuples().one_or_none()
+        return _row_to_entity(row) if row is not None else None
 
     async def get_by_id(self, user_id: int) -> User | None:
         """Возвращает пользователя по идентификатору.
@@ -40,43 +84,59 @@ class UserRepositorySQLAlchemy(UserRepositoryProtocol):
         Returns:
             User | None: Пользователь или `None`, если не найден.
         """
-        result = await self.session.execute(
-            select(UserModel).where(UserModel.id == user_id)
-        )
-        model = result.scalar_one_or_none()
-        return self._to_entity(model)
+        result = await self.session.execute(_GET_BY_ID, {"user_id": user_id})
+        row = result.tuples().one_or_none()
+        return _row_to_entity(row) if row is not None else None
+
+    async def create(self, user: User) -> User | None:
+        """Создаёт пользователя одним запросом `INSERT ... ON CONFLICT`.
 
-    async def create(self, user: User) -> User:
-        """Создаёт пользователя.
+        Конфликт по уникальному email разрешается в самой БД
+        (`ON CONFLICT (email) DO NOTHING`), поэтому параллельные регистрации
+        одного email не приводят к ошибке целостности.
 
         Args:
             user: Доменная сущность пользователя.
 
         Returns:
-            User: Созданный пользователь.
+            User | None: Созданный пользователь или `None`, если email занят.
         """
-        model = UserModel(email=user.email, hashed_password=user.hashed_password)
-        self.session.add(model)
-        await self.session.flush()
-        await self.session.refresh(model)
-        return self._to_entity_required(model)
-
-    def _to_entity(self, model: UserModel | None) -> User | None:
-        """Преобразует ORM-модель в доменную сущность (или `None`)."""
-        if model is None:
+        result = await self.session.execute(
+            _INSERT_USER,
+            {"email": user.email, "hashed_password": user.hashed_password},
+        )
+        row = result.one_or_none()
+        if row is None:
             return None
         return User(
-            id=model.id,
-            email=model.email,
-            hashed_password=model.hashed_password,
-            created_at=model.created_at,
+            id=row.id,
+            email=user.email,
+            hashed_password=user.hashed_password,
+            created_at=row.created_at,
         )
 
-    def _to_entity_required(self, model: UserModel) -> User:
-        """Преобразует ORM-модель в доменную сущность (обязательная)."""
-        return User(
-            id=model.id,
-            email=model.email,
-            hashed_password=model.hashed_password,
-            created_at=model.created_at,
+    async def update_password_hash(
+        self, user_id: int, hashed_password: str, *, expected_hash: str
+    ) -> bool:
+        """Заменяет хеш пароля, если он не изменился с момента чтения.
+
+        Условие по прежнему хешу не даёт пересчёту при входе перезаписать
+        пароль, изменённый параллельно.
+
+        Args:
+            user_id: Идентификатор пользователя.
+            hashed_password: Новый хеш пароля.
+            expected_hash: Хеш, по которому был проверен пароль.
+
+        Returns:
+            bool: `True`, если хеш обновлён.
+        """
+        result = await self.session.execute(
+            _UPDATE_PASSWORD_HASH,
+            {
+                "user_id": user_id,
+                "expected_hash": expected_hash,
+                "new_hash": hashed_password,
+            },
         )
+        return result.scalar_one_or_none() is not None
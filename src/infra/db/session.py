@@ -10,12 +10,22 @@ from sqlalchemy.ext.asyncio import (
 )
 
 
-def create_engine(database_url: str, *, is_echo: bool = False) -> AsyncEngine:
+def create_engine(
+    database_url: str,
+    *,
+    is_echo: bool = False,
+    prepared_statement_cache_size: int = 100,
+    statement_cache_size: int = 100,
+) -> AsyncEngine:
     """Создаёт асинхронный движок SQLAlchemy.
 
     Args:
         database_url: DSN/URL подключения к БД.
         is_echo: Включить вывод SQL-запросов в лог.
+        prepared_statement_cache_size: Размер кеша подготовленных выражений
+            адаптера SQLAlchemy на соединение (`0` отключает кеш).
+        statement_cache_size: Размер собственного кеша выражений asyncpg на
+            соединение (`0` отключает кеш).
 
     Returns:
         AsyncEngine: Асинхронный движок.
@@ -24,6 +34,10 @@ def create_engine(database_url: str, *, is_echo: bool = False) -> AsyncEngine:
         database_url,
         echo=is_echo,
         pool_pre_ping=True,
+        connect_args={
+            "prepared_statement_cache_size": prepared_statement_cache_size,
+            "statement_cache_size": statement_cache_size,
+        },
     )
 
 
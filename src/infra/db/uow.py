@@ -5,6 +5,7 @@ from types import TracebackType
 from typing import Self
 
 from loguru import logger
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from application.interfaces.repositories import (
@@ -12,7 +13,12 @@ from application.interfaces.repositories import (
     OutboxRepositoryProtocol,
     UserRepositoryProtocol,
 )
-from application.interfaces.uow import UnitOfWorkProtocol
+from application.interfaces.uow import Durability, UnitOfWorkProtocol
+
+_SYNCHRONOUS_COMMIT = {
+    Durability.FULL: text("SET LOCAL synchronous_commit TO DEFAULT"),
+    Durability.RELAXED: text("SET LOCAL synchronous_commit = off"),
+}
 
 
 @dataclass(slots=True, kw_only=True)
@@ -42,6 +48,14 @@ class UnitOfWorkSQLAlchemy(UnitOfWorkProtocol):
             await self.rollback()
         return None
 
+    async def set_durability(self, durability: Durability) -> None:
+        """Задаёт `synchronous_commit` для текущей транзакции (`SET LOCAL`).
+
+        Args:
+            durability: Требуемая долговечность.
+        """
+        await self.session.execute(_SYNCHRONOUS_COMMIT[durability])
+
     async def commit(self) -> None:
         """Фиксирует транзакцию."""
         logger.debug("Фиксация транзакции")
@@ -0,0 +1,5 @@
+"""Ограничение частоты запросов (rate limiting)."""
+
+from infra.ratelimit.limiter import HybridRateLimiter, RateLimitDecision
+
+__all__ = ["HybridRateLimiter", "RateLimitDecision"]
@@ -0,0 +1,359 @@
+"""Гибридный лимитер запросов: локальные счётчики + пакетная синхронизация с Redis.
+
+Каждый процесс считает запросы в памяти по окнам длиной `window_seconds`.
+Накопленные попадания отправляются в Redis фоновой задачей одним pipeline
+(`INCRBY` + `EXPIRE` на каждый ключ), а в ответ процесс получает глобальный
+счётчик окна.
+
+Лимит считается по скользящему окну: счётчик предыдущего окна входит в оценку
+с весом той доли, которую он ещё перекрывает (в начале окна — целиком, к его
+концу — почти нулевым). Поэтому на границе окон клиент не получает удвоенный
+лимит, как при фиксированных окнах. Token bucket здесь не подходит: списание
+токена — это чтение и запись состояния по текущему времени, то есть вызов
+Lua-скрипта на каждый ключ, и попадания разных процессов нельзя сложить
+пакетом. Счётчики окон складываются коммутативным `INCRBY`, поэтому их можно
+копить локально и отправлять в Redis пачкой.
+
+Первое попадание ключа в окне сверяется с Redis синхронно: процесс получает
+глобальные счётчики текущего и предыдущего окна. Дальше, пока оценка ниже
+порога (`sync_threshold` от лимита), решение принимается без обращения к
+Redis. Запас до порога делится между `workers` процессами: каждый может
+пропустить без сверки не больше своей доли, поэтому все процессы вместе не
+превышают порог до ближайшей синхронизации. Вблизи лимита запрос синхронно
+сверяется с Redis, превышение запоминается локально, и пока оценка не
+опустится ниже лимита, запросы отклоняются без обращения к Redis (и не
+расходуют бюджет).
+
+Счётчики хранятся по паре «ключ + окно», поэтому попадания, не отправленные
+до смены окна, остаются в счётчике своего окна и отправляются следующей
+синхронизацией в ключ этого окна.
+
+Попадания, отправляемые в Redis, учитываются отдельно от накопленных
+(`in_flight`): путь, у которого запрос к Redis не удался, возвращает в
+`pending` ровно то, что отправлял сам. Поэтому фоновая синхронизация и
+синхронная сверка одного ключа могут пересекаться, не удваивая попадания, а
+отправляемые попадания продолжают учитываться в локальной оценке. Если Redis
+недоступен, решения принимаются по локальным счётчикам процесса.
+
+Лимит соблюдается приблизительно: скользящее окно предполагает равномерное
+распределение запросов предыдущего окна, а между синхронизациями процессы
+вместе могут пропустить до `sync_threshold` бюджета без сверки с Redis. Чем
+меньше порог и интервал синхронизации, тем точнее лимит и тем больше
+обращений к Redis.
+"""
+
+import asyncio
+import contextlib
+import math
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
+import redis.asyncio as redis
+from loguru import logger
+
+
+@dataclass(slots=True, frozen=True)
+class RateLimitDecision:
+    """Результат проверки лимита.
+
+    Attributes:
+        allowed: Можно ли обработать запрос.
+        limit: Лимит запросов в окне.
+        retry_after: Через сколько секунд запрос будет разрешён (оценка;
+            `0` для разрешённого запроса).
+    """
+
+    allowed: bool
+    limit: int
+    retry_after: int
+
+
+@dataclass(slots=True)
+class _Bucket:
+    """Локальное состояние счётчика для одного ключа в одном окне.
+
+    Attributes:
+        window: Номер окна.
+        synced: Последний известный глобальный счётчик окна.
+        pending: Попадания, ещё не отправленные в Redis.
+        in_flight: Попадания, отправляемые в Redis прямо сейчас.
+        previous: Глобальный счётчик предыдущего окна (`None`, пока окно не
+            сверялось с Redis).
+        blocked: Лимит был превышен при последней сверке.
+    """
+
+    window: int
+    synced: int = 0
+    pending: int = 0
+    in_flight: int = 0
+    previous: int | None = None
+    blocked: bool = False
+
+    @property
+    def estimate(self) -> int:
+        """Оценка счётчика окна с учётом неподтверждённых попаданий."""
+        return self.synced + self.in_flight + self.pending
+
+    @property
+    def unconfirmed(self) -> int:
+        """Попадания процесса, которых ещё нет в глобальном счётчике."""
+        return self.in_flight + self.pending
+
+    def take_pending(self) -> int:
+        """Переводит накопленные попадания в отправляемые.
+
+        Returns:
+            int: Количество отправляемых попаданий.
+        """
+        sent = self.pending
+        self.pending = 0
+        self.in_flight += sent
+        return sent
+
+    def confirm(self, sent: int, count: int) -> None:
+        """Учитывает ответ Redis на отправку `sent` попаданий.
+
+        Args:
+            sent: Количество отправленных попаданий.
+            count: Глобальный счётчик окна из ответа Redis.
+        """
+        self.in_flight -= sent
+        self.synced = max(self.synced, count)
+
+    def restore(self, sent: int) -> None:
+        """Возвращает неотправленные попадания в накопленные.
+
+        Args:
+            sent: Количество попаданий, отправка которых не удалась.
+        """
+        self.in_flight -= sent
+        self.pending += sent
+
+
+@dataclass(slots=True, kw_only=True)
+class HybridRateLimiter:
+    """Лимитер с локальными счётчиками и асинхронной синхронизацией с Redis.
+
+    Attributes:
+        client: Асинхронный Redis-клиент.
+        default_limit: Лимит запросов в окне по умолчанию.
+        route_limits: Лимиты для отдельных маршрутов (`"METHOD /path"`).
+        window_seconds: Длина окна в секундах.
+        sync_threshold: Доля лимита, до которой Redis не опрашивается.
+        workers: Число процессов, делящих лимит (запас до порога делится
+            между ними поровну).
+        flush_interval: Интервал фоновой синхронизации (секунды).
+        prefix: Префикс ключей в Redis.
+    """
+
+    client: redis.Redis  # type: ignore[type-arg]
+    default_limit: int
+    route_limits: Mapping[str, int] = field(default_factory=dict)
+    window_seconds: int = 60
+    sync_threshold: float = 0.8
+    workers: int = 1
+    flush_interval: float = 1.0
+    prefix: str = "ratelimit:"
+    _buckets: dict[tuple[str, int], _Bucket] = field(
+        default_factory=dict, init=False
+    )
+    _flusher: asyncio.Task[None] | None = field(default=None, init=False)
+
+    def limit_for(self, route: str) -> int:
+        """Возвращает лимит для маршрута.
+
+        Args:
+            route: Маршрут в формате `"METHOD /path/template"`.
+
+        Returns:
+            int: Лимит запросов в окне.
+        """
+        return self.route_limits.get(route, self.default_limit)
+
+    async def start(self) -> None:
+        """Запускает фоновую синхронизацию счётчиков с Redis."""
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def close(self) -> None:
+        """Останавливает фоновую синхронизацию и сбрасывает остаток счётчиков."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flusher
+            self._flusher = None
+        await self.flush()
+
+    async def hit(self, route: str, identity: str) -> RateLimitDecision:
+        """Учитывает запрос и проверяет лимит.
+
+        Args:
+            route: Маршрут в формате `"METHOD /path/template"`.
+            identity: Идентификатор клиента (пользователь или IP).
+
+        Returns:
+            RateLimitDecision: Решение по запросу.
+        """
+        limit = self.limit_for(route)
+        now = time.time()
+        window = int(now // self.window_seconds)
+        # Доля предыдущего окна, которую ещё перекрывает скользящее окно.
+        overlap = window + 1 - now / self.window_seconds
+        key = f"{route}|{identity}"
+
+        bucket = self._buckets.get((key, window))
+        if bucket is None:
+            bucket = _Bucket(window=window)
+            self._buckets[key, window] = bucket
+        if bucket.blocked:
+            if self._usage(bucket, overlap) + 1 > limit:
+                return self._reject(bucket, limit, now)
+            bucket.blocked = False
+
+        bucket.pending += 1
+        if bucket.previous is not None:
+            confirmed = self._usage(bucket, overlap) - bucket.unconfirmed
+            allowance = (limit * self.sync_threshold - confirmed) / self.workers
+            if bucket.unconfirmed <= allowance:
+                return RateLimitDecision(allowed=True, limit=limit, retry_after=0)
+
+        await self._sync(key, bucket)
+        if self._usage(bucket, overlap) > limit:
+            bucket.blocked = True
+            return self._reject(bucket, limit, now)
+        return RateLimitDecision(allowed=True, limit=limit, retry_after=0)
+
+    async def flush(self) -> None:
+        """Отправляет накопленные локальные попадания в Redis одним pipeline."""
+        current_window = int(time.time() // self.window_seconds)
+        stale = [
+            bucket_id
+            for bucket_id, bucket in self._buckets.items()
+            if bucket.window < current_window
+            and not bucket.pending
+            and not bucket.in_flight
+        ]
+        for bucket_id in stale:
+            del self._buckets[bucket_id]
+
+        batch = [
+            (key, bucket, bucket.take_pending())
+            for (key, _), bucket in self._buckets.items()
+            if bucket.pending
+        ]
+        if not batch:
+            return
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key, bucket, pending in batch:
+                    redis_key = self._redis_key(key, bucket.window)
+                    pipe.incrby(redis_key, pending)
+                    pipe.expire(redis_key, self.window_seconds * 2)
+                results = await pipe.execute()
+        except redis.RedisError as exc:
+            for _, bucket, pending in batch:
+                bucket.restore(pending)
+            logger.warning(
+                "Не удалось синхронизировать счётчики лимитера с Redis",
+                extra={"error": str(exc), "keys_count": len(batch)},
+            )
+            return
+        for (_, bucket, pending), count in zip(batch, results[::2], strict=True):
+            bucket.confirm(pending, int(count))
+
+    async def _sync(self, key: str, bucket: _Bucket) -> None:
+        """Синхронно отправляет попадания ключа в Redis.
+
+        При первой сверке окна вместе с отправкой читается глобальный счётчик
+        предыдущего окна.
+
+        Args:
+            key: Ключ счётчика.
+            bucket: Локальное состояние счётчика.
+        """
+        pending = bucket.take_pending()
+        redis_key = self._redis_key(key, bucket.window)
+        local_previous = self._buckets.get((key, bucket.window - 1))
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                pipe.incrby(redis_key, pending)
+                pipe.expire(redis_key, self.window_seconds * 2)
+                if bucket.previous is None:
+                    pipe.get(self._redis_key(key, bucket.window - 1))
+                count, _, *previous = await pipe.execute()
+        except redis.RedisError as exc:
+            bucket.restore(pending)
+            if bucket.previous is None:
+                # Без Redis предыдущее окно оценивается по попаданиям процесса.
+                bucket.previous = local_previous.estimate if local_previous else 0
+            logger.warning(
+                "Ошибка Redis при проверке лимита, используется локальный счётчик",
+                extra={"error": str(exc), "key": key},
+            )
+            return
+        bucket.confirm(pending, int(count))
+        if previous:
+            # Неотправленные попадания процесса ещё не вошли в счётчик Redis.
+            bucket.previous = max(
+                int(previous[0] or 0),
+                local_previous.estimate if local_previous else 0,
+            )
+
+    def _usage(self, bucket: _Bucket, overlap: float) -> float:
+        """Оценивает число запросов клиента в скользящем окне.
+
+        Args:
+            bucket: Локальное состояние счётчика текущего окна.
+            overlap: Доля предыдущего окна, перекрытая скользящим окном.
+
+        Returns:
+            float: Оценка с учётом неподтверждённых попаданий.
+        """
+        return (bucket.previous or 0) * overlap + bucket.estimate
+
+    def _reject(
+        self, bucket: _Bucket, limit: int, now: float
+    ) -> RateLimitDecision:
+        """Формирует отказ со временем, через которое запрос будет разрешён.
+
+        Args:
+            bucket: Локальное состояние счётчика текущего окна.
+            limit: Лимит запросов в окне.
+            now: Текущее время (Unix timestamp).
+
+        Returns:
+            RateLimitDecision: Отказ с оценкой `retry_after`.
+        """
+        start = bucket.window * self.window_seconds
+        previous, current = bucket.previous or 0, bucket.estimate
+        if current + 1 <= limit:
+            # Ждём, пока вес предыдущего окна не освободит место в этом окне.
+            share = 1 - (limit - current - 1) / previous if previous else 0
+        else:
+            # Места до конца окна нет: ждём следующего окна, где текущий
+            # счётчик станет предыдущим.
+            start += self.window_seconds
+            share = 1 - (limit - 1) / current
+        allowed_at = start + min(max(share, 0), 1) * self.window_seconds
+        return RateLimitDecision(
+            allowed=False,
+            limit=limit,
+            retry_after=max(1, math.ceil(allowed_at - now)),
+        )
+
+    async def _flush_loop(self) -> None:
+        """Периодически синхронизирует счётчики с Redis."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as exc:
+                logger.error(
+                    "Ошибка фоновой синхронизации лимитера",
+                    extra={"error": str(exc)},
+                )
+
+    def _redis_key(self, key: str, window: int) -> str:
+        """Формирует ключ счётчика окна в Redis."""
+        return f"{self.prefix}{key}:{window}"
@@ -1,7 +1,7 @@
 """Конфигурация Celery-приложения.
 
 Используется для выполнения фоновых задач и периодического запуска
-`dispatch_outbox_task` (Celery beat).
+`dispatch_outbox_task` и `prune_outbox_task` (Celery beat).
 """
 
 import os
@@ -20,5 +20,9 @@ celery_app.conf.beat_schedule = {
     "dispatch-outbox-every-5s": {
         "task": "order_service.dispatch_outbox_task",
         "schedule": float(os.getenv("OUTBOX_DISPATCH_INTERVAL_SECONDS", "5")),
-    }
+    },
+    "prune-outbox": {
+        "task": "order_service.prune_outbox_task",
+        "schedule": float(os.getenv("OUTBOX_RETENTION_INTERVAL_SECONDS", "600")),
+    },
 }
@@ -2,17 +2,22 @@
 
 Содержит:
 - `process_order_task` — имитация обработки заказа;
-- `dispatch_outbox_task` — отправка outbox-событий в брокер.
+- `dispatch_outbox_task` — отправка outbox-событий в брокер;
+- `prune_outbox_task` — удаление обработанных outbox-событий.
 """
 
 import asyncio
 import time
+from datetime import timedelta
+from typing import Any
 
 from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
 from application.use_cases.dispatch_outbox import DispatchOutboxUseCase
+from application.use_cases.prune_outbox import PruneOutboxUseCase
 from config.settings import settings
-from infra.broker.publisher import RabbitPublisher
+from infra.broker import RabbitPublisher, build_codecs, build_event_routes
 from infra.db.repositories import (
     OrderRepositorySQLAlchemy,
     OutboxRepositorySQLAlchemy,
@@ -23,20 +28,50 @@ from infra.db.uow import UnitOfWorkSQLAlchemy
 from infra.tasks.celery_app import celery_app
 
 
+def _create_engine() -> AsyncEngine:
+    """Создаёт движок БД для одного запуска задачи."""
+    return create_engine(
+        settings.database_url,
+        is_echo=False,
+        prepared_statement_cache_size=(
+            settings.database.postgres_prepared_statement_cache_size
+        ),
+        statement_cache_size=settings.database.postgres_statement_cache_size,
+    )
+
+
+def _create_uow(session: AsyncSession) -> UnitOfWorkSQLAlchemy:
+    """Создаёт unit-of-work с репозиториями поверх сессии."""
+    return UnitOfWorkSQLAlchemy(
+        session=session,
+        user_repo=UserRepositorySQLAlchemy(session=session),
+        order_repo=OrderRepositorySQLAlchemy(session=session),
+        outbox_repo=OutboxRepositorySQLAlchemy(session=session),
+    )
+
+
 @celery_app.task(name="order_service.process_order_task")
-def process_order_task(order_id: str) -> str:
+def process_order_task(order_id: str, order: dict[str, Any] | None = None) -> str:
     """Имитирует обработку заказа.
 
     В рамках тестового задания выполняется задержка ~2 секунды и запись в stdout.
 
     Args:
         order_id: Идентификатор заказа (UUID в строковом виде).
+        order: Снимок заказа из события `new_order` (`items`, `total_price`,
+            `status`, `created_at`, `version`); `None` для событий версии 1,
+            у которых снимка нет.
 
     Returns:
         str: Тот же идентификатор заказа.
     """
     time.sleep(2)
-    logger.info("Заказ обработан", extra={"order_id": order_id})
+    extra: dict[str, Any] = {"order_id": order_id}
+    if order is not None:
+        extra.update(
+            status=order.get("status"), total_price=order.get("total_price")
+        )
+    logger.info("Заказ обработан", extra=extra)
     return order_id
 
 
@@ -53,24 +88,31 @@ def dispatch_outbox_task() -> int:
 
     async def _run() -> int:
         """Асинхронная обёртка для запуска outbox-dispatch внутри Celery."""
-        engine = create_engine(settings.database_url, is_echo=False)
+        engine = _create_engine()
         factory = get_session_factory(engine)
         publisher = RabbitPublisher(
             url=settings.broker.broker_url,
             queue_name=settings.broker.broker_new_order_queue,
             retries=settings.broker.publish_retries,
             retry_backoff=settings.broker.publish_retry_backoff,
+            codec=build_codecs().require(settings.broker.broker_content_type),
         )
         try:
             async with factory() as session:
-                uow = UnitOfWorkSQLAlchemy(
-                    session=session,
-                    user_repo=UserRepositorySQLAlchemy(session=session),
-                    order_repo=OrderRepositorySQLAlchemy(session=session),
-                    outbox_repo=OutboxRepositorySQLAlchemy(session=session),
-                )
+                outbox = settings.outbox
                 use_case = DispatchOutboxUseCase(
-                    uow=uow, message_broker=publisher
+                    uow=_create_uow(session),
+                    message_broker=publisher,
+                    routes=build_event_routes(
+                        new_order_queue=settings.broker.broker_new_order_queue,
+                        order_events_exchange=(
+                            settings.broker.broker_order_events_exchange
+                        ),
+                    ),
+                    batch_size=outbox.outbox_dispatch_batch_size,
+                    max_attempts=outbox.outbox_max_attempts,
+                    retry_base_seconds=outbox.outbox_retry_base_seconds,
+                    retry_max_seconds=outbox.outbox_retry_max_seconds,
                 )
                 return await use_case()
         finally:
@@ -78,3 +120,37 @@ def dispatch_outbox_task() -> int:
             await engine.dispose()
 
     return asyncio.run(_run())
+
+
+@celery_app.task(name="order_service.prune_outbox_task")
+def prune_outbox_task(drain: bool = False) -> int:
+    """Удаляет обработанные outbox-события старше срока хранения.
+
+    Args:
+        drain: Удалять пачки, пока устаревшие события не закончатся (без
+            ограничения `OUTBOX_RETENTION_MAX_BATCHES`). Используется для
+            первичной очистки накопившейся таблицы.
+
+    Returns:
+        int: Количество удалённых событий.
+    """
+
+    async def _run() -> int:
+        """Асинхронная обёртка для запуска очистки outbox внутри Celery."""
+        outbox = settings.outbox
+        engine = _create_engine()
+        try:
+            async with get_session_factory(engine)() as session:
+                use_case = PruneOutboxUseCase(
+                    uow=_create_uow(session),
+                    retention=timedelta(hours=outbox.outbox_retention_hours),
+                    batch_size=outbox.outbox_retention_batch_size,
+                    max_batches=(
+                        None if drain else outbox.outbox_retention_max_batches
+                    ),
+                )
+                return await use_case()
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(_run())
@@ -5,7 +5,12 @@
 - настраивает CORS;
 - подключает контейнер зависимостей Dishka;
 - регистрирует обработчики исключений;
-- инициализирует Redis (кеш/лимитер) в lifespan.
+- инициализирует Redis (кеш), лимитер запросов и подписку на изменения
+  заказов в lifespan.
+
+Приложение создаётся фабрикой `create_app` (без экземпляра на уровне модуля),
+поэтому каждый процесс-воркер собирает его ровно один раз. Production-запуск
+в несколько процессов — `python -m server`.
 """
 
 from collections.abc import AsyncIterator
@@ -17,30 +22,33 @@ from dishka import AsyncContainer, make_async_container
 from dishka.integrations.fastapi import setup_dishka
 from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi_limiter import FastAPILimiter
-from fastapi_limiter.depends import RateLimiter
 from loguru import logger
 
 from api.error_handling import setup_exception_handlers
 from api.v1 import api_v1_router
+from api.v1.rate_limit import rate_limit
 from config.ioc.di import get_providers
 from config.settings import settings
+from infra.cache import OrderUpdatesHub
+from infra.cache.order_updates import order_updates_channel
 from infra.cache.redis_resource import clear_redis_client, set_redis_client
 from infra.logger.middleware import TraceIdMiddleware
 from infra.logger.setup import setup_logging
+from infra.ratelimit import HybridRateLimiter
 
 setup_logging()
 
 
 @asynccontextmanager
-async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Жизненный цикл приложения (startup/shutdown).
 
-    Инициализирует Redis-клиент, подключает его к лимитеру запросов и сохраняет
-    ссылку на клиент в общем ресурсе кеша.
+    Инициализирует Redis-клиент, сохраняет ссылку на него в общем ресурсе кеша
+    и запускает лимитер запросов (`app.state.rate_limiter`) и подписку воркера
+    на изменения заказов (`app.state.order_updates`).
 
     Args:
-        _: Экземпляр приложения FastAPI (не используется).
+        app: Экземпляр приложения FastAPI.
 
     Yields:
         None: Управление передаётся приложению на время работы.
@@ -53,9 +61,26 @@ async def lifespan(_: FastAPI) -> AsyncIterator[None]:
         health_check_interval=30,
     )
     set_redis_client(redis_client)
-    await FastAPILimiter.init(redis_client)
+    rate_limiter = HybridRateLimiter(
+        client=redis_client,
+        default_limit=settings.rate_limit.rate_limit_per_minute,
+        route_limits=settings.rate_limit.rate_limit_routes,
+        sync_threshold=settings.rate_limit.rate_limit_sync_threshold,
+        workers=settings.server.workers,
+        flush_interval=settings.rate_limit.rate_limit_flush_interval,
+        prefix=f"{settings.redis.redis_cache_prefix}{settings.rate_limit.rate_limit_prefix}",
+    )
+    await rate_limiter.start()
+    app.state.rate_limiter = rate_limiter
+    order_updates = OrderUpdatesHub(
+        client=redis_client,
+        channel=order_updates_channel(settings.redis.redis_cache_prefix),
+    )
+    order_updates.start()
+    app.state.order_updates = order_updates
     yield
-    await FastAPILimiter.close()
+    await order_updates.close()
+    await rate_limiter.close()
     await redis_client.close()
     await redis_client.connection_pool.disconnect()
     clear_redis_client()
@@ -69,7 +94,7 @@ def create_app() -> FastAPI:
     - CORS middleware (параметры берутся из настроек);
     - контейнер зависимостей Dishka;
     - обработчики исключений;
-    - роутер `v1` с глобальным rate limiting.
+    - роутер `v1` с rate limiting по маршруту и клиенту.
 
     Returns:
         FastAPI: Сконфигурированное приложение.
@@ -99,17 +124,13 @@ def create_app() -> FastAPI:
     setup_exception_handlers(app)
     app.include_router(
         api_v1_router,
-        dependencies=[
-            Depends(
-                RateLimiter(times=settings.app.rate_limit_per_minute, seconds=60)
-            )
-        ],
+        dependencies=[Depends(rate_limit)],
     )
 
     return app
 
 
-app = create_app()
-
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+    uvicorn.run(
+        "main:create_app", factory=True, host="0.0.0.0", port=8000, reload=True
+    )
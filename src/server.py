@@ -0,0 +1,100 @@
+"""Запуск приложения в production-режиме (несколько процессов).
+
+Поддерживаются два рантайма (`SERVER_RUNTIME`):
+- `gunicorn` — мастер gunicorn с воркерами `uvicorn.workers.UvicornWorker`;
+- `granian` — ASGI-сервер granian (воркеры на Rust, event loop на Python).
+
+Тяжёлые модули (FastAPI, SQLAlchemy, модели, схемы, DI-провайдеры) импортируются
+в мастер-процессе до создания воркеров через fork, поэтому воркеры стартуют
+быстрее и разделяют эти страницы памяти. Само приложение (`create_app`:
+DI-контейнер, middleware, роутеры) создаётся ровно один раз в каждом воркере:
+подключения к БД, Redis и брокеру не переживают fork.
+
+Запуск: `PYTHONPATH=src python -m server`.
+"""
+
+from typing import Any
+
+from fastapi import FastAPI
+from gunicorn.app.base import BaseApplication  # type: ignore[import-untyped]
+from loguru import logger
+
+from config.server import ServerSettings
+from config.settings import settings
+from main import create_app
+
+
+class _GunicornApplication(BaseApplication):  # type: ignore[misc]
+    """Приложение gunicorn, создающее FastAPI в каждом воркере."""
+
+    def __init__(self, options: dict[str, Any]) -> None:
+        """Сохраняет параметры gunicorn.
+
+        Args:
+            options: Параметры конфигурации gunicorn.
+        """
+        self.options = options
+        super().__init__()
+
+    def load_config(self) -> None:
+        """Передаёт параметры в конфигурацию gunicorn."""
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self) -> FastAPI:
+        """Создаёт приложение (вызывается в воркере после fork)."""
+        return create_app()
+
+
+def run_gunicorn(server: ServerSettings) -> None:
+    """Запускает gunicorn с uvicorn-воркерами.
+
+    Args:
+        server: Настройки сервера.
+    """
+    _GunicornApplication(
+        {
+            "bind": f"{server.server_host}:{server.server_port}",
+            "workers": server.workers,
+            "worker_class": "uvicorn.workers.UvicornWorker",
+            "preload_app": False,
+            "accesslog": "-" if server.server_access_log else None,
+        }
+    ).run()
+
+
+def run_granian(server: ServerSettings) -> None:
+    """Запускает granian в режиме ASGI с фабрикой приложения.
+
+    Args:
+        server: Настройки сервера.
+    """
+    from granian import Granian
+    from granian.constants import Interfaces
+
+    Granian(
+        "main:create_app",
+        factory=True,
+        address=server.server_host,
+        port=server.server_port,
+        interface=Interfaces.ASGI,
+        workers=server.workers,
+        log_access=server.server_access_log,
+    ).serve()
+
+
+def main() -> None:
+    """Запускает выбранный рантайм с рассчитанным числом воркеров."""
+    server = settings.server
+    logger.info(
+        "Запуск сервера",
+        extra={"runtime": server.server_runtime, "workers": server.workers},
+    )
+    if server.server_runtime == "granian":
+        run_granian(server)
+    else:
+        run_gunicorn(server)
+
+
+if __name__ == "__main__":
+    main()
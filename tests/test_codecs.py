@@ -0,0 +1,99 @@
+"""Тесты кодеков сообщений брокера (`infra.broker.codecs`)."""
+
+from typing import Any
+
+import pytest
+
+from infra.broker.codecs import (
+    JSON_CODEC,
+    JSON_CONTENT_TYPE,
+    MSGPACK_CODEC,
+    MSGPACK_CONTENT_TYPE,
+    SCHEMA_VERSION_HEADER,
+    MessageCodec,
+    build_codecs,
+)
+from infra.broker.publisher import _build_message
+from infra.broker.schemas import NEW_ORDER_EVENT_SCHEMA, NewOrderEventV2
+
+_PAYLOAD: dict[str, Any] = {
+    "event": "new_order",
+    "schema_version": 2,
+    "order_id": "01a151cd-97e4-7028-80c9-8b64bd721a89",
+    "user_id": 7,
+    "items": [{"name": "Чехол", "price": 2300.0, "quantity": 1}],
+    "total_price": "2300.00",
+    "status": "PENDING",
+    "created_at": "2026-10-19T01:00:00+00:00",
+    "version": 1,
+}
+
+
+@pytest.mark.parametrize(
+    ("content_type", "expected"),
+    [
+        (None, JSON_CODEC),
+        ("", JSON_CODEC),
+        ("application/json", JSON_CODEC),
+        ("Application/JSON; charset=utf-8", JSON_CODEC),
+        ("application/msgpack", MSGPACK_CODEC),
+        ("application/x-msgpack", MSGPACK_CODEC),
+        ("text/plain", None),
+    ],
+)
+def test_registry_get(
+    content_type: str | None, expected: MessageCodec | None
+) -> None:
+    """Кодек выбирается по MIME-типу без параметров и без учёта регистра."""
+    assert build_codecs().get(content_type) is expected
+
+
+def test_registry_require() -> None:
+    """Недоступный кодек из настроек приводит к `RuntimeError`."""
+    codecs = build_codecs()
+    assert codecs.require(MSGPACK_CONTENT_TYPE) is MSGPACK_CODEC
+    with pytest.raises(RuntimeError):
+        codecs.require("application/xml")
+
+
+@pytest.mark.parametrize("codec", [JSON_CODEC, MSGPACK_CODEC])
+def test_round_trip_and_validate(codec: MessageCodec) -> None:
+    """Тело декодируется обратно и проверяется схемой события."""
+    body = codec.encode(_PAYLOAD)
+    assert codec.decode(body) == _PAYLOAD
+    event = codec.validate(NEW_ORDER_EVENT_SCHEMA, body)
+    assert isinstance(event, NewOrderEventV2)
+    assert event.user_id == 7
+
+
+def test_json_body_is_compact_utf8() -> None:
+    """JSON кодируется без пробелов и без экранирования кириллицы."""
+    body = JSON_CODEC.encode({"name": "Чехол", "n": 1})
+    assert body == '{"name":"Чехол","n":1}'.encode()
+
+
+@pytest.mark.parametrize("codec", [JSON_CODEC, MSGPACK_CODEC])
+@pytest.mark.parametrize("body", [b"", b"\xc1", b"\x92\x01"])
+def test_malformed_body_raises_value_error(
+    codec: MessageCodec, body: bytes
+) -> None:
+    """Повреждённое тело приводит к `ValueError`, как обещает `validate`."""
+    with pytest.raises(ValueError):
+        codec.validate(NEW_ORDER_EVENT_SCHEMA, body)
+
+
+@pytest.mark.parametrize("codec", [JSON_CODEC, MSGPACK_CODEC])
+def test_build_message_headers(codec: MessageCodec) -> None:
+    """Сообщение несёт `content_type` кодека и версию схемы в заголовке."""
+    message = _build_message(_PAYLOAD, "event-1", codec)
+    assert message.content_type == codec.content_type
+    assert message.headers == {SCHEMA_VERSION_HEADER: 2}
+    assert message.message_id == "event-1"
+    assert codec.decode(message.body) == _PAYLOAD
+
+
+def test_build_message_defaults_schema_version() -> None:
+    """Payload без `schema_version` помечается версией 1."""
+    message = _build_message({"event": "x"}, None, JSON_CODEC)
+    assert message.headers == {SCHEMA_VERSION_HEADER: 1}
+    assert message.content_type == JSON_CONTENT_TYPE
@@ -0,0 +1,80 @@
+"""Тесты разбора условных HTTP-запросов (`api.v1.conditional`)."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from api.v1.conditional import (
+    etag_matches,
+    is_not_modified,
+    not_modified,
+    validators,
+)
+
+_MODIFIED = datetime(2026, 10, 19, 12, 30, 15, 999_000, tzinfo=UTC)
+
+
+@pytest.mark.parametrize(
+    ("if_none_match", "expected"),
+    [
+        ('"3"', True),
+        ('W/"3"', True),
+        ('"1", "3"', True),
+        ("*", True),
+        ('"4"', False),
+        ('"33"', False),
+        ("", False),
+        (None, False),
+    ],
+)
+def test_etag_matches(if_none_match: str | None, expected: bool) -> None:
+    """Сравнение тегов слабое, список и `*` поддерживаются."""
+    assert etag_matches(if_none_match, '"3"') is expected
+
+
+def test_is_not_modified_prefers_if_none_match() -> None:
+    """При наличии `If-None-Match` дата `If-Modified-Since` не учитывается."""
+    assert not is_not_modified(
+        etag='"3"',
+        last_modified=_MODIFIED,
+        if_none_match='"2"',
+        if_modified_since="Mon, 19 Oct 2026 12:30:15 GMT",
+    )
+
+
+@pytest.mark.parametrize(
+    ("if_modified_since", "expected"),
+    [
+        ("Mon, 19 Oct 2026 12:30:15 GMT", True),
+        ("Mon, 19 Oct 2026 12:30:16 GMT", True),
+        ("Mon, 19 Oct 2026 12:30:14 GMT", False),
+        ("не дата", False),
+        (None, False),
+    ],
+)
+def test_is_not_modified_by_date(
+    if_modified_since: str | None, expected: bool
+) -> None:
+    """Даты сравниваются с точностью до секунды, мусор игнорируется."""
+    assert (
+        is_not_modified(
+            etag='"3"',
+            last_modified=_MODIFIED,
+            if_none_match=None,
+            if_modified_since=if_modified_since,
+        )
+        is expected
+    )
+
+
+def test_validators_and_not_modified() -> None:
+    """Ответ 304 несёт валидаторы и не имеет тела."""
+    headers = validators('"3"', _MODIFIED)
+    assert headers == {
+        "ETag": '"3"',
+        "Last-Modified": "Mon, 19 Oct 2026 12:30:15 GMT",
+    }
+    response = not_modified(headers)
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == '"3"'
@@ -0,0 +1,137 @@
+"""Тесты повторов и dead letter outbox (`application.use_cases.dispatch_outbox`)."""
+
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+from typing import Any, Self, cast
+from uuid import UUID
+
+import pytest
+
+from application.events import EventRoute, EventRouteRegistry
+from application.interfaces.message_broker import MessageBrokerPublisherProtocol
+from application.interfaces.uow import Durability, UnitOfWorkProtocol
+from application.use_cases.dispatch_outbox import DispatchOutboxUseCase
+from domain.entities.outbox_event import OutboxEvent
+
+_ROUTE = EventRoute(exchange="", routing_key="orders")
+
+
+class _FakeOutboxRepo:
+    """Outbox в памяти: запоминает отметки и неудачные попытки."""
+
+    def __init__(self, events: list[OutboxEvent]) -> None:
+        self.events = events
+        self.processed: list[UUID] = []
+        self.failures: dict[UUID, tuple[str, datetime | None]] = {}
+
+    async def list_pending(self, *, limit: int) -> list[OutboxEvent]:
+        return self.events[:limit]
+
+    async def mark_processed_many(self, event_ids: Sequence[UUID]) -> None:
+        self.processed.extend(event_ids)
+
+    async def record_failure(
+        self, event_id: UUID, *, error: str, retry_at: datetime | None
+    ) -> None:
+        self.failures[event_id] = (error, retry_at)
+
+
+class _FakeUoW:
+    """Unit of Work с outbox в памяти."""
+
+    def __init__(self, events: list[OutboxEvent]) -> None:
+        self.outbox_repo = _FakeOutboxRepo(events)
+        self.committed = False
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    async def set_durability(self, durability: Durability) -> None:
+        return None
+
+    async def commit(self) -> None:
+        self.committed = True
+
+
+class _FakeBroker:
+    """Брокер, который публикует события или отвечает ошибкой на каждое."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        self.error = error
+        self.published: list[UUID] = []
+
+    async def publish_many(
+        self, route: EventRoute, events: Sequence[OutboxEvent]
+    ) -> list[Exception | None]:
+        if self.error is None:
+            self.published.extend(event.id for event in events)
+        return [self.error for _ in events]
+
+
+def _event(event_type: str = "new_order", attempts: int = 0) -> OutboxEvent:
+    """Создаёт outbox-событие с заданным числом прошлых попыток."""
+    payload: dict[str, Any] = {"order_id": "1"}
+    return OutboxEvent(event_type=event_type, payload=payload, attempts=attempts)
+
+
+async def _dispatch(
+    events: list[OutboxEvent], broker: _FakeBroker
+) -> tuple[int, _FakeUoW]:
+    """Запускает одну пачку рассылки поверх заглушек."""
+    routes = EventRouteRegistry()
+    routes.register("new_order", _ROUTE)
+    uow = _FakeUoW(events)
+    use_case = DispatchOutboxUseCase(
+        uow=cast("UnitOfWorkProtocol", uow),
+        message_broker=cast("MessageBrokerPublisherProtocol", broker),
+        routes=routes,
+        max_attempts=10,
+        retry_base_seconds=5,
+        retry_max_seconds=60,
+    )
+    return await use_case(), uow
+
+
+@pytest.mark.parametrize(
+    ("attempts", "delay"),
+    [(0, 5), (1, 10), (2, 20), (3, 40), (4, 60), (8, 60)],
+)
+async def test_retry_delay_doubles_up_to_cap(attempts: int, delay: int) -> None:
+    """Задержка удваивается с каждой попыткой и ограничена сверху."""
+    event = _event(attempts=attempts)
+    before = datetime.now(UTC)
+    processed, uow = await _dispatch([event], _FakeBroker(ConnectionError("x")))
+    after = datetime.now(UTC)
+
+    assert processed == 0
+    error, retry_at = uow.outbox_repo.failures[event.id]
+    assert error == "x"
+    assert retry_at is not None
+    expected = timedelta(seconds=delay)
+    assert before + expected <= retry_at <= after + expected
+    assert uow.committed
+
+
+async def test_last_attempt_dead_letters_event() -> None:
+    """После `max_attempts` неудачных попыток событие уходит в dead letter."""
+    event = _event(attempts=9)
+    _, uow = await _dispatch([event], _FakeBroker(ConnectionError("x")))
+    assert uow.outbox_repo.failures == {event.id: ("x", None)}
+
+
+async def test_event_without_route_is_dead_lettered() -> None:
+    """Событие без маршрута сразу уходит в dead letter, остальные публикуются."""
+    unrouted, routed = _event("unknown"), _event()
+    broker = _FakeBroker()
+    processed, uow = await _dispatch([unrouted, routed], broker)
+
+    assert processed == 1
+    assert broker.published == [routed.id]
+    assert uow.outbox_repo.processed == [routed.id]
+    error, retry_at = uow.outbox_repo.failures[unrouted.id]
+    assert "unknown" in error
+    assert retry_at is None
+    assert uow.committed
@@ -0,0 +1,67 @@
+"""Тесты генерации идентификаторов (`domain.identifiers`)."""
+
+import time
+import uuid
+from collections.abc import Iterator
+
+import pytest
+
+from domain import identifiers
+from domain.identifiers import _MonotonicUUID7, new_id, set_id_generator
+
+
+@pytest.fixture
+def restore_generator() -> Iterator[None]:
+    """Возвращает генератор процесса по умолчанию после теста."""
+    yield
+    set_id_generator(identifiers.uuid7)
+
+
+def _timestamp_ms(value: uuid.UUID) -> int:
+    """Извлекает время (мс) из UUIDv7."""
+    return value.int >> 80
+
+
+def test_new_id_is_uuid7_with_current_time() -> None:
+    """По умолчанию выдаются UUIDv7 с текущим временем."""
+    before = time.time_ns() // 1_000_000
+    value = new_id()
+    after = time.time_ns() // 1_000_000
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+    assert before <= _timestamp_ms(value) <= after
+
+
+def test_monotonic_uuid7_is_strictly_increasing() -> None:
+    """Идентификаторы одного генератора строго возрастают."""
+    generate = _MonotonicUUID7()
+    values = [generate() for _ in range(10_000)]
+    assert values == sorted(values)
+    assert len(set(values)) == len(values)
+    assert all(value.version == 7 for value in values)
+
+
+def test_monotonic_uuid7_counter_overflow_and_clock_skew(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Переполнение счётчика и перевод часов назад не нарушают порядок."""
+    now_ns = 1_800_000_000_000 * 1_000_000
+    monkeypatch.setattr(time, "time_ns", lambda: now_ns)
+    generate = _MonotonicUUID7()
+    values = [generate() for _ in range(5_000)]
+    now_ns -= 60_000 * 1_000_000
+    values.extend(generate() for _ in range(10))
+
+    assert values == sorted(values)
+    assert len(set(values)) == len(values)
+    assert _timestamp_ms(values[0]) == 1_800_000_000_000
+    assert _timestamp_ms(values[-1]) == 1_800_000_000_001
+
+
+def test_set_id_generator_replaces_generator(restore_generator: None) -> None:
+    """`set_id_generator` заменяет генератор для всего процесса."""
+    fixed = uuid.UUID(int=42)
+    set_id_generator(lambda: fixed)
+    assert new_id() == fixed
+    set_id_generator(uuid.uuid4)
+    assert new_id().version == 4
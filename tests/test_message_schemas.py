@@ -0,0 +1,112 @@
+"""Тесты схем события `new_order` (`infra.broker.schemas`)."""
+
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+import pytest
+from pydantic import ValidationError
+
+from application.events import NEW_ORDER_SCHEMA_VERSION, new_order_event
+from domain.entities.order import Order
+from infra.broker.schemas import (
+    NEW_ORDER_EVENT_SCHEMA,
+    NewOrderEvent,
+    NewOrderEventV2,
+    order_snapshot,
+)
+
+_ORDER_ID = "01a151cd-97e4-7028-80c9-8b64bd721a89"
+
+
+def _v2_payload(**overrides: Any) -> dict[str, Any]:
+    """Возвращает payload события версии 2."""
+    payload: dict[str, Any] = {
+        "event": "new_order",
+        "schema_version": 2,
+        "order_id": _ORDER_ID,
+        "user_id": 7,
+        "items": [{"name": "Чехол", "price": 2300.0, "quantity": 1}],
+        "total_price": "2300.00",
+        "status": "PENDING",
+        "created_at": "2026-10-19T01:00:00+00:00",
+        "version": 1,
+    }
+    payload.update(overrides)
+    return payload
+
+
+def test_published_event_round_trip() -> None:
+    """Событие издателя читается схемой версии 2 со снимком заказа."""
+    order = Order(
+        user_id=42,
+        items=[{"name": "Мышь", "price": 1490.0, "quantity": 2}],
+        total_price=Decimal("2980.00"),
+    )
+    payload = new_order_event(order).payload
+    assert payload["schema_version"] == NEW_ORDER_SCHEMA_VERSION
+
+    event = NEW_ORDER_EVENT_SCHEMA.validate_python(payload)
+    assert isinstance(event, NewOrderEventV2)
+    assert event.order_id == order.id
+    assert order_snapshot(event) == {
+        "items": order.items,
+        "total_price": "2980.00",
+        "status": order.status.value,
+        "created_at": order.created_at.isoformat().replace("+00:00", "Z"),
+        "version": order.version,
+    }
+
+
+@pytest.mark.parametrize("schema_version", [None, 1])
+def test_v1_event_has_no_snapshot(schema_version: int | None) -> None:
+    """Событие без `schema_version` или версии 1 читается схемой v1."""
+    payload: dict[str, Any] = {
+        "event": "new_order",
+        "order_id": _ORDER_ID,
+        "user_id": 7,
+    }
+    if schema_version is not None:
+        payload["schema_version"] = schema_version
+    event = NEW_ORDER_EVENT_SCHEMA.validate_python(payload)
+    assert type(event) is NewOrderEvent
+    assert event.order_id == UUID(_ORDER_ID)
+    assert event.event_id is None
+    assert order_snapshot(event) is None
+
+
+def test_newer_version_is_read_by_latest_schema() -> None:
+    """Версия новее известной читается схемой v2, новые поля игнорируются."""
+    event = NEW_ORDER_EVENT_SCHEMA.validate_python(
+        _v2_payload(schema_version=3, currency="RUB")
+    )
+    assert isinstance(event, NewOrderEventV2)
+    assert event.schema_version == 3
+    assert order_snapshot(event) is not None
+
+
+def test_validate_json_from_bytes() -> None:
+    """Схема проверяет сообщение сразу из JSON-байтов."""
+    event = NEW_ORDER_EVENT_SCHEMA.validate_json(
+        b'{"event":"new_order","order_id":"' + _ORDER_ID.encode() + b'",'
+        b'"user_id":7}'
+    )
+    assert event.user_id == 7
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        _v2_payload(schema_version=0),
+        _v2_payload(schema_version="2"),
+        _v2_payload(schema_version=True),
+        _v2_payload(event="order_paid"),
+        _v2_payload(total_price="не число"),
+        {key: value for key, value in _v2_payload().items() if key != "items"},
+        ["new_order"],
+    ],
+)
+def test_invalid_payload_is_rejected(payload: Any) -> None:
+    """Неверная версия схемы или содержимое приводят к ошибке проверки."""
+    with pytest.raises(ValidationError):
+        NEW_ORDER_EVENT_SCHEMA.validate_python(payload)
@@ -0,0 +1,84 @@
+"""Тесты формата записи заказа в кеше и ETag по версии."""
+
+from datetime import UTC, datetime
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+
+from application.dtos.order import OrderDTO
+from application.order_cache import (
+    dump_order_entry,
+    load_order_entry,
+    order_etag,
+    order_list_etag,
+    parse_etag_version,
+    read_order_entry_header,
+    version_etag,
+)
+from domain.value_objects.order_status import OrderStatus
+
+
+def _dto(version: int = 3) -> OrderDTO:
+    """Создаёт DTO заказа для тестов."""
+    return OrderDTO(
+        id=UUID("01a151cd-97e4-7028-80c9-8b64bd721a89"),
+        user_id=7,
+        items=[{"name": "Чехол", "price": 1.5}],
+        total_price=Decimal("10.50"),
+        status=OrderStatus.PAID,
+        created_at=datetime(2026, 10, 19, 1, 0, tzinfo=UTC),
+        updated_at=datetime(2026, 10, 19, 1, 5, tzinfo=UTC),
+        version=version,
+    )
+
+
+@pytest.mark.parametrize(
+    ("etag", "expected"),
+    [
+        ('"3"', 3),
+        ('W/"3"', 3),
+        (' "12" ', 12),
+        ("3", 3),
+        ('"abc"', None),
+        ('"-1"', None),
+        ('""', None),
+        ('"²"', None),
+        ('"٣"', None),
+    ],
+)
+def test_parse_etag_version(etag: str, expected: int | None) -> None:
+    """Версия извлекается только из ETag формата `version_etag`."""
+    assert parse_etag_version(etag) == expected
+
+
+def test_version_etag_round_trip() -> None:
+    """ETag заказа строится по версии и разбирается обратно."""
+    assert order_etag(_dto(5)) == version_etag(5) == '"5"'
+    assert parse_etag_version(order_etag(_dto(5))) == 5
+
+
+def test_order_list_etag_depends_on_versions_and_order() -> None:
+    """ETag списка меняется при смене версии элемента или порядка."""
+    first, second = _dto(1), _dto(2)
+    second.id = UUID("01a151cd-97e4-7028-80c9-8b64bd721a8a")
+    base = order_list_etag([first, second])
+    assert base == order_list_etag([first, second])
+    assert base != order_list_etag([second, first])
+    assert base != order_list_etag([_dto(3), second])
+
+
+def test_order_entry_round_trip() -> None:
+    """Запись кеша восстанавливает DTO, заголовок читается без JSON."""
+    dto = _dto()
+    entry = dump_order_entry(dto)
+    assert entry.startswith("3|7|")
+    assert read_order_entry_header(entry) == (3, 7)
+    assert load_order_entry(entry) == dto
+
+
+@pytest.mark.parametrize("entry", ["", "3|7", "x|7|{}"])
+def test_read_order_entry_header_rejects_malformed(entry: str) -> None:
+    """Запись неверного формата приводит к `ValueError`."""
+    with pytest.raises(ValueError):
+        read_order_entry_header(entry)
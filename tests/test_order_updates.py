@@ -0,0 +1,114 @@
+"""Тесты раздачи изменений заказов (`infra.cache.order_updates`)."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any, Self, cast
+
+import redis.asyncio as redis
+
+from infra.cache.order_updates import OrderUpdatesHub
+
+
+class _FakePubSub:
+    """Подписка заглушки: отдаёт сообщения и ждёт новых бесконечно."""
+
+    def __init__(self, client: "_FakeRedis") -> None:
+        self._client = client
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    async def subscribe(self, channel: str) -> None:
+        self._client.subscriptions += 1
+        if self._client.failures:
+            raise self._client.failures.pop(0)
+
+    async def listen(self) -> AsyncIterator[dict[str, Any]]:
+        for message in self._client.messages:
+            yield {"data": message}
+        await asyncio.Event().wait()
+
+
+class _FakeRedis:
+    """Заглушка Redis pub/sub с внедряемыми ошибками подписки."""
+
+    def __init__(self, messages: list[str]) -> None:
+        self.messages = messages
+        self.failures: list[Exception] = []
+        self.subscriptions = 0
+
+    def pubsub(self, ignore_subscribe_messages: bool = False) -> _FakePubSub:
+        return _FakePubSub(self)
+
+
+def _hub(client: _FakeRedis, queue_size: int = 100) -> OrderUpdatesHub:
+    """Создаёт хаб поверх заглушки Redis."""
+    return OrderUpdatesHub(
+        client=cast("redis.Redis", client),  # type: ignore[type-arg]
+        channel="orders:updates",
+        queue_size=queue_size,
+        reconnect_delay=0,
+    )
+
+
+async def test_run_resubscribes_after_unexpected_error() -> None:
+    """Непредвиденная ошибка не останавливает подписку воркера."""
+    client = _FakeRedis(["7|{}"])
+    client.failures = [RuntimeError("сбой"), redis.ConnectionError("обрыв")]
+    hub = _hub(client)
+    async with hub.subscribe(7) as queue:
+        hub.start()
+        assert await asyncio.wait_for(queue.get(), timeout=1) == "{}"
+    assert client.subscriptions == 3
+    await hub.close()
+
+
+async def test_dispatch_routes_messages_to_owner() -> None:
+    """Сообщение получают только подписчики владельца заказа."""
+    hub = _hub(_FakeRedis([]))
+    async with hub.subscribe(7) as first, hub.subscribe(7) as second:
+        async with hub.subscribe(8) as other:
+            hub._dispatch('7|{"id": 1}')
+            assert first.get_nowait() == second.get_nowait() == '{"id": 1}'
+            assert other.empty()
+
+
+async def test_dispatch_ignores_malformed_messages() -> None:
+    """Сообщения без корректного `user_id` отбрасываются."""
+    hub = _hub(_FakeRedis([]))
+    async with hub.subscribe(7) as queue:
+        for data in ["{}", "x|{}", "²|{}", "-7|{}", "|{}"]:
+            hub._dispatch(data)
+        assert queue.empty()
+
+
+async def test_subscribe_unregisters_on_exit() -> None:
+    """После выхода из `subscribe` очередь больше не получает сообщений."""
+    hub = _hub(_FakeRedis([]))
+    async with hub.subscribe(7) as queue:
+        assert hub._listeners == {7: {queue}}
+    assert hub._listeners == {}
+    hub._dispatch("7|{}")
+    assert queue.empty()
+
+
+async def test_slow_consumer_is_disconnected() -> None:
+    """Переполненная очередь очищается и получает признак завершения."""
+    hub = _hub(_FakeRedis([]), queue_size=2)
+    async with hub.subscribe(7) as slow:
+        for number in range(3):
+            hub._dispatch(f"7|{number}")
+        assert slow.get_nowait() is None
+        assert slow.empty()
+
+
+async def test_close_disconnects_subscribers() -> None:
+    """Остановка хаба завершает потоки всех подписчиков."""
+    hub = _hub(_FakeRedis([]))
+    async with hub.subscribe(7) as queue:
+        hub._dispatch("7|{}")
+        await hub.close()
+        assert queue.get_nowait() is None
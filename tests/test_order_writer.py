@@ -0,0 +1,208 @@
+"""Тесты group commit для новых заказов (`infra.db.order_writer`)."""
+
+import asyncio
+from collections.abc import Iterator
+from decimal import Decimal
+from typing import Any, Self, cast
+from uuid import UUID
+
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from application.events import new_order_event
+from domain.entities.order import Order
+from infra.db.order_writer import GroupCommitOrderWriter
+
+_ORDER_COLUMNS = (
+    "id",
+    "user_id",
+    "items",
+    "total_price",
+    "status",
+    "created_at",
+    "updated_at",
+    "version",
+)
+
+
+class _Result:
+    """Результат `INSERT ... RETURNING` заглушки."""
+
+    def __init__(self, rows: list[tuple[Any, ...]]) -> None:
+        self._rows = rows
+
+    def tuples(self) -> Self:
+        return self
+
+    def one(self) -> tuple[Any, ...]:
+        return self._rows[0]
+
+    def __iter__(self) -> Iterator[tuple[Any, ...]]:
+        return iter(self._rows)
+
+
+class _Database:
+    """Состояние «БД»: зафиксированные строки и внедряемые ошибки."""
+
+    def __init__(self) -> None:
+        self.orders: list[UUID] = []
+        self.events: list[UUID] = []
+        self.sessions = 0
+        self.fail_users: set[int] = set()
+        self.fail_commit = False
+
+
+class _Transaction:
+    """Транзакция или savepoint: откатывает свои строки при ошибке."""
+
+    def __init__(self, session: "_FakeSession", *, nested: bool) -> None:
+        self._session = session
+        self._nested = nested
+        self._mark = 0
+
+    async def __aenter__(self) -> Self:
+        self._mark = len(self._session.staged)
+        return self
+
+    async def __aexit__(self, exc_type: object, *exc_info: object) -> None:
+        if exc_type is not None:
+            del self._session.staged[self._mark :]
+        elif not self._nested:
+            await self._session.commit()
+
+
+class _FakeSession:
+    """Сессия, которая копит вставленные строки до `commit`."""
+
+    def __init__(self, database: _Database) -> None:
+        self._database = database
+        self.staged: list[tuple[str, UUID]] = []
+        database.sessions += 1
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.staged.clear()
+
+    async def execute(
+        self, statement: object, params: list[dict[str, Any]] | dict[str, Any]
+    ) -> _Result:
+        rows = params if isinstance(params, list) else [params]
+        if "user_id" not in rows[0]:
+            self.staged.extend(("event", row["id"]) for row in rows)
+            return _Result([])
+        if any(row["user_id"] in self._database.fail_users for row in rows):
+            raise IntegrityError("INSERT", None, ValueError("ограничение"))
+        self.staged.extend(("order", row["id"]) for row in rows)
+        return _Result([tuple(row[c] for c in _ORDER_COLUMNS) for row in rows])
+
+    async def commit(self) -> None:
+        if self._database.fail_commit:
+            raise OperationalError("COMMIT", None, ConnectionError("обрыв"))
+        for kind, row_id in self.staged:
+            target = (
+                self._database.orders
+                if kind == "order"
+                else self._database.events
+            )
+            target.append(row_id)
+        self.staged.clear()
+
+    async def rollback(self) -> None:
+        self.staged.clear()
+
+    def begin(self) -> _Transaction:
+        return _Transaction(self, nested=False)
+
+    def begin_nested(self) -> _Transaction:
+        return _Transaction(self, nested=True)
+
+
+def _writer(
+    database: _Database, *, max_batch: int = 100, max_delay: float = 60
+) -> GroupCommitOrderWriter:
+    """Создаёт накопитель поверх заглушки фабрики сессий."""
+    return GroupCommitOrderWriter(
+        session_factory=cast(
+            "async_sessionmaker[AsyncSession]", lambda: _FakeSession(database)
+        ),
+        max_batch=max_batch,
+        max_delay=max_delay,
+    )
+
+
+async def _create(writer: GroupCommitOrderWriter, user_id: int) -> Order:
+    """Создаёт заказ пользователя через накопитель."""
+    order = Order(
+        user_id=user_id, items=[{"name": "x"}], total_price=Decimal("1.50")
+    )
+    return await writer.create(order, new_order_event(order))
+
+
+async def test_full_batch_is_written_at_once() -> None:
+    """Пачка размера `max_batch` записывается сразу одной транзакцией."""
+    database = _Database()
+    writer = _writer(database, max_batch=3)
+    orders = await asyncio.gather(*(_create(writer, user) for user in (1, 2, 3)))
+    assert database.orders == [order.id for order in orders]
+    assert len(database.events) == 3
+    assert database.sessions == 1
+
+
+async def test_partial_batch_is_written_by_timer() -> None:
+    """Неполная пачка записывается по истечении `max_delay`."""
+    database = _Database()
+    writer = _writer(database, max_delay=0.01)
+    order = await asyncio.wait_for(_create(writer, 1), timeout=1)
+    assert database.orders == [order.id]
+
+
+async def test_cancelled_callers_are_skipped() -> None:
+    """Заказ отменённого до записи вызова не сохраняется."""
+    database = _Database()
+    writer = _writer(database, max_delay=0.01)
+    cancelled = asyncio.create_task(_create(writer, 1))
+    waiting = asyncio.create_task(_create(writer, 2))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    order = await waiting
+    assert database.orders == [order.id]
+    assert len(database.events) == 1
+
+
+async def test_failing_order_is_isolated_by_savepoint() -> None:
+    """Ошибку получает только вызов, чья строка нарушила ограничение."""
+    database = _Database()
+    database.fail_users = {2}
+    writer = _writer(database, max_batch=3)
+    first, failed, third = await asyncio.gather(
+        *(_create(writer, user) for user in (1, 2, 3)), return_exceptions=True
+    )
+    assert isinstance(failed, IntegrityError)
+    assert isinstance(first, Order)
+    assert isinstance(third, Order)
+    assert database.orders == [first.id, third.id]
+    assert len(database.events) == 2
+
+
+async def test_failed_commit_is_not_retried() -> None:
+    """После ошибки `COMMIT` пачка не пишется повторно."""
+    database = _Database()
+    database.fail_commit = True
+    writer = _writer(database, max_batch=2)
+    results = await asyncio.gather(
+        _create(writer, 1), _create(writer, 2), return_exceptions=True
+    )
+    assert all(isinstance(result, OperationalError) for result in results)
+    assert database.sessions == 1
+
+
+async def test_close_drains_pending_orders() -> None:
+    """`close` записывает накопленные заказы, не дожидаясь таймера."""
+    database = _Database()
+    writer = _writer(database)
+    task = asyncio.create_task(_create(writer, 1))
+    await asyncio.sleep(0)
+    await writer.close()
+    assert database.orders == [(await task).id]
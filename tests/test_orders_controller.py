@@ -0,0 +1,23 @@
+"""Тесты разбора `If-Match` при обновлении заказа (`api.v1.handlers`)."""
+
+import pytest
+from fastapi import HTTPException, status
+
+from api.v1.handlers.orders_controller import _expected_version
+
+
+@pytest.mark.parametrize(
+    ("if_match", "expected"),
+    [(None, None), ("*", None), ('"3"', 3), ('W/"3"', 3)],
+)
+def test_expected_version(if_match: str | None, expected: int | None) -> None:
+    """ETag заказа задаёт ожидаемую версию, `*` и отсутствие — нет."""
+    assert _expected_version(if_match) == expected
+
+
+@pytest.mark.parametrize("if_match", ['"abc"', '"²"', "", '"-1"'])
+def test_foreign_if_match_fails_precondition(if_match: str) -> None:
+    """Значение чужого формата сразу даёт `412 Precondition Failed`."""
+    with pytest.raises(HTTPException) as exc_info:
+        _expected_version(if_match)
+    assert exc_info.value.status_code == status.HTTP_412_PRECONDITION_FAILED
@@ -0,0 +1,76 @@
+"""Тесты профиля хеширования паролей (`application.services.security`)."""
+
+import pytest
+from passlib.hash import argon2
+
+from application.services import PasswordHasher, PasswordHashProfile
+
+# Минимальная стоимость, чтобы тесты не тратили время на KDF.
+_PBKDF2 = PasswordHashProfile(pbkdf2_rounds=1_000)
+_ARGON2 = PasswordHashProfile(
+    scheme="argon2",
+    pbkdf2_rounds=1_000,
+    argon2_time_cost=1,
+    argon2_memory_cost=1_024,
+)
+
+
+def test_pbkdf2_context_options() -> None:
+    """Текущая схема идёт первой, стоимость ниже заданной устаревает."""
+    assert _PBKDF2.context_options() == {
+        "schemes": ["pbkdf2_sha256", "argon2"],
+        "default": "pbkdf2_sha256",
+        "deprecated": "auto",
+        "pbkdf2_sha256__rounds": 1_000,
+        "pbkdf2_sha256__min_rounds": 1_000,
+    }
+
+
+def test_argon2_context_options() -> None:
+    """Для argon2 передаются её параметры стоимости."""
+    options = _ARGON2.context_options()
+    assert options["schemes"] == ["argon2", "pbkdf2_sha256"]
+    assert options["default"] == "argon2"
+    assert options["argon2__rounds"] == options["argon2__min_rounds"] == 1
+    assert options["argon2__memory_cost"] == 1_024
+    assert options["argon2__parallelism"] == 1
+
+
+def test_unknown_scheme_is_rejected() -> None:
+    """Неизвестная схема приводит к `ValueError`."""
+    with pytest.raises(ValueError):
+        PasswordHashProfile(scheme="md5_crypt").context_options()
+
+
+def test_argon2_without_backend(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Без бэкенда argon2 недоступна как основная и как прежняя схема."""
+    monkeypatch.setattr(argon2, "has_backend", lambda: False)
+    with pytest.raises(ValueError):
+        _ARGON2.context_options()
+    assert _PBKDF2.context_options()["schemes"] == ["pbkdf2_sha256"]
+
+
+def test_cheaper_hash_is_upgraded_on_verify() -> None:
+    """Хеш с меньшей стоимостью проверяется и пересчитывается."""
+    old_hash = PasswordHasher(PasswordHashProfile(pbkdf2_rounds=500)).hash("pw")
+    hasher = PasswordHasher(_PBKDF2)
+    assert hasher.needs_update(old_hash)
+    valid, new_hash = hasher.verify_and_update("pw", old_hash)
+    assert valid
+    assert new_hash is not None
+    assert not hasher.needs_update(new_hash)
+    assert hasher.verify_and_update("wrong", old_hash) == (False, None)
+
+
+def test_previous_scheme_is_upgraded_to_argon2() -> None:
+    """Хеш PBKDF2 принимается профилем argon2 и пересчитывается в argon2."""
+    old_hash = PasswordHasher(_PBKDF2).hash("pw")
+    valid, new_hash = PasswordHasher(_ARGON2).verify_and_update("pw", old_hash)
+    assert valid
+    assert new_hash is not None
+    assert new_hash.startswith("$argon2")
+
+
+def test_dummy_verify_is_always_false() -> None:
+    """Проверка по фиктивному хешу никогда не проходит."""
+    assert PasswordHasher(_PBKDF2).dummy_verify("pw") is False
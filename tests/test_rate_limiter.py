@@ -0,0 +1,215 @@
+"""Тесты гибридного лимитера запросов (`infra.ratelimit.limiter`)."""
+
+import asyncio
+import time
+from typing import Any, Self, cast
+
+import pytest
+import redis.asyncio as redis
+
+from infra.ratelimit.limiter import HybridRateLimiter
+
+_ROUTE = "GET /orders/{order_id}/"
+
+
+class _Pipeline:
+    """Pipeline заглушки Redis: копит команды и применяет их в `execute`."""
+
+    def __init__(self, store: "_FakeRedis") -> None:
+        self._store = store
+        self._commands: list[tuple[str, int | None]] = []
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    def incrby(self, key: str, amount: int) -> None:
+        self._commands.append((key, amount))
+
+    def expire(self, key: str, seconds: int) -> None:
+        self._commands.append((key, 0))
+
+    def get(self, key: str) -> None:
+        self._commands.append((key, None))
+
+    async def execute(self) -> list[Any]:
+        gate = self._store.gates.pop(0) if self._store.gates else None
+        if gate is not None:
+            await gate.wait()
+            raise redis.ConnectionError("соединение потеряно")
+        results: list[Any] = []
+        for key, amount in self._commands:
+            if amount is None:
+                value = self._store.counters.get(key)
+                results.append(None if value is None else str(value))
+            elif amount:
+                counters = self._store.counters
+                counters[key] = counters.get(key, 0) + amount
+                results.append(counters[key])
+            else:
+                results.append(True)
+        return results
+
+
+class _FakeRedis:
+    """Заглушка Redis со счётчиками в памяти.
+
+    Каждый элемент `gates` задерживает очередной `execute` до установки
+    события и завершает его ошибкой соединения.
+    """
+
+    def __init__(self) -> None:
+        self.counters: dict[str, int] = {}
+        self.gates: list[asyncio.Event] = []
+
+    def pipeline(self, transaction: bool = True) -> _Pipeline:
+        return _Pipeline(self)
+
+
+class _Clock:
+    """Управляемое время для лимитера."""
+
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+_WINDOW = 500_000
+_KEY = f"ratelimit:{_ROUTE}|1"
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    """Фиксирует время на начале окна `_WINDOW`."""
+    fake = _Clock(3_600.0 * _WINDOW)
+    monkeypatch.setattr(time, "time", fake)
+    return fake
+
+
+def _limiter(
+    store: _FakeRedis, limit: int, workers: int = 1
+) -> HybridRateLimiter:
+    """Создаёт лимитер поверх заглушки Redis."""
+    return HybridRateLimiter(
+        client=cast("redis.Redis", store),  # type: ignore[type-arg]
+        default_limit=limit,
+        window_seconds=3_600,
+        sync_threshold=0.5,
+        workers=workers,
+    )
+
+
+async def _hits(limiter: HybridRateLimiter, count: int) -> list[bool]:
+    """Выполняет `count` запросов и возвращает решения по ним."""
+    return [(await limiter.hit(_ROUTE, "1")).allowed for _ in range(count)]
+
+
+async def test_hits_below_threshold_stay_local(clock: _Clock) -> None:
+    """После первой сверки окна ниже порога Redis не опрашивается."""
+    store = _FakeRedis()
+    limiter = _limiter(store, limit=10)
+    assert await _hits(limiter, 5) == [True] * 5
+    assert store.counters == {f"{_KEY}:{_WINDOW}": 1}
+    await limiter.flush()
+    assert store.counters == {f"{_KEY}:{_WINDOW}": 5}
+
+
+async def test_limit_is_enforced_after_sync(clock: _Clock) -> None:
+    """Сверх лимита запросы отклоняются и не расходуют бюджет."""
+    store = _FakeRedis()
+    limiter = _limiter(store, limit=4)
+    assert await _hits(limiter, 6) == [True] * 4 + [False] * 2
+    assert store.counters == {f"{_KEY}:{_WINDOW}": 5}
+    decision = await limiter.hit(_ROUTE, "1")
+    # Пять запросов окна перестают мешать, когда новое окно перекроет
+    # меньше 3/5 этого окна.
+    assert decision.retry_after == 3_600 + 1_440
+
+
+async def test_failed_flush_overlapping_sync_does_not_double_count(
+    clock: _Clock,
+) -> None:
+    """Неудачная фоновая отправка не удваивает попадания синхронной сверки."""
+    store = _FakeRedis()
+    limiter = _limiter(store, limit=100)
+    await _hits(limiter, 5)
+
+    gate = asyncio.Event()
+    store.gates.append(gate)
+    flush = asyncio.create_task(limiter.flush())
+    await asyncio.sleep(0)
+
+    # Отправляемые фоновой задачей попадания учитываются в оценке, поэтому
+    # синхронная сверка начинается на пороге 50 вместо 54 и отправляет
+    # только свои 46 попаданий.
+    assert await _hits(limiter, 46) == [True] * 46
+    assert sum(store.counters.values()) == 47
+
+    gate.set()
+    await flush
+    await limiter.flush()
+    assert sum(store.counters.values()) == 51
+
+
+async def test_failed_sync_keeps_hits_for_next_flush(clock: _Clock) -> None:
+    """Попадания неудачной сверки отправляются следующей синхронизацией."""
+    store = _FakeRedis()
+    limiter = _limiter(store, limit=2)
+    gate = asyncio.Event()
+    gate.set()
+    store.gates.extend([gate, gate])
+    assert await _hits(limiter, 2) == [True, True]
+    assert store.counters == {}
+    await limiter.flush()
+    assert sum(store.counters.values()) == 2
+
+
+async def test_window_rollover_keeps_unflushed_hits(clock: _Clock) -> None:
+    """Неотправленные попадания окна отправляются в его ключ после смены окна."""
+    store = _FakeRedis()
+    limiter = _limiter(store, limit=10)
+    await _hits(limiter, 3)
+
+    clock.now += 3_600
+    await limiter.hit(_ROUTE, "1")
+    await limiter.flush()
+    assert store.counters == {
+        f"{_KEY}:{_WINDOW}": 3,
+        f"{_KEY}:{_WINDOW + 1}": 1,
+    }
+    await limiter.flush()
+    assert list(limiter._buckets) == [(f"{_ROUTE}|1", _WINDOW + 1)]
+
+
+async def test_previous_window_limits_burst_at_boundary(clock: _Clock) -> None:
+    """Лимит, исчерпанный в конце окна, не восстанавливается сразу в новом."""
+    store = _FakeRedis()
+    limiter = _limiter(store, limit=10)
+    clock.now += 3_600 * 0.99
+    assert await _hits(limiter, 11) == [True] * 10 + [False]
+
+    clock.now += 3_600 * 0.02
+    assert await _hits(limiter, 2) == [False, False]
+    # Середина окна: 11 запросов предыдущего окна, включая отклонённый при
+    # сверке, весят 5.5, и после первого запроса окна остаётся место на 3.
+    clock.now += 3_600 * 0.49
+    assert await _hits(limiter, 4) == [True] * 3 + [False]
+    assert store.counters == {
+        f"{_KEY}:{_WINDOW}": 11,
+        f"{_KEY}:{_WINDOW + 1}": 5,
+    }
+
+
+async def test_local_allowance_is_shared_between_workers(clock: _Clock) -> None:
+    """Без сверки процесс пропускает только свою долю запаса до порога."""
+    store = _FakeRedis()
+    limiter = _limiter(store, limit=100, workers=4)
+    # После первой сверки запас до порога 50 — 49 запросов, доля процесса — 12.
+    await _hits(limiter, 13)
+    assert store.counters == {f"{_KEY}:{_WINDOW}": 1}
+    await _hits(limiter, 1)
+    assert store.counters == {f"{_KEY}:{_WINDOW}": 14}
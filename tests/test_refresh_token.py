@@ -0,0 +1,106 @@
+"""Тесты ротации токена обновления (`application.use_cases.refresh_token`)."""
+
+from datetime import timedelta
+
+import pytest
+
+from application.dtos.auth import RefreshSessionDTO
+from application.exceptions import (
+    InvalidCredentialsError,
+    SessionStoreUnavailableError,
+)
+from application.services import JWTKeyring, TokenService
+from application.use_cases.refresh_token import RefreshTokenUseCase
+
+
+class _FakeSessions:
+    """Заглушка хранилища сессий в памяти."""
+
+    def __init__(self, *, fail_create: bool = False) -> None:
+        self.sessions: dict[str, RefreshSessionDTO] = {}
+        self.generation = 0
+        self.fail_create = fail_create
+
+    async def create(
+        self, token_hash: str, session: RefreshSessionDTO, *, ttl: int
+    ) -> bool:
+        if self.fail_create:
+            raise SessionStoreUnavailableError("Хранилище сессий недоступно")
+        if session.generation not in (None, self.generation):
+            return False
+        self.sessions[token_hash] = RefreshSessionDTO(
+            user_id=session.user_id,
+            email=session.email,
+            generation=self.generation,
+        )
+        return True
+
+    async def consume(self, token_hash: str) -> RefreshSessionDTO | None:
+        return self.sessions.pop(token_hash, None)
+
+    async def revoke_user(self, user_id: int) -> int:
+        self.generation += 1
+        revoked, self.sessions = len(self.sessions), {}
+        return revoked
+
+
+class _RevokingSessions(_FakeSessions):
+    """Хранилище, в котором отзыв происходит между `consume` и `create`."""
+
+    async def consume(self, token_hash: str) -> RefreshSessionDTO | None:
+        session = await super().consume(token_hash)
+        await self.revoke_user(7)
+        return session
+
+
+_TOKENS = TokenService(
+    keyring=JWTKeyring.from_secret("секрет-для-тестов", "HS256"),
+    expires_delta=timedelta(minutes=5),
+)
+
+
+def _use_case(sessions: _FakeSessions) -> RefreshTokenUseCase:
+    """Создаёт сценарий поверх заглушки хранилища."""
+    return RefreshTokenUseCase(
+        sessions=sessions, token_service=_TOKENS, refresh_ttl=60
+    )
+
+
+def _login(sessions: _FakeSessions) -> str:
+    """Регистрирует сессию и возвращает её токен обновления."""
+    token, token_hash = _TOKENS.create_refresh_token()
+    sessions.sessions[token_hash] = RefreshSessionDTO(
+        user_id=7, email="a@b.c", generation=sessions.generation
+    )
+    return token
+
+
+async def test_refresh_rotates_token() -> None:
+    """Токен обновления одноразовый и заменяется новым."""
+    sessions = _FakeSessions()
+    token = _login(sessions)
+    result = await _use_case(sessions)(token)
+    assert result.refresh_token is not None
+    assert list(sessions.sessions) == [
+        _TOKENS.hash_refresh_token(result.refresh_token)
+    ]
+    with pytest.raises(InvalidCredentialsError):
+        await _use_case(sessions)(token)
+
+
+async def test_failed_create_is_not_hidden() -> None:
+    """Если новую сессию не сохранить, клиент получает ошибку хранилища."""
+    sessions = _FakeSessions()
+    token = _login(sessions)
+    sessions.fail_create = True
+    with pytest.raises(SessionStoreUnavailableError):
+        await _use_case(sessions)(token)
+
+
+async def test_revocation_during_rotation_wins() -> None:
+    """Отзыв между погашением и сохранением сессии не даёт новый токен."""
+    sessions = _RevokingSessions()
+    token = _login(sessions)
+    with pytest.raises(InvalidCredentialsError):
+        await _use_case(sessions)(token)
+    assert sessions.sessions == {}
@@ -0,0 +1,103 @@
+"""Тесты отзыва сессий пользователя (`infra.cache.session_store`)."""
+
+from typing import Any, cast
+
+import pytest
+import redis.asyncio as redis
+
+from application.dtos.auth import RefreshSessionDTO
+from application.exceptions import SessionStoreUnavailableError
+from infra.cache.session_store import RedisSessionStore
+
+
+class _Script:
+    """Заглушка Lua-скрипта: запоминает переданные ключи и аргументы."""
+
+    def __init__(self, store: "_FakeRedis", name: str) -> None:
+        self._store = store
+        self._name = name
+
+    async def __call__(self, *, keys: list[str], args: list[Any]) -> int:
+        self._store.calls.append((self._name, keys, args))
+        return 1 if self._name == "create" else len(args)
+
+
+class _FakeRedis:
+    """Заглушка Redis с множествами сессий в памяти."""
+
+    def __init__(self, *, error: bool = False) -> None:
+        self.sets: dict[str, set[str]] = {}
+        self.calls: list[tuple[str, list[str], list[Any]]] = []
+        self.error = error
+
+    def register_script(self, script: str) -> _Script:
+        return _Script(self, "revoke" if "INCR" in script else "create")
+
+    async def smembers(self, key: str) -> set[str]:
+        if self.error:
+            raise redis.ConnectionError("соединение потеряно")
+        return self.sets.get(key, set())
+
+    async def getdel(self, key: str) -> str | None:
+        if self.error:
+            raise redis.ConnectionError("соединение потеряно")
+        return None
+
+
+def _store(client: _FakeRedis) -> RedisSessionStore:
+    """Создаёт хранилище сессий поверх заглушки Redis."""
+    return RedisSessionStore(
+        client=cast("redis.Redis", client),  # type: ignore[type-arg]
+        prefix="p:",
+    )
+
+
+async def test_revoke_user_passes_session_keys_via_keys() -> None:
+    """Скрипт получает множество, поколение и ключи всех сессий в `KEYS`."""
+    client = _FakeRedis()
+    client.sets["p:sessions:user:7"] = {"a", "b"}
+    assert await _store(client).revoke_user(7) == 2
+    [(name, keys, args)] = client.calls
+    assert name == "revoke"
+    assert keys[:2] == ["p:sessions:user:7", "p:sessions:generation:7"]
+    assert keys[2:] == [f"p:session:{token_hash}" for token_hash in args]
+    assert sorted(args) == ["a", "b"]
+
+
+async def test_revoke_user_without_sessions_bumps_generation() -> None:
+    """Без сессий скрипт всё равно вызывается, чтобы сменить поколение."""
+    client = _FakeRedis()
+    assert await _store(client).revoke_user(7) == 0
+    assert client.calls == [
+        ("revoke", ["p:sessions:user:7", "p:sessions:generation:7"], [])
+    ]
+
+
+@pytest.mark.parametrize(("generation", "expected"), [(None, ""), (3, "3")])
+async def test_create_checks_generation(
+    generation: int | None, expected: str
+) -> None:
+    """Ротация передаёт ожидаемое поколение, новый вход — пустую строку."""
+    client = _FakeRedis()
+    session = RefreshSessionDTO(user_id=7, email="a@b.c", generation=generation)
+    assert await _store(client).create("h", session, ttl=60)
+    [(name, keys, args)] = client.calls
+    assert name == "create"
+    assert keys == [
+        "p:session:h",
+        "p:sessions:user:7",
+        "p:sessions:generation:7",
+    ]
+    assert args[2:] == ["h", expected]
+
+
+async def test_revoke_user_maps_redis_errors() -> None:
+    """Ошибка Redis не выдаётся за успешный отзыв."""
+    with pytest.raises(SessionStoreUnavailableError):
+        await _store(_FakeRedis(error=True)).revoke_user(7)
+
+
+async def test_consume_maps_redis_errors() -> None:
+    """Ошибка Redis при чтении сессии не выдаётся за неизвестный токен."""
+    with pytest.raises(SessionStoreUnavailableError):
+        await _store(_FakeRedis(error=True)).consume("a")
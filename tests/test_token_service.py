@@ -0,0 +1,271 @@
+"""Тесты выпуска и проверки JWT (`application.services.security.TokenService`)."""
+
+import json
+import time
+from collections.abc import Callable
+from datetime import timedelta
+from typing import Any
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+
+from application.exceptions import InvalidCredentialsError
+from application.services import JWTKeyring, TokenService
+from application.services.jwt_keys import (
+    EdDSAKey,
+    ES256Key,
+    HMACKey,
+    JWTKey,
+    b64url_decode,
+    b64url_encode,
+)
+
+_SECRET = "секрет-для-тестов"
+
+
+def _es256_key(kid: str = "es-1") -> ES256Key:
+    """Создаёт ключ ES256 с приватной частью."""
+    private_key = ec.generate_private_key(ec.SECP256R1())
+    return ES256Key(
+        kid=kid, public_key=private_key.public_key(), private_key=private_key
+    )
+
+
+def _eddsa_key(kid: str = "ed-1") -> EdDSAKey:
+    """Создаёт ключ Ed25519 с приватной частью."""
+    private_key = ed25519.Ed25519PrivateKey.generate()
+    return EdDSAKey(
+        kid=kid, public_key=private_key.public_key(), private_key=private_key
+    )
+
+
+def _service(
+    keyring: JWTKeyring | None = None, cache_size: int = 10_000
+) -> TokenService:
+    """Создаёт сервис с общим HMAC-секретом по умолчанию."""
+    return TokenService(
+        keyring=keyring or JWTKeyring.from_secret(_SECRET, "HS256"),
+        expires_delta=timedelta(minutes=5),
+        cache_size=cache_size,
+    )
+
+
+def _segment(value: dict[str, Any]) -> str:
+    """Кодирует заголовок или содержимое токена."""
+    return b64url_encode(json.dumps(value).encode())
+
+
+def _forge(
+    key: JWTKey | None,
+    header: dict[str, Any],
+    payload: dict[str, Any] | None = None,
+) -> str:
+    """Собирает токен с произвольными заголовком и содержимым."""
+    if payload is None:
+        payload = {"sub": "1", "email": "a@b.c", "exp": 4_000_000_000}
+    signing_input = f"{_segment(header)}.{_segment(payload)}"
+    signature = key.sign(signing_input.encode()) if key is not None else b""
+    return f"{signing_input}.{b64url_encode(signature)}"
+
+
+def _hs256() -> HMACKey:
+    """Ключ, совпадающий с ключом сервиса по умолчанию."""
+    return HMACKey(kid=None, algorithm="HS256", secret=_SECRET.encode())
+
+
+@pytest.mark.parametrize("make_key", [_es256_key, _eddsa_key])
+def test_round_trip_asymmetric(make_key: Callable[[], JWTKey]) -> None:
+    """Токен, подписанный активным ключом, проходит проверку."""
+    key = make_key()
+    service = _service(JWTKeyring(keys={key.kid: key}, active_kid=key.kid))
+    token = service.create_access_token(user_id=7, email="a@b.c").access_token
+    header = json.loads(b64url_decode(token.split(".")[0]))
+    assert header == {"alg": key.algorithm, "typ": "JWT", "kid": key.kid}
+    data = service.decode_token(token)
+    assert (data.user_id, data.email) == (7, "a@b.c")
+
+
+def test_round_trip_hmac_without_kid() -> None:
+    """Токен общего секрета не содержит `kid` и проходит проверку."""
+    service = _service()
+    token = service.create_access_token(user_id=3, email="a@b.c").access_token
+    assert "kid" not in json.loads(b64url_decode(token.split(".")[0]))
+    assert service.decode_token(token).user_id == 3
+
+
+@pytest.mark.parametrize(
+    "header",
+    [
+        {"alg": "none", "typ": "JWT"},
+        {"alg": "HS512", "typ": "JWT"},
+        {"typ": "JWT"},
+        {"alg": "HS256", "crit": ["exp"]},
+    ],
+)
+def test_header_algorithm_must_match_key(header: dict[str, Any]) -> None:
+    """Алгоритм закреплён за ключом: `none` и чужой `alg` отклоняются."""
+    with pytest.raises(InvalidCredentialsError):
+        _service().decode_token(_forge(_hs256(), header))
+
+
+def test_alg_none_without_signature_is_rejected() -> None:
+    """Неподписанный токен (`alg: none`, пустая подпись) отклоняется."""
+    with pytest.raises(InvalidCredentialsError):
+        _service().decode_token(_forge(None, {"alg": "none"}))
+
+
+def test_public_key_cannot_be_used_as_hmac_secret() -> None:
+    """Токен HS256 с `kid` асимметричного ключа не принимается."""
+    key = _es256_key()
+    public_der = key.public_key.public_bytes(
+        encoding=serialization.Encoding.DER,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    forged = _forge(
+        HMACKey(kid=key.kid, algorithm="HS256", secret=public_der),
+        {"alg": "HS256", "kid": key.kid},
+    )
+    service = _service(JWTKeyring(keys={key.kid: key}, active_kid=key.kid))
+    with pytest.raises(InvalidCredentialsError):
+        service.decode_token(forged)
+
+
+@pytest.mark.parametrize("kid", ["unknown", None, ["es-1"]])
+def test_unknown_or_mismatched_kid_is_rejected(kid: Any) -> None:
+    """Токен с неизвестным или чужим `kid` отклоняется."""
+    signer, other = _es256_key("es-1"), _es256_key("es-2")
+    service = _service(JWTKeyring(keys={"es-2": other}, active_kid="es-2"))
+    with pytest.raises(InvalidCredentialsError):
+        service.decode_token(_forge(signer, {"alg": "ES256", "kid": kid}))
+
+
+def test_signature_of_other_key_with_same_kid_is_rejected() -> None:
+    """Подпись другим ключом с тем же `kid` не проходит проверку."""
+    trusted, attacker = _eddsa_key(), _eddsa_key()
+    service = _service(
+        JWTKeyring(keys={trusted.kid: trusted}, active_kid=trusted.kid)
+    )
+    with pytest.raises(InvalidCredentialsError):
+        service.decode_token(
+            _forge(attacker, {"alg": "EdDSA", "kid": attacker.kid})
+        )
+
+
+def test_tampered_payload_is_rejected() -> None:
+    """Изменение содержимого при сохранённой подписи обнаруживается."""
+    service = _service()
+    header, _, signature = service.create_access_token(
+        user_id=1, email="a@b.c"
+    ).access_token.split(".")
+    payload = _segment({"sub": "2", "email": "a@b.c", "exp": 4_000_000_000})
+    with pytest.raises(InvalidCredentialsError):
+        service.decode_token(f"{header}.{payload}.{signature}")
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda token: token + "!",
+        lambda token: token + "==",
+        lambda token: token + "A",
+        lambda token: token.replace(".", "..", 1),
+        lambda token: token + ".extra",
+        lambda token: token.rpartition(".")[0],
+        lambda token: token.replace(".", "․"),
+        lambda token: "ё" + token,
+        lambda token: "",
+        lambda token: "...",
+    ],
+)
+def test_malformed_tokens_are_rejected(mutate: Callable[[str], str]) -> None:
+    """Искажённые сегменты, мусор и не-ASCII символы отклоняются."""
+    service = _service()
+    token = service.create_access_token(user_id=1, email="a@b.c").access_token
+    with pytest.raises(InvalidCredentialsError):
+        service.decode_token(mutate(token))
+
+
+@pytest.mark.parametrize(
+    ("header", "payload"),
+    [
+        (["alg", "HS256"], {"sub": "1", "exp": 4_000_000_000}),
+        ({"alg": "HS256"}, ["sub", "1"]),
+        ({"alg": "HS256"}, {"sub": "1"}),
+        ({"alg": "HS256"}, {"sub": "1", "exp": "4000000000"}),
+        ({"alg": "HS256"}, {"sub": "1", "exp": True}),
+        ({"alg": "HS256"}, {"sub": "1", "exp": float("inf")}),
+        ({"alg": "HS256"}, {"sub": "1", "exp": 4_000_000_000, "nbf": "0"}),
+        ({"alg": "HS256"}, {"exp": 4_000_000_000}),
+        ({"alg": "HS256"}, {"sub": "не число", "exp": 4_000_000_000}),
+    ],
+)
+def test_invalid_signed_content_is_rejected(header: Any, payload: Any) -> None:
+    """Подписанный, но некорректный по структуре токен отклоняется."""
+    signing_input = (
+        f"{b64url_encode(json.dumps(header).encode())}."
+        f"{b64url_encode(json.dumps(payload).encode())}"
+    )
+    signature = _hs256().sign(signing_input.encode())
+    with pytest.raises(InvalidCredentialsError):
+        _service().decode_token(f"{signing_input}.{b64url_encode(signature)}")
+
+
+def test_expired_and_not_yet_valid_tokens_are_rejected() -> None:
+    """Проверяются `exp` и `nbf`."""
+    service = _service()
+    expired = _forge(_hs256(), {"alg": "HS256"}, {"sub": "1", "exp": 1})
+    early = _forge(
+        _hs256(),
+        {"alg": "HS256"},
+        {"sub": "1", "exp": 4_000_000_000, "nbf": 3_999_999_999},
+    )
+    for token in (expired, early):
+        with pytest.raises(InvalidCredentialsError):
+            service.decode_token(token)
+
+
+def test_cache_never_returns_expired_token(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Закешированный токен перестаёт приниматься после `exp`."""
+    now = 1_800_000_000.0
+    monkeypatch.setattr(time, "time", lambda: now)
+    service = _service()
+    token = _forge(_hs256(), {"alg": "HS256"}, {"sub": "1", "exp": now + 60})
+    assert service.decode_token(token).user_id == 1
+    assert token in service._verified
+
+    now += 60
+    with pytest.raises(InvalidCredentialsError):
+        service.decode_token(token)
+    assert token not in service._verified
+
+
+def test_cache_is_bounded_and_can_be_disabled() -> None:
+    """Кеш вытесняет самые старые токены; `cache_size=0` его отключает."""
+    service = _service(cache_size=2)
+    tokens = [
+        service.create_access_token(user_id=user_id, email="a@b.c").access_token
+        for user_id in range(3)
+    ]
+    for token in tokens:
+        service.decode_token(token)
+    assert list(service._verified) == tokens[1:]
+
+    uncached = _service(cache_size=0)
+    uncached.decode_token(tokens[0])
+    assert not uncached._verified
+
+
+@pytest.mark.parametrize("data", ["", "QQ", "QUI", "QUJD", "-_-_"])
+def test_b64url_round_trip(data: str) -> None:
+    """Корректный base64url без выравнивания декодируется обратно."""
+    assert b64url_encode(b64url_decode(data)) == data
+
+
+@pytest.mark.parametrize("data", ["QUJD=", "QU+D", "QU/D", "Q", "QU JD", "ЁЁ"])
+def test_b64url_decode_is_strict(data: str) -> None:
+    """Символы вне алфавита base64url и неверная длина отклоняются."""
+    with pytest.raises(ValueError):
+        b64url_decode(data)